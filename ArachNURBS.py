@@ -28,10 +28,24 @@ import math
 import FreeCAD
 import numpy as np
 import Part
-from FreeCAD import Base, Gui
+from FreeCAD import Base
+
+import Silk_background
+import Silk_debounce
+import Silk_lod
+import Silk_log
+import Silk_preview
+
+# one logger per subsystem. silent below the level set in Preferences/Mod/Silk, see Silk_log.py
+log_kernel = Silk_log.getLogger("kernel")
+log_migration = Silk_log.getLogger("migration")
+log_pose = Silk_log.getLogger("pose")
+log_poly = Silk_log.getLogger("poly")
+log_grid = Silk_log.getLogger("grid")
+log_star = Silk_log.getLogger("star")
 
 # test message to verify load and reloads
-print("importing ArachNURBS")
+log_kernel.info("importing ArachNURBS")
 
 
 #
@@ -84,7 +98,7 @@ def VectorIndex(list, vector):
         if equalVectors(list[i], vector, default_tol):
             result = i
     if result == "noIndex":
-        print("VectorIndex: no match found at default tolerance (.000001)")
+        log_kernel.warning("VectorIndex: no match found at default tolerance (.000001)")
     return result
 
 
@@ -161,14 +175,14 @@ def polyFromLineSet(lines, tol):  # build a control polygon from a list of line
     # print("twos, ", twos)
 
     if ones != 0 and ones != 2:
-        print(
+        log_kernel.warning(
             "the input line set does not have two clear ends, and does not form a loop at\n \
             the given tolerance. no single path can be formed into a control polygon"
         )
         return
 
     if ones + twos != mults.__len__():
-        print(
+        log_kernel.warning(
             "some points in the input line set appear to be shared by more than 2 lines \n \
         at the given tolerance. no single path can be formed into a control polygon"
         )
@@ -326,6 +340,100 @@ def drawGrid(poles, columns):
     return legs
 
 
+# columns of the control net of each grid class, as passed to drawGrid(). polys are a single row
+net_columns = {
+    "ControlGrid44_4": 4,
+    "ControlGrid44_3": 4,
+    "ControlGrid44_3_Rotate": 4,
+    "ControlGrid44_flow": 4,
+    "ControlGrid44_EdgeSegment": 4,
+    "ControlGrid44_2EdgeSegments": 4,
+    "ControlGrid66_4": 6,
+    "ControlGrid66_4Sub": 6,
+    "ControlGrid64_4": 6,
+    "ControlGrid64_2Grid44": 6,
+    "ControlGrid64_3_1Grid44": 6,
+    "ControlGrid64_normal": 6,
+    "ControlGrid64_Surf44": 6,
+    "SubGrid33_2Grid64": 3,
+    "CubicSurface44_4Sketch": 4,
+}
+
+
+def netColumns(fp, Poles=None):
+    if Poles is None:
+        Poles = fp.Poles
+    # grids whose layout follows their input (ControlGrid_Offset) store it in a Columns property
+    return net_columns.get(type(fp.Proxy).__name__, getattr(fp, "Columns", len(Poles)))
+
+
+def controlNetIndex(nbPoles, columns):
+    # coin line index of the legs drawGrid() would build: rows first, then columns, each leg ended by -1
+    rows = int(nbPoles / columns)
+    index = []
+    for i in range(0, rows):
+        for j in range(0, columns - 1):
+            index += [i * columns + j, i * columns + j + 1, -1]
+    for i in range(0, columns):
+        for j in range(0, rows - 1):
+            index += [j * columns + i, j * columns + columns + i, -1]
+    return index
+
+
+def drawnFromPoles(fp):
+    # True when the Silk control net view provider draws this poly or grid from its Poles (see Silk_viewproviders.py)
+    return FreeCAD.GuiUp and fp.ViewObject is not None and type(fp.ViewObject.Proxy).__name__ == "ViewProviderControlNet"
+
+
+def controlNetShape(fp, Legs, Poles):
+    # Shape of a poly or grid. objects drawn from their Poles build no edges: their Shape is one vertex per pole,
+    # VertexN being Poles[N-1], so picked poles and getSubObject("VertexN") (SilkPose) still resolve
+    if drawnFromPoles(fp):
+        return Part.Compound([Part.Vertex(p) for p in Poles])
+    return Part.Shape(Legs)
+
+
+def netDeferred(fp):
+    # Legs of polys and grids are only for display. a hidden object skips them in execute()
+    # and showNet() builds them when it is shown. Poles, Weights and the Shape, which SilkPose reads vertices from,
+    # are always written. a Shape made of the legs (older view provider) is only deferred when nothing reads it
+    if not hasattr(fp, "Visibility") or fp.Visibility:
+        return False
+    return drawnFromPoles(fp) or not fp.InList
+
+
+def showNet(fp):
+    # called from onChanged() on "Visibility". legs follow the same rows / columns as controlNetIndex()
+    if not fp.Visibility or "Restore" in fp.State or not hasattr(fp, "Poles") or not fp.Poles:
+        return
+    touched = "Touched" in fp.State
+    fp.Legs = drawGrid(fp.Poles, netColumns(fp))
+    fp.Shape = controlNetShape(fp, fp.Legs, fp.Poles)
+    if not touched:
+        # display only: this does not make the object or anything downstream of it out of date
+        fp.purgeTouched()
+
+
+def commitNet(fp, Poles, Weights=None):
+    # output pass of the poly and grid execute(). the outputs are staged in locals and written once each here,
+    # the display is built from the staged poles, never read back from the properties just written
+    if netDeferred(fp):
+        Legs = None  # hidden: see showNet()
+    else:
+        Legs = drawGrid(Poles, netColumns(fp, Poles))
+    if Legs is not None or drawnFromPoles(fp):
+        Shape = controlNetShape(fp, Legs, Poles)
+    else:
+        Shape = None
+    fp.Poles = Poles
+    if Weights is not None:
+        fp.Weights = Weights
+    if Legs is not None:
+        fp.Legs = Legs
+    if Shape is not None:
+        fp.Shape = Shape
+
+
 def orient_a_to_b(polesa, polesb, tol):  # polesa and polesb are lists of poles that share one endpoint.
     # if needed, this function reorders a so that a.end = b.start or b.end. b is never modified
 
@@ -342,10 +450,228 @@ def orient_a_to_b(polesa, polesb, tol):  # polesa and polesb are lists of poles
         # curve 1 is reversed
         return polesa[::-1]
     else:
-        print("curves do not share endpoints at the current tolerance")
+        log_kernel.warning("curves do not share endpoints at the current tolerance")
         return 0
 
 
+def poly4From3L(sketch, tol):  # poles of a sketch containing 3 lines connected end to end (ControlPoly4_3L)
+    # .Shape.Edges instead of .Geometry allows other objects that are not sketches (clones, shape binders, raw wires ..)
+    # and gives the points in world coordinates
+    edges = sketch.Shape.Edges
+    lineset = [[edges[i].Vertexes[0].Point, edges[i].Vertexes[1].Point] for i in range(0, 3)]
+    return polyFromLineSet(lineset, tol)[0:4]
+
+
+def poly4FromFirstElement(sketch):  # poles and weights of the first sketch element, as a cubic (ControlPoly4_FirstElement)
+    # line below getting first element from shape worked for 10 years, but became unreliable in FreeCAD 1.x
+    # ElemNurbs=sketch.Shape.Edges[-1].toNurbs().Edge1.Curve
+    # now working with the "Geometry" attribute of the sketch, hoping that the element display in sketch editor
+    # matches the object ordering
+    ElemNurbs = sketch.Geometry[0].toNurbs()
+    ElemNurbs.increaseDegree(3)
+    # the "Sketch.Geometry" version loses world placement
+    mat = sketch.Placement.toMatrix()
+    return [mat.multiply(ElemNurbs.getPole(i)) for i in range(1, 5)], ElemNurbs.getWeights()
+
+
+def grid44FromPolys(polys, tol):  # polys = 4 x [poles, weights] going around the grid. the ControlGrid44_4 construction
+    # returns [Poles, Weights], or a message if two consecutive polys do not share an endpoint
+    poles1, poles2, poles3, poles4 = [poly[0] for poly in polys]
+    weights1, weights2, weights3, weights4 = [poly[1] for poly in polys]
+
+    quad12 = orient_a_to_b(poles1, poles2, tol)
+    quad23 = orient_a_to_b(poles2, poles3, tol)
+    quad34 = orient_a_to_b(poles3, poles4, tol)
+    quad41 = orient_a_to_b(poles4, poles1, tol)
+
+    if quad12 == 0:
+        return "first and second selected polys do not share endpoints at the current tolerance"
+    if quad23 == 0:
+        return "second and third selected polys do not share endpoints at the current tolerance"
+    if quad34 == 0:
+        return "third and fourth selected polys do not share endpoints at the current tolerance"
+    if quad41 == 0:
+        return "first and fourth selected polys do not share endpoints at the current tolerance"
+    if quad12[0] != poles1[0] and quad12[0] == poles1[-1]:
+        weights1 = weights1[::-1]
+    if quad23[0] != poles2[0] and quad23[0] == poles2[-1]:
+        weights2 = weights2[::-1]
+    if quad34[0] != poles3[0] and quad34[0] == poles3[-1]:
+        weights3 = weights3[::-1]
+    if quad41[0] != poles4[0] and quad41[0] == poles4[-1]:
+        weights4 = weights4[::-1]
+    p00 = quad12[0]
+    p01 = quad12[1]
+    p02 = quad12[2]
+    p03 = quad12[3]
+    p13 = quad23[1]
+    p23 = quad23[2]
+    p33 = quad23[3]
+    p32 = quad34[1]
+    p31 = quad34[2]
+    p30 = quad34[3]
+    p20 = quad41[1]
+    p10 = quad41[2]
+    p11 = p00 + (p01 - p00) + (p10 - p00)
+    p12 = p03 + (p02 - p03) + (p13 - p03)
+    p21 = p30 + (p31 - p30) + (p20 - p30)
+    p22 = p33 + (p23 - p33) + (p32 - p33)
+    Poles = [p00, p01, p02, p03, p10, p11, p12, p13, p20, p21, p22, p23, p30, p31, p32, p33]
+    w00 = weights1[0]
+    w01 = weights1[1]
+    w02 = weights1[2]
+    w03 = weights1[3]
+    w13 = weights2[1]
+    w23 = weights2[2]
+    w33 = weights2[3]
+    w32 = weights3[1]
+    w31 = weights3[2]
+    w30 = weights3[3]
+    w20 = weights4[1]
+    w10 = weights4[2]
+    w11 = w01 * w10
+    w12 = w02 * w13
+    w21 = w20 * w31
+    w22 = w23 * w32
+    Weights = [w00, w01, w02, w03, w10, w11, w12, w13, w20, w21, w22, w23, w30, w31, w32, w33]
+    return [Poles, Weights]
+
+
+def poly4FromSketch(sketch, tol):  # [poles, weights] of a single sketch, read the way the ControlPoly4 command does
+    # cached as a whole, see sketchRead()
+    if len(sketch.Shape.Edges) == 3:
+        return [poly4From3L(sketch, tol), [1.0, 1.0, 1.0, 1.0]]
+    poles, weights = poly4FromFirstElement(sketch)
+    return [poles, weights]
+
+
+def node4FromSketch(sketch, tol):  # [center, line end] of a ControlPoly4_2N node sketch (one line, one circle), in world
+    # returns a message if the line does not start on the circle center
+    geometry = sketch.Geometry[0:2]
+    for g in geometry:
+        if g.__class__ == Part.Circle:
+            cir = g
+        if g.__class__ == Part.LineSegment:
+            lin = g
+    center = cir.Center
+    if equalVectors(lin.StartPoint, center, tol):
+        end = lin.EndPoint
+    elif equalVectors(lin.EndPoint, center, tol):
+        end = lin.StartPoint
+    else:
+        return "no point on the line connects to the circle center at the current tolerance"
+    # to world
+    mat = sketch.Placement.toMatrix()
+    return [mat.multiply(center), mat.multiply(end)]
+
+
+def node6FromSketch(sketch, tol):  # [center, inner, outer] of a ControlPoly6_2N node sketch (2 lines, one circle), in world
+    # returns a message if the lines do not chain from the circle center
+    geometry = sketch.Geometry[0:3]
+    # find the circle
+    for i in range(3):
+        if geometry[i].__class__ == Part.Circle:
+            cir = geometry[i]
+            lin1, lin2 = [geometry[j] for j in range(3) if j != i]
+    # to world
+    mat = sketch.Placement.toMatrix()
+    p0 = mat.multiply(cir.Center)
+    lin10 = mat.multiply(lin1.StartPoint)
+    lin11 = mat.multiply(lin1.EndPoint)
+    lin20 = mat.multiply(lin2.StartPoint)
+    lin21 = mat.multiply(lin2.EndPoint)
+    if equalVectors(p0, lin10, tol):
+        p1 = lin11
+        other = [lin20, lin21]
+    elif equalVectors(p0, lin11, tol):
+        p1 = lin10
+        other = [lin20, lin21]
+    elif equalVectors(p0, lin20, tol):
+        p1 = lin21
+        other = [lin10, lin11]
+    elif equalVectors(p0, lin21, tol):
+        p1 = lin20
+        other = [lin10, lin11]
+    else:
+        return "no connection found between the circle center and a line endpoint at the current tolerance"
+    if equalVectors(p1, other[0], tol):
+        p2 = other[1]
+    elif equalVectors(p1, other[1], tol):
+        p2 = other[0]
+    else:
+        return "no connection found between the two lines at the current tolerance"
+    return [p0, p1, p2]
+
+
+def poly6FromFirstElement(sketch):  # poles and weights of the first sketch element, as a 6 pole cubic (ControlPoly6_FirstElement)
+    ElemNurbs = sketch.Shape.Edges[0].toNurbs().Edge1.Curve
+    ElemNurbs.increaseDegree(3)
+    start = ElemNurbs.FirstParameter
+    end = ElemNurbs.LastParameter
+    knot1 = start + (end - start) / 3.0
+    knot2 = end - (end - start) / 3.0
+    ElemNurbs.insertKnot(knot1)
+    ElemNurbs.insertKnot(knot2)
+    return [ElemNurbs.getPole(i) for i in range(1, 7)], ElemNurbs.getWeights()
+
+
+## sketch extraction cache. the readers above (poly4From3L(), node4FromSketch() ...) walk the sketch geometry and
+## apply its placement. sketchRead() keeps their result per sketch, reader and arguments while the sketch is not
+## recomputed: several polys reading the same sketch, or a poly recomputed on its own, share one parse.
+## the content key is the hash of the sketch Shape, which every recompute of the sketch replaces, and its placement.
+## objects that are not sketches (no Geometry) are always read.
+_sketch_cache = {}  # (document Uid, sketch name, reader name, args) -> (content key, result)
+
+
+def evictClosed(cache):  # drops the entries of closed documents and deleted objects, cache keyed (document Uid, object name, ...)
+    documents = dict((doc.Uid, doc) for doc in FreeCAD.listDocuments().values())
+    for key in [key for key in cache if key[0] not in documents or documents[key[0]].getObject(key[1]) is None]:
+        del cache[key]
+
+
+def sketchContentKey(sketch):  # cheap values that change whenever the geometry read from a sketch can change
+    return (sketch.Shape.hashCode(), tuple(sketch.Placement.toMatrix().A))
+
+
+def copySketchResult(result):  # readers return nested lists of vectors and floats. callers get their own copy
+    if isinstance(result, (list, tuple)):
+        return type(result)(copySketchResult(item) for item in result)
+    if isinstance(result, Base.Vector):
+        return Base.Vector(result)
+    return result
+
+
+def sketchRead(sketch, reader, *args):  # reader(sketch, *args), from the cache while the sketch content is unchanged
+    if not hasattr(sketch, "Geometry"):
+        return reader(sketch, *args)
+    evictClosed(_sketch_cache)
+    key = (sketch.Document.Uid, sketch.Name, reader.__name__, args)
+    content = sketchContentKey(sketch)
+    cached = _sketch_cache.get(key)
+    if cached is None or cached[0] != content:
+        cached = (content, reader(sketch, *args))
+        _sketch_cache[key] = cached
+    else:
+        log_poly.debug(sketch.Label, ": ", reader.__name__, " from cache")
+    return copySketchResult(cached[1])
+
+
+def pointPosition(point, index=0):  # position of a Point_onCurve, or of point 'index' of a PointArray_onCurve
+    if hasattr(point, "Positions"):
+        return point.Positions[index]
+    return point.Position
+
+
+def pointParameter(point, index, NL_Curve, curve):  # parameter on 'curve' (the Shape.Curve of NL_Curve) of a point object
+    # a point built on the same curve knows its parameter. any other point is projected
+    if getattr(point, "NL_Curve", None) == NL_Curve:
+        if hasattr(point, "Parameters"):
+            return point.Parameters[index]
+        if hasattr(point, "Parameter"):
+            return point.Parameter
+    return curve.parameter(pointPosition(point, index))
+
+
 def Cubic_Bezier_ddu(pole0, pole1):  # cubic derivative at curve start (pole1) based on first
     # two poles (no curve required). Weights not included yet
     P0 = Base.Vector(pole0)
@@ -518,6 +844,703 @@ def NURBS_Cubic_64_surf(grid_64):  # given a 6 x 4 control grid, build the cubic
     return NURBS_Cubic_64_surf
 
 
+## pure data form of the legacy builders above. poles travel as [[(x,y,z),w],...] so the inputs of a
+## curve/surface build can be gathered on the main thread, and built on a worker thread or process
+## (see Silk_scheduler.py). the builder is referenced by name so the whole package stays picklable.
+shape_builders = {
+    "Bezier_Cubic_curve": Bezier_Cubic_curve,
+    "NURBS_Cubic_6P_curve": NURBS_Cubic_6P_curve,
+    "Bezier_Bicubic_surf": Bezier_Bicubic_surf,
+    "NURBS_Cubic_66_surf": NURBS_Cubic_66_surf,
+    "NURBS_Cubic_64_surf": NURBS_Cubic_64_surf,
+}
+
+
+def weightedPolesToData(WeightedPoles):  # [[Base.Vector, w],...] -> [[(x,y,z), w],...]
+    return [[(p[0][0], p[0][1], p[0][2]), float(p[1])] for p in WeightedPoles]
+
+
+def buildShapeFromData(data):  # data = {"builder": name in shape_builders, "WeightedPoles": [[(x,y,z), w],...]}
+    WeightedPoles = [[Base.Vector(p[0][0], p[0][1], p[0][2]), p[1]] for p in data["WeightedPoles"]]
+    return shape_builders[data["builder"]](WeightedPoles).toShape()
+
+
+## numpy evaluation of Silk curves and surfaces, without going through OCC.
+## Silk only uses a few fixed cubic knot templates, keyed here by number of poles.
+## Basis matrices for a set of parameters are computed once and cached, after that evaluating
+## any curve / surface of the same template on the same samples is a couple of matrix products.
+knot_templates = {
+    4: [0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0],
+    6: [0.0, 0.0, 0.0, 0.0, 1.0 / 3.0, 2.0 / 3.0, 1.0, 1.0, 1.0, 1.0],
+}
+
+# pole counts of the legacy builders: (nPoles,) for curves, (nNodes_u, nNodes_v) for surfaces
+shape_layouts = {
+    "Bezier_Cubic_curve": (4,),
+    "NURBS_Cubic_6P_curve": (6,),
+    "Bezier_Bicubic_surf": (4, 4),
+    "NURBS_Cubic_66_surf": (6, 6),
+    "NURBS_Cubic_64_surf": (6, 4),
+}
+
+_basis_cache = {}
+
+
+def bsplineBasis(knots, degree, params, derivatives=0):  # returns array [derivative order, param, pole]
+    # vectorized Cox - de Boor recursion, derivatives from the lower degree functions
+    knots = np.asarray(knots, dtype=float)
+    u = np.asarray(params, dtype=float)
+    nSpans = len(knots) - 1
+    # degree 0: half open spans, except the last non empty span which includes its end
+    N = [np.zeros((len(u), nSpans))]
+    last = max(i for i in range(nSpans) if knots[i] < knots[i + 1])
+    for i in range(nSpans):
+        if knots[i] < knots[i + 1]:
+            inside = (u >= knots[i]) & (u < knots[i + 1])
+            if i == last:
+                inside |= u == knots[i + 1]
+            N[0][:, i] = inside
+    for p in range(1, degree + 1):
+        Np = np.zeros((len(u), nSpans - p))
+        for i in range(nSpans - p):
+            d0 = knots[i + p] - knots[i]
+            d1 = knots[i + p + 1] - knots[i + 1]
+            if d0 > 0.0:
+                Np[:, i] += (u - knots[i]) / d0 * N[p - 1][:, i]
+            if d1 > 0.0:
+                Np[:, i] += (knots[i + p + 1] - u) / d1 * N[p - 1][:, i + 1]
+        N.append(Np)
+
+    def derivative(p, d):  # d-th derivative of the degree p functions
+        if d == 0:
+            return N[p]
+        lower = derivative(p - 1, d - 1)
+        D = np.zeros((len(u), nSpans - p))
+        for i in range(nSpans - p):
+            d0 = knots[i + p] - knots[i]
+            d1 = knots[i + p + 1] - knots[i + 1]
+            if d0 > 0.0:
+                D[:, i] += p / d0 * lower[:, i]
+            if d1 > 0.0:
+                D[:, i] -= p / d1 * lower[:, i + 1]
+        return D
+
+    return np.array([derivative(degree, d) for d in range(derivatives + 1)])
+
+
+def basisMatrix(nPoles, params, derivatives=0):  # basis of a Silk cubic template at arbitrary params (not cached)
+    return bsplineBasis(knot_templates[nPoles], 3, params, derivatives)
+
+
+def cachedBasis(nPoles, samples, derivatives=0):  # basis at 'samples' evenly spaced params over [0,1], cached
+    key = (nPoles, samples, derivatives)
+    if key not in _basis_cache:
+        _basis_cache[key] = basisMatrix(nPoles, np.linspace(0.0, 1.0, samples), derivatives)
+    return _basis_cache[key]
+
+
+def curveArrays(poles, weights):  # list of vectors / floats -> (n,3), (n,)
+    return np.array([[p[0], p[1], p[2]] for p in poles], dtype=float), np.array(weights, dtype=float)
+
+
+def surfaceArrays(poles, weights, nu, nv):
+    # flat Silk grid list (u runs fastest, as fed to setPole(ii + 1, jj + 1)) -> [u index, v index] arrays
+    P = np.array([[p[0], p[1], p[2]] for p in poles], dtype=float).reshape(nv, nu, 3).transpose(1, 0, 2)
+    W = np.array(weights, dtype=float).reshape(nv, nu).T
+    return P, W
+
+
+def evaluateCurve(P, W, B):
+    # rational curve and its derivatives. B = basis[derivative order, param, pole]
+    # returns [C, C', C'', ...] up to the order available in B, each (params, 3)
+    A = np.einsum("dmi,i,ik->dmk", B, W, P)
+    w = B @ W
+    C = [A[0] / w[0][:, None]]
+    for d in range(1, len(B)):
+        # Leibniz rule on A = w C
+        term = A[d].copy()
+        for k in range(1, d + 1):
+            term -= math.comb(d, k) * w[k][:, None] * C[d - k]
+        C.append(term / w[0][:, None])
+    return C
+
+
+def evaluateSurface(P, W, Bu, Bv):
+    # rational surface and its partial derivatives on the grid Bu x Bv, up to the orders available.
+    # returns {(i, j): array (u params, v params, 3)} for the derivative d^(i+j) S / du^i dv^j
+    # P, W may hold a stack of patches of the same layout, (patches, nu, nv, 3) and (patches, nu, nv): all are
+    # evaluated in one pass, and the arrays returned are (patches, u params, v params, 3)
+    A = np.einsum("iam,...mn,...mnk,jbn->ij...abk", Bu, W, P, Bv)
+    w = np.einsum("iam,...mn,jbn->ij...ab", Bu, W, Bv)
+    S = {}
+    for i in range(len(Bu)):
+        for j in range(len(Bv)):
+            if i + j > max(len(Bu), len(Bv)) - 1:
+                continue
+            term = A[i, j].copy()
+            for k in range(i + 1):
+                for l in range(j + 1):
+                    if k == 0 and l == 0:
+                        continue
+                    term -= math.comb(i, k) * math.comb(j, l) * w[k, l][..., None] * S[(i - k, j - l)]
+            S[(i, j)] = term / w[0, 0][..., None]
+    return S
+
+
+def evaluateData(data, samples, derivatives=0):
+    # evaluate the pure data form of a curve / surface (see buildShapeFromData) on evenly spaced samples
+    layout = shape_layouts[data["builder"]]
+    poles = [p[0] for p in data["WeightedPoles"]]
+    weights = [p[1] for p in data["WeightedPoles"]]
+    if len(layout) == 1:
+        P, W = curveArrays(poles, weights)
+        return evaluateCurve(P, W, cachedBasis(layout[0], samples, derivatives))
+    P, W = surfaceArrays(poles, weights, layout[0], layout[1])
+    return evaluateSurface(P, W, cachedBasis(layout[0], samples, derivatives), cachedBasis(layout[1], samples, derivatives))
+
+
+def curveData(obj):  # pure data form of a Silk curve object (CubicCurve_4 / 6), None for any other curve
+    proxy = getattr(obj, "Proxy", None)
+    if hasattr(proxy, "gatherInputs") and hasattr(proxy, "commitOutputs"):
+        data = proxy.gatherInputs(obj)
+        if len(shape_layouts[data["builder"]]) == 1:
+            return data
+    return None
+
+
+def polyCurveData(obj):  # pure data form of a Silk curve, or of the cubic a 4 or 6 pole poly stands for (blend polys ...)
+    data = curveData(obj)
+    if data is None and hasattr(obj, "Poles") and hasattr(obj, "Weights") and len(obj.Poles) in knot_templates:
+        builder = {4: "Bezier_Cubic_curve", 6: "NURBS_Cubic_6P_curve"}[len(obj.Poles)]
+        data = {"builder": builder, "WeightedPoles": weightedPolesToData(list(zip(obj.Poles, obj.Weights)))}
+    return data
+
+
+def curveCurvature(data, samples):  # signed curvature and its derivative along a curve, on evenly spaced samples
+    # the sign is taken in the best fit plane of the poles, so that a comb stays on one side while the curve is edited.
+    # returns points, in-plane normals (left of the tangent), curvature and dC/ds, each over the samples
+    P, W = curveArrays([p[0] for p in data["WeightedPoles"]], [p[1] for p in data["WeightedPoles"]])
+    c0, c1, c2, c3 = evaluateCurve(P, W, cachedBasis(len(W), samples, 3))
+    reference = np.linalg.svd(P - P.mean(axis=0))[2][-1]
+    orientation = np.cross(P[1] - P[0], P[-1] - P[0]) @ reference
+    if orientation < 0.0:
+        reference = -reference
+    speed = np.linalg.norm(c1, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = (np.cross(c1, c2) @ reference) / speed**3
+        dk_dw = (np.cross(c1, c3) @ reference) / speed**3 - 3.0 * (np.cross(c1, c2) @ reference) * np.einsum("ik,ik->i", c1, c2) / speed**5
+        normal = np.cross(reference, c1 / speed[:, None])
+    return c0, np.nan_to_num(normal), np.nan_to_num(k), np.nan_to_num(dk_dw / speed)
+
+
+def curvePoints(obj, params):  # positions of a curve object at a list of params, as an (n, 3) array
+    # Silk curves are evaluated from their poles in one pass, other curves point by point through OCC
+    data = curveData(obj)
+    if data is None:
+        curve = obj.Shape.Curve
+        return np.array([[v.x, v.y, v.z] for v in [curve.value(u) for u in params]], dtype=float).reshape(-1, 3)
+    P, W = curveArrays([p[0] for p in data["WeightedPoles"]], [p[1] for p in data["WeightedPoles"]])
+    return evaluateCurve(P, W, basisMatrix(len(W), params))[0]
+
+
+def bezierBlossom(Pw, t1, t2, t3):  # blossom of a homogeneous cubic bezier Pw (4, 4) at param arrays t1, t2, t3
+    R = Pw[None]
+    for t in [t1, t2, t3]:
+        t = np.asarray(t, dtype=float)[:, None, None]
+        R = (1.0 - t) * R[:, :-1] + t * R[:, 1:]
+    return R[:, 0]
+
+
+def bezierPieces(P, W, cuts):  # exact pieces of a rational cubic bezier between consecutive params of 'cuts'
+    # the homogeneous poles of the piece [a, b] are the blossoms f(a,a,a), f(a,a,b), f(a,b,b), f(b,b,b).
+    # returns poles (pieces, 4, 3) and weights (pieces, 4)
+    Pw = np.concatenate([P * W[:, None], W[:, None]], axis=1)
+    a = np.asarray(cuts[:-1], dtype=float)
+    b = np.asarray(cuts[1:], dtype=float)
+    Q = np.stack([bezierBlossom(Pw, a, a, a), bezierBlossom(Pw, a, a, b), bezierBlossom(Pw, a, b, b), bezierBlossom(Pw, b, b, b)], axis=1)
+    return Q[..., :3] / Q[..., 3:], Q[..., 3]
+
+
+def curvePieces(obj, cuts):  # [[poles, weights],...] of the cubic pieces of a curve object between consecutive cuts
+    # Silk bezier curves are cut in one pass, any other curve piece by piece through OCC.
+    # returns a message string if a piece is not a single cubic span (a CubicCurve_6 piece across a knot)
+    data = curveData(obj)
+    if data is not None and len(data["WeightedPoles"]) == 4:
+        P, W = curveArrays([p[0] for p in data["WeightedPoles"]], [p[1] for p in data["WeightedPoles"]])
+        poles, weights = bezierPieces(P, W, cuts)
+        return [[[Base.Vector(*p) for p in poles_k], weights_k.tolist()] for poles_k, weights_k in zip(poles.tolist(), weights)]
+    pieces = []
+    for a, b in zip(cuts[:-1], cuts[1:]):
+        curve = obj.Shape.Curve.copy()
+        curve.segment(a, b)
+        if curve.NbPoles != 4:
+            return "the piece from " + str(round(a, 4)) + " to " + str(round(b, 4)) + " crosses a knot of the curve, and is not a ControlPoly4"
+        pieces.append([curve.getPoles(), curve.getWeights()])
+    return pieces
+
+
+## arc length of Silk curves. cumulative lengths are tabulated at the breakpoints of each knot span, split in
+## arc_length_subdivisions pieces, each integrated with Gauss - Legendre. a length is mapped back to a parameter by
+## table lookup, then Newton steps on the exact length from the nearest breakpoint.
+## tables are cached per curve object, and only rebuilt when the poles of the curve change. the tables of deleted
+## curves and closed documents are dropped, see evictClosed().
+arc_length_subdivisions = 16
+arc_length_iterations = 4
+_gauss_x, _gauss_w = np.polynomial.legendre.leggauss(5)
+_arc_length_cache = {}  # (document Uid, object name) -> (WeightedPoles the table was built from, table)
+
+
+def curveSpeeds(P, W, params):  # |C'(u)| at params
+    return np.linalg.norm(evaluateCurve(P, W, basisMatrix(len(W), params, 1))[1], axis=-1)
+
+
+def gaussLength(P, W, a, b):  # curve length between params a and b, element wise
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    u = (a + b)[..., None] / 2.0 + (b - a)[..., None] / 2.0 * _gauss_x
+    speeds = curveSpeeds(P, W, u.ravel()).reshape(u.shape)
+    return (b - a) / 2.0 * (speeds @ _gauss_w)
+
+
+def arcLengthTable(data):  # (breakpoint params, cumulative lengths) of the pure data form of a curve
+    P, W = curveArrays([p[0] for p in data["WeightedPoles"]], [p[1] for p in data["WeightedPoles"]])
+    knots = np.unique(knot_templates[len(W)])
+    t = np.unique(np.concatenate([np.linspace(k0, k1, arc_length_subdivisions + 1) for k0, k1 in zip(knots[:-1], knots[1:])]))
+    s = np.concatenate([[0.0], np.cumsum(gaussLength(P, W, t[:-1], t[1:]))])
+    return t, s
+
+
+def curveArcLength(obj):  # (data, arc length table) of a Silk curve object. (None, None) for any other curve
+    data = curveData(obj)
+    if data is None:
+        return None, None
+    evictClosed(_arc_length_cache)
+    key = (obj.Document.Uid, obj.Name)
+    cached = _arc_length_cache.get(key)
+    if cached is None or cached[0] != data["WeightedPoles"]:
+        cached = (data["WeightedPoles"], arcLengthTable(data))
+        _arc_length_cache[key] = cached
+        log_kernel.debug(obj.Label, ": arc length table rebuilt")
+    return data, cached[1]
+
+
+def arcLengthParameters(obj, fractions):  # curve params at fractions (0.0 - 1.0) of the length of a curve object
+    fractions = np.clip(np.asarray(fractions, dtype=float), 0.0, 1.0)
+    data, table = curveArcLength(obj)
+    if data is None:
+        curve = obj.Shape.Curve
+        length = curve.length()
+        return np.array([curve.parameterAtDistance(f * length, curve.FirstParameter) for f in fractions], dtype=float)
+    t, s = table
+    P, W = curveArrays([p[0] for p in data["WeightedPoles"]], [p[1] for p in data["WeightedPoles"]])
+    target = fractions * s[-1]
+    i = np.clip(np.searchsorted(s, target, side="right") - 1, 0, len(t) - 2)
+    a, b = t[i], t[i + 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        u = np.where(s[i + 1] > s[i], a + (b - a) * (target - s[i]) / (s[i + 1] - s[i]), a)
+        for iteration in range(arc_length_iterations):
+            error = s[i] + gaussLength(P, W, a, u) - target
+            speeds = curveSpeeds(P, W, u)
+            u = np.clip(np.where(speeds > 0.0, u - error / speeds, u), a, b)
+    return u
+
+
+def surfaceCurvatures(S):
+    # Gaussian, mean and principal curvatures from the derivatives of evaluateSurface() (second order needed).
+    # NaN where the surface is degenerate (collapsed grid edges)
+    Su, Sv = S[(1, 0)], S[(0, 1)]
+    normal = np.cross(Su, Sv)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normal = normal / np.linalg.norm(normal, axis=-1)[..., None]
+        E = np.einsum("...k,...k", Su, Su)
+        F = np.einsum("...k,...k", Su, Sv)
+        G = np.einsum("...k,...k", Sv, Sv)
+        L = np.einsum("...k,...k", S[(2, 0)], normal)
+        M = np.einsum("...k,...k", S[(1, 1)], normal)
+        N = np.einsum("...k,...k", S[(0, 2)], normal)
+        det = E * G - F * F
+        gaussian = (L * N - M * M) / det
+        mean = (E * N - 2.0 * F * M + G * L) / (2.0 * det)
+        root = np.sqrt(np.maximum(mean * mean - gaussian, 0.0))
+    return {"gaussian": gaussian, "mean": mean, "k1": mean + root, "k2": mean - root, "normal": normal}
+
+
+## Sampled surface analyses (isophotes ...)
+## The positions and normals of a Silk surface on a sample grid are kept in _normal_cache until its poles change,
+## so an analysis only changing its light or its levels does not evaluate the surface again.
+## only the latest sample count is kept per surface, and deleted surfaces and closed documents are dropped.
+
+_normal_cache = {}  # (document Uid, object name) -> (datas the grids were built from, samples, [(points, normals), ...])
+
+
+def surfaceNormals(obj, samples):  # [(points, unit normals), ...] of each patch of a Silk surface, arrays (u, v, 3)
+    datas = Silk_lod.surfaceDatas(obj)
+    evictClosed(_normal_cache)
+    key = (obj.Document.Uid, obj.Name)
+    cached = _normal_cache.get(key)
+    if cached is None or cached[0] != datas or cached[1] != samples:
+        grids = []
+        for data in datas:
+            S = evaluateData(data, samples, 1)
+            normal = np.cross(S[(1, 0)], S[(0, 1)])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                normal = normal / np.linalg.norm(normal, axis=-1)[..., None]
+            grids.append((S[(0, 0)], normal))
+        cached = (datas, samples, grids)
+        _normal_cache[key] = cached
+        log_kernel.debug(obj.Label, ": sampled normals rebuilt")
+    return cached[2]
+
+
+def marchingSquares(f, points, level):
+    # contour lines of a sampled field f (u samples, v samples) at 'level', through the sample points (u, v, 3).
+    # crossings are interpolated linearly along the grid edges, saddle cells are split by the value at their center.
+    # NaN samples (collapsed grid edges) cut the lines. returns a list of (n, 3) arrays, closed lines repeat their start
+    nu, nv = f.shape
+    d = f - level
+    above = d > 0.0
+    valid = np.isfinite(d)
+    # edges (i, j)-(i + 1, j) are numbered first, then edges (i, j)-(i, j + 1)
+    crossed_u = (above[:-1, :] != above[1:, :]) & valid[:-1, :] & valid[1:, :]
+    crossed_v = (above[:, :-1] != above[:, 1:]) & valid[:, :-1] & valid[:, 1:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_u = np.where(crossed_u, d[:-1, :] / (d[:-1, :] - d[1:, :]), 0.0)
+        t_v = np.where(crossed_v, d[:, :-1] / (d[:, :-1] - d[:, 1:]), 0.0)
+    crossed = np.concatenate([crossed_u.ravel(), crossed_v.ravel()])
+    crossing = np.concatenate(
+        [
+            (points[:-1, :] + t_u[..., None] * (points[1:, :] - points[:-1, :])).reshape(-1, 3),
+            (points[:, :-1] + t_v[..., None] * (points[:, 1:] - points[:, :-1])).reshape(-1, 3),
+        ]
+    )
+    ids_u = np.arange((nu - 1) * nv).reshape(nu - 1, nv)
+    ids_v = (nu - 1) * nv + np.arange(nu * (nv - 1)).reshape(nu, nv - 1)
+    # the 4 edges around cell (i, j): v = j, u = i + 1, v = j + 1, u = i
+    ring = np.stack([ids_u[:, :-1], ids_v[1:, :], ids_u[:, 1:], ids_v[:-1, :]], axis=-1).reshape(-1, 4)
+    hits = crossed[ring]
+    count = hits.sum(axis=1)
+    # 2 crossings: one segment
+    first_two = np.argsort(~hits[count == 2], axis=1, kind="stable")[:, :2]
+    segments = [np.take_along_axis(ring[count == 2], first_two, axis=1)]
+    # 4 crossings: a saddle. when corner (i, j) is on the side of the center, it is joined to (i + 1, j + 1) through it,
+    # and the segments cut off the other two corners
+    four = ring[count == 4]
+    center = 0.25 * (d[:-1, :-1] + d[1:, :-1] + d[1:, 1:] + d[:-1, 1:]).ravel()[count == 4]
+    joined = ((center > 0.0) == above[:-1, :-1].ravel()[count == 4])[:, None]
+    segments.append(np.where(joined, four[:, [0, 1]], four[:, [3, 0]]))
+    segments.append(np.where(joined, four[:, [2, 3]], four[:, [1, 2]]))
+
+    # chain the segments. every crossing is shared by at most 2 cells, so the lines never branch
+    links = {}
+    for a, b in np.concatenate(segments).tolist():
+        links.setdefault(a, []).append(b)
+        links.setdefault(b, []).append(a)
+    unvisited = set(links)
+    lines = []
+    # open lines from one of their ends first, the closed ones are left over
+    for start in [e for e in links if len(links[e]) == 1] + list(links):
+        if start not in unvisited:
+            continue
+        line = [start]
+        unvisited.discard(start)
+        following = links[start]
+        while following:
+            current = following[0]
+            line.append(current)
+            unvisited.discard(current)
+            following = [e for e in links[current] if e in unvisited]
+        if len(line) > 2 and start in links[line[-1]]:
+            line.append(start)
+        lines.append(crossing[line])
+    return lines
+
+
+def isophoteLevels(bands):  # angles between normal and light, in degrees, separating 'bands' stripes over 0 - 90
+    return [90.0 * i / bands for i in range(1, bands)]
+
+
+def isophoteField(normals, light):  # angle between the normals and the light direction, in degrees. side independent
+    return np.degrees(np.arccos(np.clip(np.abs(normals @ light), 0.0, 1.0)))
+
+
+## Approximate offset grids
+## The offset of a rational cubic is not a rational cubic. offsetGridArrays() fits one of the same layout, keeping the
+## weights of the source, so that the fit is linear in the poles: on every sample, the rational basis of the source
+## weights times the poles must give the offset point. Corners are exact, border rows are fitted from their border
+## only, then the inner poles from all the samples. Two surfaces sharing a border with the same normals along it
+## therefore get the same offset border.
+
+
+def fitRationalPoles(R, Q, fixed):
+    # least squares poles from the rational basis R (samples, poles) and the target points Q (samples, 3).
+    # fixed: {pole index: point} of the poles kept as they are
+    poles = np.zeros((R.shape[1], 3))
+    for i, point in fixed.items():
+        poles[i] = point
+    free = [i for i in range(R.shape[1]) if i not in fixed]
+    if free:
+        poles[free] = np.linalg.lstsq(R[:, free], Q - R @ poles, rcond=None)[0]
+    return poles
+
+
+def offsetGridArrays(P, W, distance, samples):
+    # poles (u, v, 3) approximating the offset of the surface P, W by 'distance' along Su x Sv, for the weights W,
+    # and the largest distance between the fit and the offset at the same params, checked between the samples too
+    nu, nv = W.shape
+    dense = 2 * samples - 1
+    Bu, Bv = cachedBasis(nu, dense, 1), cachedBasis(nv, dense, 1)
+    S = evaluateSurface(P, W, Bu, Bv)
+    normal = np.cross(S[(1, 0)], S[(0, 1)])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normal = normal / np.linalg.norm(normal, axis=-1)[..., None]
+    target = S[(0, 0)] + distance * normal
+    valid = np.all(np.isfinite(target), axis=-1)  # no normal on collapsed grid edges
+
+    # fitted on every other sample
+    Nu, Nv, T, ok = Bu[0][::2], Bv[0][::2], target[::2, ::2], valid[::2, ::2]
+    poles = np.zeros((nu, nv, 3))
+    corners = {}
+    for i, j in [(0, 0), (nu - 1, 0), (nu - 1, nv - 1), (0, nv - 1)]:
+        a, b = (0 if i == 0 else -1), (0 if j == 0 else -1)
+        if ok[a, b]:
+            corners[(i, j)] = T[a, b]
+    for j, b in [(0, 0), (nv - 1, -1)]:  # borders along u
+        R = Nu * W[:, j] / (Nu @ W[:, j])[:, None]
+        fixed = {i: corners[(i, j)] for i in [0, nu - 1] if (i, j) in corners}
+        poles[:, j] = fitRationalPoles(R[ok[:, b]], T[:, b][ok[:, b]], fixed)
+    for i, a in [(0, 0), (nu - 1, -1)]:  # borders along v
+        R = Nv * W[i, :] / (Nv @ W[i, :])[:, None]
+        fixed = {j: corners[(i, j)] for j in [0, nv - 1] if (i, j) in corners}
+        poles[i, :] = fitRationalPoles(R[ok[a, :]], T[a, :][ok[a, :]], fixed)
+    # inner poles. R[(a, b), (i, j)] = Nu[a, i] Nv[b, j] W[i, j] / w(a, b)
+    R = np.einsum("ai,ij,bj->abij", Nu, W, Nv)
+    R = (R / R.sum(axis=(2, 3))[..., None, None]).reshape(samples * samples, nu * nv)
+    border = np.zeros((nu, nv), dtype=bool)
+    border[[0, -1], :] = True
+    border[:, [0, -1]] = True
+    flat = poles.reshape(-1, 3)
+    fixed = {k: flat[k] for k in np.flatnonzero(border.ravel()).tolist()}
+    poles = fitRationalPoles(R[ok.ravel()], T.reshape(-1, 3)[ok.ravel()], fixed).reshape(nu, nv, 3)
+
+    fit = evaluateSurface(poles, W, Bu[:1], Bv[:1])[(0, 0)]
+    error = np.linalg.norm(fit - target, axis=-1)[valid]
+    return poles, float(error.max()) if len(error) else 0.0
+
+
+## GridArray: a control grid held as one (rows, columns, 4) array of [x, y, z, w].
+## Rows and columns are those of the Poles / Weights lists of the grid objects: flat index = row * columns + column,
+## so u runs along a row and v across the rows (see the notes above paramsSurface44BorderSegmentCurve()).
+## reversedU(), reversedV(), transposed() and rotated() return views on the same array: reordering a grid
+## copies nothing, the poles are only copied when they are read out with poles(), weights() or data().
+
+
+class GridArray:
+    def __init__(self, array):
+        self.array = array
+
+    @classmethod
+    def fromLists(cls, poles, weights, columns):
+        array = np.empty((len(poles), 4))
+        array[:, :3] = [[p[0], p[1], p[2]] for p in poles]
+        array[:, 3] = weights
+        return cls(array.reshape(-1, columns, 4))
+
+    @classmethod
+    def fromGrid(cls, obj, columns=None):  # obj: any Silk grid object (Poles, Weights)
+        poles = obj.Poles
+        if columns is None:
+            columns = netColumns(obj, poles)
+        return cls.fromLists(poles, obj.Weights, columns)
+
+    @classmethod
+    def fromBlocks(cls, blocks):  # [[GridArray, ...], ...] rows of sub grids -> one grid
+        return cls(np.concatenate([np.concatenate([block.array for block in row], axis=1) for row in blocks], axis=0))
+
+    @classmethod
+    def fromSurface(cls, surface):  # Part.BSplineSurface. getPoles() is [u][v], the grid is [v][u]
+        poles = np.array([[[p[0], p[1], p[2]] for p in column] for column in surface.getPoles()], dtype=float)
+        array = np.empty(poles.shape[:2] + (4,))
+        array[..., :3] = poles
+        array[..., 3] = surface.getWeights()
+        return cls(array.transpose(1, 0, 2))
+
+    @property
+    def rows(self):
+        return self.array.shape[0]
+
+    @property
+    def columns(self):
+        return self.array.shape[1]
+
+    def reversedU(self):  # each row read backwards
+        return GridArray(self.array[:, ::-1])
+
+    def reversedV(self):  # rows in reverse order
+        return GridArray(self.array[::-1])
+
+    def transposed(self):  # diagonal flip, rows become columns
+        return GridArray(self.array.transpose(1, 0, 2))
+
+    def rotated(self, turns=1):  # quarter turns, same sense as numpy.rot90 on the list of rows
+        return GridArray(np.rot90(self.array, turns))
+
+    def pole(self, row, column):
+        return Base.Vector(*self.array[row, column, :3].tolist())
+
+    def weight(self, row, column):
+        return float(self.array[row, column, 3])
+
+    def rowPoles(self, row):
+        return [Base.Vector(*p) for p in self.array[row, :, :3].tolist()]
+
+    def rowWeights(self, row):
+        return self.array[row, :, 3].tolist()
+
+    def corners(self):  # going around the grid: Poles[0], Poles[columns - 1], Poles[-1], Poles[-columns]
+        return [self.pole(0, 0), self.pole(0, -1), self.pole(-1, -1), self.pole(-1, 0)]
+
+    def borders(self):  # edge pole rows going around the grid. border k runs from corner k to corner k + 1
+        return [self.rowPoles(0), self.transposed().rowPoles(-1), self.rowPoles(-1)[::-1], self.transposed().rowPoles(0)[::-1]]
+
+    def poles(self):
+        return [Base.Vector(*p) for p in self.array[..., :3].reshape(-1, 3).tolist()]
+
+    def weights(self):
+        return self.array[..., 3].ravel().tolist()
+
+    def data(self, builder):  # pure data form, see buildShapeFromData()
+        return {"builder": builder, "WeightedPoles": [[tuple(p[:3]), p[3]] for p in self.array.reshape(-1, 4).tolist()]}
+
+
+## topology resolver: which Silk grids share corners and edges, document wide.
+## PointHash snaps points to cubic cells of the tolerance size. two points within tolerance of each other are in
+## the same or in neighbouring cells, so finding the matches of a point is a lookup of 27 cells instead of a scan.
+## TopologyResolver indexes the corners and border pole rows of the grids it is given (see gridTopology()),
+## and keeps the links between grids up to date as grids are updated: re-indexing a grid only touches its own
+## entries and those of the grids it touches. commonCorners() and sharedEdges() are then dictionary lookups.
+## corners and borders are numbered as GridArray.corners() and GridArray.borders(): going around the grid.
+## resolvers are keyed by the Uid of their document, so a new document reusing a name starts from scratch. the
+## resolvers of closed documents, and the grids deleted from a document, are dropped on the next topology() call.
+_topologies = {}  # (document Uid, tolerance) -> TopologyResolver
+
+
+class PointHash:
+    def __init__(self, tol):
+        self.cell = max(tol, 1.0e-12)
+        self.tol = tol
+        self.cells = {}  # cell -> [[point, label], ...]
+        self.labels = {}  # label -> cells holding it
+
+    def key(self, point):
+        return (math.floor(point[0] / self.cell), math.floor(point[1] / self.cell), math.floor(point[2] / self.cell))
+
+    def add(self, point, label):
+        point = (float(point[0]), float(point[1]), float(point[2]))
+        key = self.key(point)
+        self.cells.setdefault(key, []).append([point, label])
+        self.labels.setdefault(label, []).append(key)
+
+    def remove(self, label):
+        for key in self.labels.pop(label, []):
+            self.cells[key] = [item for item in self.cells[key] if item[1] != label]
+            if not self.cells[key]:
+                del self.cells[key]
+
+    def find(self, point):  # labels of the points within tolerance of point
+        x, y, z = self.key(point)
+        found = []
+        for i in range(x - 1, x + 2):
+            for j in range(y - 1, y + 2):
+                for k in range(z - 1, z + 2):
+                    for other, label in self.cells.get((i, j, k), []):
+                        if math.dist(other, (point[0], point[1], point[2])) <= self.tol:
+                            found.append(label)
+        return found
+
+
+class TopologyResolver:
+    def __init__(self, tol):
+        self.tol = tol
+        self.corner_hash = PointHash(tol)  # corner -> (patch, corner index)
+        self.edge_hash = PointHash(tol)  # first pole of each border, both directions -> (patch, border index, reversed)
+        self.patches = {}  # patch -> (corners, borders) as indexed, plain tuples
+        self.corner_links = {}  # patch -> {other patch: [(corner, other corner), ...]}
+        self.edge_links = {}  # patch -> {other patch: [(border, other border, reversed), ...]}
+
+    def update(self, patch, corners, borders):  # (re)index a grid. nothing is done if it did not change
+        content = (tuple((p[0], p[1], p[2]) for p in corners), tuple(tuple((p[0], p[1], p[2]) for p in row) for row in borders))
+        if self.patches.get(patch) == content:
+            return
+        self.remove(patch)
+        self.patches[patch] = content
+        corners, borders = content
+        for i, corner in enumerate(corners):
+            for other, j in self.corner_hash.find(corner):
+                if other != patch:
+                    self.link(self.corner_links, patch, other, (i, j), (j, i))
+            self.corner_hash.add(corner, (patch, i))
+        for i, row in enumerate(borders):
+            for other, j, flipped in self.edge_hash.find(row[0]):
+                other_row = self.patches[other][1][j]
+                if flipped:
+                    other_row = other_row[::-1]
+                if other != patch and len(other_row) == len(row) and all(math.dist(a, b) <= self.tol for a, b in zip(row, other_row)):
+                    self.link(self.edge_links, patch, other, (i, j, flipped), (j, i, flipped))
+            self.edge_hash.add(row[0], (patch, i, False))
+            self.edge_hash.add(row[-1], (patch, i, True))
+
+    def link(self, links, patch, other, item, other_item):
+        links.setdefault(patch, {}).setdefault(other, []).append(item)
+        links.setdefault(other, {}).setdefault(patch, []).append(other_item)
+
+    def remove(self, patch):
+        if patch not in self.patches:
+            return
+        corners, borders = self.patches.pop(patch)
+        for i in range(len(corners)):
+            self.corner_hash.remove((patch, i))
+        for i in range(len(borders)):
+            self.edge_hash.remove((patch, i, False))
+            self.edge_hash.remove((patch, i, True))
+        for links in [self.corner_links, self.edge_links]:
+            for other in links.pop(patch, {}):
+                links[other].pop(patch, None)
+
+    def commonCorners(self, patch, other):  # [(corner of patch, corner of other), ...] at the same point
+        return list(self.corner_links.get(patch, {}).get(other, []))
+
+    def sharedEdges(self, patch, other):  # [(border of patch, border of other, reversed), ...] with the same poles
+        return list(self.edge_links.get(patch, {}).get(other, []))
+
+    def neighbours(self, patch):  # patches sharing at least a corner with patch
+        return sorted(set(self.corner_links.get(patch, {})) | set(self.edge_links.get(patch, {})))
+
+
+def topology(doc, tol):  # the topology resolver of a document, for a tolerance
+    open_documents = set(other.Uid for other in FreeCAD.listDocuments().values())
+    for key in [key for key in _topologies if key[0] not in open_documents]:
+        del _topologies[key]
+    key = (doc.Uid, tol)
+    if key not in _topologies:
+        _topologies[key] = TopologyResolver(tol)
+    resolver = _topologies[key]
+    for patch in [patch for patch in resolver.patches if doc.getObject(patch) is None]:
+        resolver.remove(patch)
+    return resolver
+
+
+# GridArray.corners() index -> index in the corner order Poles[0], Poles[columns - 1], Poles[-columns], Poles[-1]
+# used by the older grid tools. the mapping is its own inverse
+corner_diagonal_order = [0, 1, 3, 2]
+
+
+def gridTopology(obj, tol, columns=None):  # the topology resolver of the document of grid obj, with obj indexed
+    grid = GridArray.fromGrid(obj, columns)
+    resolver = topology(obj.Document, tol)
+    resolver.update(obj.Name, grid.corners(), grid.borders())
+    return resolver
+
+
 def isWeightVectorRational(weights, tol):
     isItTho = True
     # compare weights 1, 2, 3, to weight 0
@@ -591,10 +1614,10 @@ def blend_poly_2x4_1x6(poles_0, weights_0, poles_1, weights_1, scale_0, scale_1,
         # print("first (0) curve rationality status maintained at knot insertion:", weights_6_0_ratio)
         pass
     else:
-        print("first (0) curve rationality status lost at knot insertion\n")
-        print("was :", weights_0_ratio, weights_0)
-        print("is now :", weights_6_0_ratio, weights_6_0)
-        print("restoring endpoint weights to re-establish G0")
+        log_kernel.info("first (0) curve rationality status lost at knot insertion\n")
+        log_kernel.debug("was :", weights_0_ratio, weights_0)
+        log_kernel.debug("is now :", weights_6_0_ratio, weights_6_0)
+        log_kernel.info("restoring endpoint weights to re-establish G0")
         weights_6_0 = [
             weights_0[0],
             weights_0[0],
@@ -603,16 +1626,16 @@ def blend_poly_2x4_1x6(poles_0, weights_0, poles_1, weights_1, scale_0, scale_1,
             weights_0[3],
             weights_0[3],
         ]
-        print("final weights :", weights_6_0)
+        log_kernel.debug("final weights :", weights_6_0)
 
     if weights_1_ratio == weights_6_1_ratio:
         # print("second (1) curve rationality status maintained at knot insertion:", weights_6_1_ratio)
         pass
     else:
-        print("second (1) curve rationality status lost at knot insertion\n")
-        print("was :", weights_1_ratio, weights_1)
-        print("is now :", weights_6_1_ratio, weights_6_1)
-        print("restoring endpoint weights to re-establish G0")
+        log_kernel.info("second (1) curve rationality status lost at knot insertion\n")
+        log_kernel.debug("was :", weights_1_ratio, weights_1)
+        log_kernel.debug("is now :", weights_6_1_ratio, weights_6_1)
+        log_kernel.info("restoring endpoint weights to re-establish G0")
         weights_6_1 = [
             weights_1[0],
             weights_1[0],
@@ -621,7 +1644,7 @@ def blend_poly_2x4_1x6(poles_0, weights_0, poles_1, weights_1, scale_0, scale_1,
             weights_1[3],
             weights_1[3],
         ]
-        print("final weights :", weights_6_1)
+        log_kernel.debug("final weights :", weights_6_1)
 
     p0 = [poles_6_0[0], weights_6_0[0]]
     p1 = [poles_6_0[1], weights_6_0[1]]
@@ -729,15 +1752,15 @@ def Cubic_Bezier_dCds(pole0, pole1, pole2, pole3):
         if C0 != 0.0:
             if math.fabs((C0_seg - C0) / C0) > 5 * tol:
                 segment_degen = "true"
-                print("segmentation has collapsed the curve")
-                print("C0", C0, "C0_check", C0_seg)
-                print("Cubic_Bezier_dCds step ", loop_count)
+                log_kernel.warning("segmentation has collapsed the curve")
+                log_kernel.debug("C0", C0, "C0_check", C0_seg)
+                log_kernel.debug("Cubic_Bezier_dCds step ", loop_count)
         elif C0 == 0.0:
             if math.fabs((C0_seg - C0)) > 0.00001:
                 segment_degen = "true"
-                print("segmentation has collapsed the curve")
-                print("C0", C0, "C0_check", C0_seg)
-                print("Cubic_Bezier_dCds step ", loop_count)
+                log_kernel.warning("segmentation has collapsed the curve")
+                log_kernel.debug("C0", C0, "C0_check", C0_seg)
+                log_kernel.debug("Cubic_Bezier_dCds step ", loop_count)
 
         # calculate curvature at the end of the current segment
         Cs = Cubic_Bezier_curvature(Poles[3], Poles[2], Poles[1])
@@ -1114,7 +2137,7 @@ def blendFair_poly_2x4_1x6(poles_0, weights_0, poles_1, weights_1, scale_0, scal
     if math.fabs(dCds1) < 5.0e-6:
         dCds1 = 0.0
 
-    print("dCds targets: dCds0, ", dCds0, " dCds1, ", dCds1, " C0, ", C0, " C1, ", C1, "symmetric: ", symmetric)
+    log_kernel.debug("dCds targets: dCds0, ", dCds0, " dCds1, ", dCds1, " C0, ", C0, " C1, ", C1, "symmetric: ", symmetric)
 
     # convert 4P inputs to 6P
     CubicCurve6_0 = CubicCurve4_0
@@ -1153,7 +2176,7 @@ def blendFair_poly_2x4_1x6(poles_0, weights_0, poles_1, weights_1, scale_0, scal
 
     dCds6_1 = Cubic_6P_dCds(WeightedPoles_6_1[5], WeightedPoles_6_1[4], WeightedPoles_6_1[3], WeightedPoles_6_1[2], WeightedPoles_6_1[1], WeightedPoles_6_1[0])
 
-    print("dCds 6P check: dCds6_0, ", dCds6_0, " dCds6_1, ", dCds6_1)
+    log_kernel.debug("dCds 6P check: dCds6_0, ", dCds6_0, " dCds6_1, ", dCds6_1)
 
     # compile the blend poly. this initial form is G2, but clumped towards the outer points.
     p0 = [poles_6_0[0], weights_6_0[0]]
@@ -1248,7 +2271,7 @@ def blendFair_poly_2x4_1x6(poles_0, weights_0, poles_1, weights_1, scale_0, scal
 
         loop_count = loop_count + 1
     # G3 final message
-    print("final ", loop_count, ": ", "scl[", scale_1i, ", ", scale_2i, "] dCds[", dCds6_0i, ", ", dCds6_1i, "] err[", error_0, ", ", error_1, "]")
+    log_kernel.debug("final ", loop_count, ": ", "scl[", scale_1i, ", ", scale_2i, "] dCds[", dCds6_0i, ", ", dCds6_1i, "] err[", error_0, ", ", error_1, "]")
     return [poles, weights, scale_1i, scale_2i]
 
 
@@ -1314,9 +2337,9 @@ def isect_curve_surf(curve, surf):  # curve / surface intersection point
         if (test[3] * direction) > 0:  # is the projection coming from inside the surface?
             test_span = [test_span[0], test_u]  # > use first half of current span for the next search
         loop_count = loop_count + 1
-    print("step ", loop_count, "  u ", test_u, "  error ", test[2])
+    log_grid.debug("step ", loop_count, "  u ", test_u, "  error ", test[2])
     if error > tol:
-        print("no intersection found within ", tol)
+        log_grid.warning("no intersection found within ", tol)
         isect_curve_surf = "NONE"
     else:
         isect_curve_surf = [test[0], test_u, test[4]]
@@ -1369,11 +2392,11 @@ class SilkPose_PR:  # alternative to Attachment/MapMode for Placement - by posit
         latest_version = "0.03"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update == True:
@@ -1512,11 +2535,11 @@ class SilkPose_3P:  # alternative to Attachment/MapMode for Placement - by three
         latest_version = "0.03"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update == True:
@@ -1607,7 +2630,7 @@ class SilkPose_3P:  # alternative to Attachment/MapMode for Placement - by three
             X = -X
         yish = (Y_ref - origin_ref).normalize()
         if equalVectors(X, yish, default_tol):
-            print("SilkPose_3P: the three selected points are too close to forming a line. cannot determine orthogonal vectors. ")
+            log_pose.warning("SilkPose_3P: the three selected points are too close to forming a line. cannot determine orthogonal vectors. ")
             return
         Y = (yish - yish.dot(X) * X).normalize()
         if fp.flip_Y == True:
@@ -1667,11 +2690,11 @@ class ControlPoly4_3L:  # made from a single sketch containing 3 line objects co
         latest_version = "0.02"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update:
@@ -1730,56 +2753,22 @@ class ControlPoly4_3L:  # made from a single sketch containing 3 line objects co
         obj.recompute()
 
     def onChanged(self, fp, prop):
+        if prop == "Visibility":
+            showNet(fp)
         if prop == "reverse":
             fp.Weights = list(reversed(fp.Weights))
 
     def execute(self, fp):
         """Do something when doing a recomputation, this method is mandatory"""
         # get all points on first three lines...error check later
-
-        # # original method (pre 10/2025):
-        # p00s = fp.Sketch.Geometry[0].StartPoint
-        # p01s = fp.Sketch.Geometry[0].EndPoint
-        # p10s = fp.Sketch.Geometry[1].StartPoint
-        # p11s = fp.Sketch.Geometry[1].EndPoint
-        # p20s = fp.Sketch.Geometry[2].StartPoint
-        # p21s = fp.Sketch.Geometry[2].EndPoint
-        # # apply transform -> to world
-        # mat = fp.Sketch.Placement.toMatrix()
-        # p00 = mat.multiply(p00s)
-        # p01 = mat.multiply(p01s)
-        # p10 = mat.multiply(p10s)
-        # p11 = mat.multiply(p11s)
-        # p20 = mat.multiply(p20s)
-        # p21 = mat.multiply(p21s)
-
-        # new approach (post 10/2025):
-        # - use .Shape.Edges[0].Vertexes[0].Point instead of .Geometry[0].StartPoint to allow
-        #   other objects that are not sketches (clones, shape binders, raw wires ..)
-        p00 = fp.Sketch.Shape.Edges[0].Vertexes[0].Point
-        p01 = fp.Sketch.Shape.Edges[0].Vertexes[1].Point
-        p10 = fp.Sketch.Shape.Edges[1].Vertexes[0].Point
-        p11 = fp.Sketch.Shape.Edges[1].Vertexes[1].Point
-        p20 = fp.Sketch.Shape.Edges[2].Vertexes[0].Point
-        p21 = fp.Sketch.Shape.Edges[2].Vertexes[1].Point
-
-        lineset = [[p00, p01], [p10, p11], [p20, p21]]
-        poles = polyFromLineSet(lineset, fp.tolerance)
-        # print ("poles", poles)
+        poles = sketchRead(fp.Sketch, poly4From3L, fp.tolerance)
 
         if fp.reverse == False:
-            fp.Poles = [poles[0], poles[1], poles[2], poles[3]]
+            Poles = [poles[0], poles[1], poles[2], poles[3]]
         else:
-            fp.Poles = [poles[3], poles[2], poles[1], poles[0]]
+            Poles = [poles[3], poles[2], poles[1], poles[0]]
 
-        # prepare the lines to draw the polyline
-        Leg0 = Part.LineSegment(fp.Poles[0], fp.Poles[1])
-        Leg1 = Part.LineSegment(fp.Poles[1], fp.Poles[2])
-        Leg2 = Part.LineSegment(fp.Poles[2], fp.Poles[3])
-        # set the polygon legs property
-        fp.Legs = [Leg0, Leg1, Leg2]
-        # define the shape for visualization
-        fp.Shape = Part.Shape(fp.Legs)
+        commitNet(fp, Poles)
 
 
 class ControlPoly4_2N:  # made from 2 node sketches. each node sketch contains one line (tangent),
@@ -1847,11 +2836,11 @@ class ControlPoly4_2N:  # made from 2 node sketches. each node sketch contains o
         latest_version = "0.02"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update:
@@ -1917,70 +2906,28 @@ class ControlPoly4_2N:  # made from 2 node sketches. each node sketch contains o
         obj.recompute()
 
     def onChanged(self, fp, prop):
+        if prop == "Visibility":
+            showNet(fp)
         if prop == "reverse":
             fp.Weights = list(reversed(fp.Weights))
 
     def execute(self, fp):
         """Do something when doing a recomputation, this method is mandatory"""
-        # process Sketch0
-        obj00 = fp.Sketch0.Geometry[0]
-        obj01 = fp.Sketch0.Geometry[1]
-        if obj00.__class__ == Part.Circle:
-            cir0 = obj00
-        if obj01.__class__ == Part.Circle:
-            cir0 = obj01
-        if obj00.__class__ == Part.LineSegment:
-            lin0 = obj00
-        if obj01.__class__ == Part.LineSegment:
-            lin0 = obj01
-        p00s = cir0.Center
-        if equalVectors(lin0.StartPoint, p00s, fp.tolerance):
-            p01s = lin0.EndPoint
-        elif equalVectors(lin0.EndPoint, p00s, fp.tolerance):
-            p01s = lin0.StartPoint
-        else:
-            print(fp.Label, " : in the first sketch, no point on the line connects to the circle center at the current tolerance")
-
-        # to world
-        mat0 = fp.Sketch0.Placement.toMatrix()
-        p00 = mat0.multiply(p00s)
-        p01 = mat0.multiply(p01s)
-        # process Sketch1
-        obj10 = fp.Sketch1.Geometry[0]
-        obj11 = fp.Sketch1.Geometry[1]
-        if obj10.__class__ == Part.Circle:
-            cir1 = obj10
-        if obj11.__class__ == Part.Circle:
-            cir1 = obj11
-        if obj10.__class__ == Part.LineSegment:
-            lin1 = obj10
-        if obj11.__class__ == Part.LineSegment:
-            lin1 = obj11
-        p11s = cir1.Center
-        if equalVectors(lin1.StartPoint, p11s, fp.tolerance):
-            p10s = lin1.EndPoint
-        elif equalVectors(lin1.EndPoint, p11s, fp.tolerance):
-            p10s = lin1.StartPoint
-        else:
-            print(fp.Label, " : in the second sketch, no point on the line connects to the circle center at the current tolerance")
-
-        # to world
-        mat1 = fp.Sketch1.Placement.toMatrix()
-        p10 = mat1.multiply(p10s)
-        p11 = mat1.multiply(p11s)
+        # process the sketches. each gives [circle center, line end] in world
+        node0 = sketchRead(fp.Sketch0, node4FromSketch, fp.tolerance)
+        node1 = sketchRead(fp.Sketch1, node4FromSketch, fp.tolerance)
+        for node, which in [[node0, "first"], [node1, "second"]]:
+            if isinstance(node, str):
+                log_poly.error(fp.Label, " : in the ", which, " sketch, ", node)
+                fake_name_to_trigger_error = please_read_message_above
+        p00, p01 = node0
+        p11, p10 = node1
         # set the poles
         if fp.reverse == False:
-            fp.Poles = [p00, p01, p10, p11]
+            Poles = [p00, p01, p10, p11]
         else:
-            fp.Poles = [p11, p10, p01, p00]
-        # prepare the polygon
-        Leg0 = Part.LineSegment(p00, p01)
-        Leg1 = Part.LineSegment(p01, p10)
-        Leg2 = Part.LineSegment(p10, p11)
-        # set the polygon legs property
-        fp.Legs = [Leg0, Leg1, Leg2]
-        # define the shape for visualization
-        fp.Shape = Part.Shape(fp.Legs)
+            Poles = [p11, p10, p01, p00]
+        commitNet(fp, Poles)
 
 
 class ControlPoly4_2P:  # made from 2 pointOnCurve objects
@@ -2019,11 +2966,11 @@ class ControlPoly4_2P:  # made from 2 pointOnCurve objects
         latest_version = "0.00"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
         if update:
             # capture, then delete original attribute set values in user input fields
@@ -2058,6 +3005,8 @@ class ControlPoly4_2P:  # made from 2 pointOnCurve objects
         obj.recompute()
 
     def onChanged(self, fp, prop):
+        if prop == "Visibility":
+            showNet(fp)
         if prop == "reverse":
             fp.Weights = list(reversed(fp.Weights))
 
@@ -2080,17 +3029,10 @@ class ControlPoly4_2P:  # made from 2 pointOnCurve objects
 
         # set the poles
         if fp.reverse == False:
-            fp.Poles = [p0, p1, p2, p3]
+            Poles = [p0, p1, p2, p3]
         else:
-            fp.Poles = [p3, p2, p1, p0]
-        # prepare the polygon
-        Leg0 = Part.LineSegment(p0, p1)
-        Leg1 = Part.LineSegment(p1, p2)
-        Leg2 = Part.LineSegment(p2, p3)
-        # set the polygon legs property
-        fp.Legs = [Leg0, Leg1, Leg2]
-        # define the shape for visualization
-        fp.Shape = Part.Shape(fp.Legs)
+            Poles = [p3, p2, p1, p0]
+        commitNet(fp, Poles)
 
 
 class ControlPoly4_FirstElement:  # made from the first element of a single sketch. tested for straight line, circular arc (less than 90 degrees), and elliptic arc. the number of elements in the sketch should not be 3.
@@ -2131,11 +3073,11 @@ class ControlPoly4_FirstElement:  # made from the first element of a single sket
         latest_version = "0.02"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update:
@@ -2194,45 +3136,18 @@ class ControlPoly4_FirstElement:  # made from the first element of a single sket
         obj.recompute()
 
     def onChanged(self, fp, prop):
+        if prop == "Visibility":
+            showNet(fp)
         if prop == "reverse":
             fp.Weights = list(reversed(fp.Weights))
 
     def execute(self, fp):
         """Do something when doing a recomputation, this method is mandatory"""
         # process the sketch...error check later
-        # line below getting first element from shape worked for 10 years, but became unreliable in FreeCAD 1.x
-        # ElemNurbs=fp.Sketch.Shape.Edges[-1].toNurbs().Edge1.Curve
-        # now trying to work with "Geometry" attribute of sketch, hoping that the element display in sketch editor
-        # matches the object ordering
-        ElemNurbs = fp.Sketch.Geometry[0].toNurbs()
-        ElemNurbs.increaseDegree(3)
-        p0s = ElemNurbs.getPole(1)
-        p1s = ElemNurbs.getPole(2)
-        p2s = ElemNurbs.getPole(3)
-        p3s = ElemNurbs.getPole(4)
-        # the "Sketch.Geometry" version loses world placement
-        # "Sketch.Shape" was already to world?
-        # reactivate section below (remove 's' from prev section vars to re-deactivate)
-        mat = fp.Sketch.Placement.toMatrix()
-        p0 = mat.multiply(p0s)
-        p1 = mat.multiply(p1s)
-        p2 = mat.multiply(p2s)
-        p3 = mat.multiply(p3s)
-
-        if fp.reverse == False:
-            fp.Poles = [p0, p1, p2, p3]
-        else:
-            fp.Poles = [p3, p2, p1, p0]
-        # set the weights
-        fp.Weights = ElemNurbs.getWeights()
-        # prepare the lines to draw the polygon
-        Leg0 = Part.LineSegment(p0, p1)
-        Leg1 = Part.LineSegment(p1, p2)
-        Leg2 = Part.LineSegment(p2, p3)
-        # set the polygon legs property
-        fp.Legs = [Leg0, Leg1, Leg2]
-        # define the shape for visualization
-        fp.Shape = Part.Shape(fp.Legs)
+        Poles, Weights = sketchRead(fp.Sketch, poly4FromFirstElement)
+        if fp.reverse == True:
+            Poles = Poles[::-1]
+        commitNet(fp, Poles, Weights)
 
 
 class ControlPoly6_5L:  # made from a single sketch containing 5 line objects connected end to end
@@ -2274,11 +3189,11 @@ class ControlPoly6_5L:  # made from a single sketch containing 5 line objects co
         latest_version = "0.01"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update:
@@ -2337,6 +3252,8 @@ class ControlPoly6_5L:  # made from a single sketch containing 5 line objects co
         obj.recompute()
 
     def onChanged(self, fp, prop):
+        if prop == "Visibility":
+            showNet(fp)
         if prop == "reverse":
             fp.Weights = list(reversed(fp.Weights))
 
@@ -2371,21 +3288,11 @@ class ControlPoly6_5L:  # made from a single sketch containing 5 line objects co
         # print ("poles", poles)
 
         if fp.reverse == False:
-            fp.Poles = [poles[0], poles[1], poles[2], poles[3], poles[4], poles[5]]
+            Poles = [poles[0], poles[1], poles[2], poles[3], poles[4], poles[5]]
         else:
-            fp.Poles = [poles[5], poles[4], poles[3], poles[2], poles[1], poles[0]]
-
-        # prepare the lines to draw the polygon
-        Leg0 = Part.LineSegment(fp.Poles[0], fp.Poles[1])
-        Leg1 = Part.LineSegment(fp.Poles[1], fp.Poles[2])
-        Leg2 = Part.LineSegment(fp.Poles[2], fp.Poles[3])
-        Leg3 = Part.LineSegment(fp.Poles[3], fp.Poles[4])
-        Leg4 = Part.LineSegment(fp.Poles[4], fp.Poles[5])
+            Poles = [poles[5], poles[4], poles[3], poles[2], poles[1], poles[0]]
 
-        # set the polygon legs property
-        fp.Legs = [Leg0, Leg1, Leg2, Leg3, Leg4]
-        # define the shape for visualization
-        fp.Shape = Part.Shape(fp.Legs)
+        commitNet(fp, Poles)
 
 
 class ControlPoly6_2N:  # made from 2 node sketches. each node sketch contain 2 lines, and one circle.
@@ -2429,11 +3336,11 @@ class ControlPoly6_2N:  # made from 2 node sketches. each node sketch contain 2
         latest_version = "0.01"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update:
@@ -2495,140 +3402,29 @@ class ControlPoly6_2N:  # made from 2 node sketches. each node sketch contain 2
         obj.recompute()
 
     def onChanged(self, fp, prop):
+        if prop == "Visibility":
+            showNet(fp)
         if prop == "reverse":
             fp.Weights = list(reversed(fp.Weights))
 
     def execute(self, fp):
         """Do something when doing a recomputation, this method is mandatory"""
-        # process Sketch0
-        obj = [0, 0, 0]
-        obj[0] = fp.Sketch0.Geometry[0]
-        obj[1] = fp.Sketch0.Geometry[1]
-        obj[2] = fp.Sketch0.Geometry[2]
-        # find the circle
-        if obj[0].__class__ == Part.Circle:
-            cir0 = obj[0]
-            lin1 = obj[1]
-            lin2 = obj[2]
-        if obj[1].__class__ == Part.Circle:
-            cir0 = obj[1]
-            lin1 = obj[0]
-            lin2 = obj[2]
-        if obj[2].__class__ == Part.Circle:
-            cir0 = obj[2]
-            lin1 = obj[0]
-            lin2 = obj[1]
-        p00s = cir0.Center
-        lin10s = lin1.StartPoint
-        lin11s = lin1.EndPoint
-        lin20s = lin2.StartPoint
-        lin21s = lin2.EndPoint
-        # to world
-        mat0 = fp.Sketch0.Placement.toMatrix()
-        p00 = mat0.multiply(p00s)
-        lin10 = mat0.multiply(lin10s)
-        lin11 = mat0.multiply(lin11s)
-        lin20 = mat0.multiply(lin20s)
-        lin21 = mat0.multiply(lin21s)
-        if equalVectors(p00, lin10, fp.tolerance):
-            p01 = lin11
-            l1 = 1
-        elif equalVectors(p00, lin11, fp.tolerance):
-            p01 = lin10
-            l1 = 1
-        elif equalVectors(p00, lin20, fp.tolerance):
-            p01 = lin21
-            l1 = 2
-        elif equalVectors(p00, lin21, fp.tolerance):
-            p01 = lin20
-            l1 = 2
-        else:
-            print("no connection found between the circle center and a line endpoint at the current tolerance")
-        if l1 == 1:
-            if equalVectors(p01, lin20, fp.tolerance):
-                p02 = lin21
-            if equalVectors(p01, lin21, fp.tolerance):
-                p02 = lin20
-        elif l1 == 2:
-            if equalVectors(p01, lin10, fp.tolerance):
-                p02 = lin11
-            if equalVectors(p01, lin11, fp.tolerance):
-                p02 = lin10
-        else:
-            print("no connection found between the two lines at the current tolerance")
-
-        # process Sketch1
-        obj = [0, 0, 0]
-        obj[0] = fp.Sketch1.Geometry[0]
-        obj[1] = fp.Sketch1.Geometry[1]
-        obj[2] = fp.Sketch1.Geometry[2]
-        # find the circle
-        if obj[0].__class__ == Part.Circle:
-            cir0 = obj[0]
-            lin1 = obj[1]
-            lin2 = obj[2]
-        if obj[1].__class__ == Part.Circle:
-            cir0 = obj[1]
-            lin1 = obj[0]
-            lin2 = obj[2]
-        if obj[2].__class__ == Part.Circle:
-            cir0 = obj[2]
-            lin1 = obj[0]
-            lin2 = obj[1]
-        p05s = cir0.Center
-        lin10s = lin1.StartPoint
-        lin11s = lin1.EndPoint
-        lin20s = lin2.StartPoint
-        lin21s = lin2.EndPoint
-        # to world
-        mat1 = fp.Sketch1.Placement.toMatrix()
-        p05 = mat1.multiply(p05s)
-        lin10 = mat1.multiply(lin10s)
-        lin11 = mat1.multiply(lin11s)
-        lin20 = mat1.multiply(lin20s)
-        lin21 = mat1.multiply(lin21s)
-        if equalVectors(p05, lin10, fp.tolerance):
-            p04 = lin11
-            l1 = 1
-        elif equalVectors(p05, lin11, fp.tolerance):
-            p04 = lin10
-            l1 = 1
-        elif equalVectors(p05, lin20, fp.tolerance):
-            p04 = lin21
-            l1 = 2
-        elif equalVectors(p05, lin21, fp.tolerance):
-            p04 = lin20
-            l1 = 2
-        else:
-            print("no connection found between the circle center and a line endpoint at the current tolerance")
-        if l1 == 1:
-            if equalVectors(p04, lin20, fp.tolerance):
-                p03 = lin21
-            if equalVectors(p04, lin21, fp.tolerance):
-                p03 = lin20
-        elif l1 == 2:
-            if equalVectors(p04, lin10, fp.tolerance):
-                p03 = lin11
-            if equalVectors(p04, lin11, fp.tolerance):
-                p03 = lin10
-        else:
-            print("no connection found between the two lines at the current tolerance")
+        # process the sketches. each gives [circle center, inner, outer] in world
+        node0 = sketchRead(fp.Sketch0, node6FromSketch, fp.tolerance)
+        node1 = sketchRead(fp.Sketch1, node6FromSketch, fp.tolerance)
+        for node, which in [[node0, "first"], [node1, "second"]]:
+            if isinstance(node, str):
+                log_poly.error(fp.Label, " : in the ", which, " sketch, ", node)
+                fake_name_to_trigger_error = please_read_message_above
+        p00, p01, p02 = node0
+        p05, p04, p03 = node1
 
         # set the poles
         if fp.reverse == False:
-            fp.Poles = [p00, p01, p02, p03, p04, p05]
+            Poles = [p00, p01, p02, p03, p04, p05]
         else:
-            fp.Poles = [p05, p04, p03, p02, p01, p00]
-        # prepare the polygon
-        Leg0 = Part.LineSegment(p00, p01)
-        Leg1 = Part.LineSegment(p01, p02)
-        Leg2 = Part.LineSegment(p02, p03)
-        Leg3 = Part.LineSegment(p03, p04)
-        Leg4 = Part.LineSegment(p04, p05)
-        # set the polygon legs property
-        fp.Legs = [Leg0, Leg1, Leg2, Leg3, Leg4]
-        # define the shape for visualization
-        fp.Shape = Part.Shape(fp.Legs)
+            Poles = [p05, p04, p03, p02, p01, p00]
+        commitNet(fp, Poles)
 
 
 class ControlPoly6_FirstElement:  # made from the first element of a single sketch
@@ -2669,11 +3465,11 @@ class ControlPoly6_FirstElement:  # made from the first element of a single sket
         latest_version = "0.01"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update:
@@ -2732,6 +3528,8 @@ class ControlPoly6_FirstElement:  # made from the first element of a single sket
         obj.recompute()
 
     def onChanged(self, fp, prop):
+        if prop == "Visibility":
+            showNet(fp)
         if prop == "reverse":
             fp.recompute()
 
@@ -2742,39 +3540,14 @@ class ControlPoly6_FirstElement:  # made from the first element of a single sket
             # print("Restore in fp.state")
             return  # or do some special thing
         # process the sketch element...error check later
-        ElemNurbs = fp.Sketch.Shape.Edges[0].toNurbs().Edge1.Curve
-        ElemNurbs.increaseDegree(3)
-        start = ElemNurbs.FirstParameter
-        end = ElemNurbs.LastParameter
-        knot1 = start + (end - start) / 3.0
-        knot2 = end - (end - start) / 3.0
-        ElemNurbs.insertKnot(knot1)
-        ElemNurbs.insertKnot(knot2)
-        p00 = ElemNurbs.getPole(1)
-        p01 = ElemNurbs.getPole(2)
-        p02 = ElemNurbs.getPole(3)
-        p03 = ElemNurbs.getPole(4)
-        p04 = ElemNurbs.getPole(5)
-        p05 = ElemNurbs.getPole(6)
+        Poles, Weights = sketchRead(fp.Sketch, poly6FromFirstElement)
 
         # set the poles and weights
-        if fp.reverse == False:
-            fp.Poles = [p00, p01, p02, p03, p04, p05]
-            fp.Weights = ElemNurbs.getWeights()
-        else:
-            fp.Poles = [p05, p04, p03, p02, p01, p00]
-            fp.Weights = list(reversed(ElemNurbs.getWeights()))
+        if fp.reverse == True:
+            Poles = Poles[::-1]
+            Weights = list(reversed(Weights))
 
-        # prepare the lines to draw the polyline
-        Leg0 = Part.LineSegment(p00, p01)
-        Leg1 = Part.LineSegment(p01, p02)
-        Leg2 = Part.LineSegment(p02, p03)
-        Leg3 = Part.LineSegment(p03, p04)
-        Leg4 = Part.LineSegment(p04, p05)
-        # set the polygon legs property
-        fp.Legs = [Leg0, Leg1, Leg2, Leg3, Leg4]
-        # define the shape for visualization
-        fp.Shape = Part.Shape(fp.Legs)
+        commitNet(fp, Poles, Weights)
 
 
 ### control grids (+poly to input)
@@ -2825,11 +3598,11 @@ class ControlGrid44_4:  # made from 4 ControlPoly4.
         latest_version = "0.01"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update == True:
@@ -2894,6 +3667,8 @@ class ControlGrid44_4:  # made from 4 ControlPoly4.
         obj.recompute()
 
     def onChanged(self, fp, prop):
+        if prop == "Visibility":
+            showNet(fp)
         if prop == "reverse":
             fp.recompute()
 
@@ -2903,50 +3678,18 @@ class ControlGrid44_4:  # made from 4 ControlPoly4.
         if "Restore" in fp.State:
             # print("Restore in fp.state")
             return  # or do some special thing
-        if fp.reverse == False:
-            poles1 = fp.Poly0.Poles
-            poles2 = fp.Poly1.Poles
-            poles3 = fp.Poly2.Poles
-            poles4 = fp.Poly3.Poles
-            weights1 = fp.Poly0.Weights
-            weights2 = fp.Poly1.Weights
-            weights3 = fp.Poly2.Weights
-            weights4 = fp.Poly3.Weights
-        else:
-            poles1 = fp.Poly3.Poles
-            poles2 = fp.Poly2.Poles
-            poles3 = fp.Poly1.Poles
-            poles4 = fp.Poly0.Poles
-            weights1 = fp.Poly3.Weights
-            weights2 = fp.Poly2.Weights
-            weights3 = fp.Poly1.Weights
-            weights4 = fp.Poly0.Weights
-
-        quad12 = orient_a_to_b(poles1, poles2, fp.tolerance)
-        quad23 = orient_a_to_b(poles2, poles3, fp.tolerance)
-        quad34 = orient_a_to_b(poles3, poles4, fp.tolerance)
-        quad41 = orient_a_to_b(poles4, poles1, fp.tolerance)
+        polys = [[fp.Poly0.Poles, fp.Poly0.Weights], [fp.Poly1.Poles, fp.Poly1.Weights], [fp.Poly2.Poles, fp.Poly2.Weights], [fp.Poly3.Poles, fp.Poly3.Weights]]
+        if fp.reverse == True:
+            polys = polys[::-1]
 
-        escape_malformed_loop = 0
-        if quad12 == 0:
-            message = "first and second selected polys do not share endpoints at the current tolerance"
-            escape_malformed_loop = 1
-        if quad23 == 0:
-            message = "second and third selected polys do not share endpoints at the current tolerance"
-            escape_malformed_loop = 1
-        if quad34 == 0:
-            message = "third and fourth selected polys do not share endpoints at the current tolerance"
-            escape_malformed_loop = 1
-        if quad41 == 0:
-            message = "first and fourth selected polys do not share endpoints at the current tolerance"
-            escape_malformed_loop = 1
-        if escape_malformed_loop == 1:
-            print(
+        grid = grid44FromPolys(polys, fp.tolerance)
+        if isinstance(grid, str):
+            log_poly.error(
                 fp.Name,
                 ", labeled ",
                 fp.Label,
                 "\n",
-                message,
+                grid,
                 "\n",
                 "the object is created in the document, but awaits resolution of endpoint matching.",
                 " inspect the sketches that define the Controloly4 objects.",
@@ -2955,51 +3698,8 @@ class ControlGrid44_4:  # made from 4 ControlPoly4.
             )
             fake_name_to_trigger_error = please_read_message_above
             return
-        if quad12[0] != poles1[0] and quad12[0] == poles1[-1]:
-            weights1 = weights1[::-1]
-        if quad23[0] != poles2[0] and quad23[0] == poles2[-1]:
-            weights2 = weights2[::-1]
-        if quad34[0] != poles3[0] and quad34[0] == poles3[-1]:
-            weights3 = weights3[::-1]
-        if quad41[0] != poles4[0] and quad41[0] == poles4[-1]:
-            weights4 = weights4[::-1]
-        p00 = quad12[0]
-        p01 = quad12[1]
-        p02 = quad12[2]
-        p03 = quad12[3]
-        p13 = quad23[1]
-        p23 = quad23[2]
-        p33 = quad23[3]
-        p32 = quad34[1]
-        p31 = quad34[2]
-        p30 = quad34[3]
-        p20 = quad41[1]
-        p10 = quad41[2]
-        p11 = p00 + (p01 - p00) + (p10 - p00)
-        p12 = p03 + (p02 - p03) + (p13 - p03)
-        p21 = p30 + (p31 - p30) + (p20 - p30)
-        p22 = p33 + (p23 - p33) + (p32 - p33)
-        fp.Poles = [p00, p01, p02, p03, p10, p11, p12, p13, p20, p21, p22, p23, p30, p31, p32, p33]
-        w00 = weights1[0]
-        w01 = weights1[1]
-        w02 = weights1[2]
-        w03 = weights1[3]
-        w13 = weights2[1]
-        w23 = weights2[2]
-        w33 = weights2[3]
-        w32 = weights3[1]
-        w31 = weights3[2]
-        w30 = weights3[3]
-        w20 = weights4[1]
-        w10 = weights4[2]
-        w11 = w01 * w10
-        w12 = w02 * w13
-        w21 = w20 * w31
-        w22 = w23 * w32
-        fp.Weights = [w00, w01, w02, w03, w10, w11, w12, w13, w20, w21, w22, w23, w30, w31, w32, w33]
 
-        fp.Legs = drawGrid(fp.Poles, 4)
-        fp.Shape = Part.Shape(fp.Legs)
+        commitNet(fp, grid[0], grid[1])
 
 
 class ControlGrid44_3:  # made from 3 CubicControlPoly4.
@@ -3047,11 +3747,11 @@ class ControlGrid44_3:  # made from 3 CubicControlPoly4.
         latest_version = "0.01"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update:
@@ -3121,6 +3821,8 @@ class ControlGrid44_3:  # made from 3 CubicControlPoly4.
         obj.recompute()
 
     def onChanged(self, fp, prop):
+        if prop == "Visibility":
+            showNet(fp)
         if prop == "reverse":
             fp.recompute()
 
@@ -3163,7 +3865,7 @@ class ControlGrid44_3:  # made from 3 CubicControlPoly4.
             message = "third and first selected polys do not share endpoints at the current tolerance"
             escape_malformed_loop = 1
         if escape_malformed_loop == 1:
-            print(
+            log_poly.error(
                 fp.Name,
                 ", labeled ",
                 fp.Label,
@@ -3206,7 +3908,7 @@ class ControlGrid44_3:  # made from 3 CubicControlPoly4.
         p21 = p11
         p22 = p23 + p32 - p33
 
-        fp.Poles = [p00, p01, p02, p03, p10, p11, p12, p13, p20, p21, p22, p23, p30, p31, p32, p33]
+        Poles = [p00, p01, p02, p03, p10, p11, p12, p13, p20, p21, p22, p23, p30, p31, p32, p33]
 
         # weights below are meh. surface edges follow curves, but internal degenerate point has too much draw.
         w00 = weights1[0]
@@ -3230,10 +3932,9 @@ class ControlGrid44_3:  # made from 3 CubicControlPoly4.
         w21 = w31 * w20
         w22 = w23 * w31
 
-        fp.Weights = [w00, w01, w02, w03, w10, w11, w12, w13, w20, w21, w22, w23, w30, w31, w32, w33]
+        Weights = [w00, w01, w02, w03, w10, w11, w12, w13, w20, w21, w22, w23, w30, w31, w32, w33]
 
-        fp.Legs = drawGrid(fp.Poles, 4)
-        fp.Shape = Part.Shape(fp.Legs)
+        commitNet(fp, Poles, Weights)
 
 
 class ControlGrid44_3_Rotate_OLD:  # made from 3 CubicControlPoly4.
@@ -3271,7 +3972,7 @@ class ControlGrid44_3_Rotate_OLD:  # made from 3 CubicControlPoly4.
             weights3 = weights3[::-1]
         # make sure this is a degenerate quadrangle, i.e. a triangle
         if not equalVectors(quad31[3], quad12[0], 0.00001):
-            print("edge loop does not form a triangle")
+            log_poly.warning("edge loop does not form a triangle")
         # no further error handling is implemented
 
         p00 = quad12[0]
@@ -3314,23 +4015,23 @@ class ControlGrid44_3_Rotate_OLD:  # made from 3 CubicControlPoly4.
         # if the plane0 and Line0 are not parallel or coincident, set p11 at the intersection.
         # if they are, [TBD]
         test0 = math.fabs(Plane0_N.dot(Line0_N))
-        print("test0: ", test0)
+        log_poly.debug("test0: ", test0)
         if test0 >= 0.00001:
-            print("test0: ", test0)
+            log_poly.debug("test0: ", test0)
             factor0 = (Plane0_pt - Line0_pt).dot(Plane0_N) / Line0_N.dot(Plane0_N)
             p11 = Line0_N.multiply(factor0) + Line0_pt
         else:
-            print("poly0 / poly2 combination: edge/plane parallel, cannot intersect for inner control point p11")
+            log_poly.warning("poly0 / poly2 combination: edge/plane parallel, cannot intersect for inner control point p11")
 
         # if the plane1 and Line1 are not parallel or coincident, set p21 at the intersection.
         # if they are, [TBD]
         test1 = math.fabs(Plane1_N.dot(Line1_N))
-        print("test1: ", test1)
+        log_poly.debug("test1: ", test1)
         if test1 >= 0.00001:
             factor1 = (Plane1_pt - Line1_pt).dot(Plane1_N) / Line1_N.dot(Plane1_N)
             p21 = Line1_N.multiply(factor1) + Line1_pt
         else:
-            print("poly2 / poly3 combination: edge/plane parallel, cannot intersect for inner control point p21")
+            log_poly.warning("poly2 / poly3 combination: edge/plane parallel, cannot intersect for inner control point p21")
 
         fp.Poles = [p00, p01, p02, p03, p10, p11, p12, p13, p20, p21, p22, p23, p30, p31, p32, p33]
 
@@ -3422,11 +4123,11 @@ class ControlGrid44_3_Rotate:  # made from 3 CubicControlPoly4.
         latest_version = "0.01"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update:
@@ -3497,6 +4198,8 @@ class ControlGrid44_3_Rotate:  # made from 3 CubicControlPoly4.
         obj.recompute()
 
     def onChanged(self, fp, prop):
+        if prop == "Visibility":
+            showNet(fp)
         if prop == "reverse":
             fp.recompute()
 
@@ -3539,7 +4242,7 @@ class ControlGrid44_3_Rotate:  # made from 3 CubicControlPoly4.
             message = "third and first selected polys do not share endpoints at the current tolerance"
             escape_malformed_loop = 1
         if escape_malformed_loop == 1:
-            print(
+            log_poly.error(
                 fp.Name,
                 ", labeled ",
                 fp.Label,
@@ -3590,7 +4293,7 @@ class ControlGrid44_3_Rotate:  # made from 3 CubicControlPoly4.
             Rot_pt = p00
             Rot_N = (p01 - p00).cross(p31 - p00)
         else:
-            print("poly0 / poly2 combination: selected polys do not define a normal at the degenerate point")
+            log_poly.warning("poly0 / poly2 combination: selected polys do not define a normal at the degenerate point")
 
         ### define a target 'meridian' plane for p11 and p12
         # contains p00, p13, and Rot_N
@@ -3609,7 +4312,7 @@ class ControlGrid44_3_Rotate:  # made from 3 CubicControlPoly4.
             factor11 = (Plane1_pt - Line11_pt).dot(Plane1_N) / Line11_N.dot(Plane1_N)
             p11 = Line11_N.multiply(factor11) + Line11_pt
         else:
-            print("cannot intersect standard p11 with meridian plane 1 to produce rotated inner control point p11")
+            log_poly.warning("cannot intersect standard p11 with meridian plane 1 to produce rotated inner control point p11")
 
         ## define a line going through p02 and p12_Temp. we will want p12 (final) to be somewhere along his line.
         Line12_pt = p02
@@ -3623,7 +4326,7 @@ class ControlGrid44_3_Rotate:  # made from 3 CubicControlPoly4.
             factor12 = (Plane1_pt - Line12_pt).dot(Plane1_N) / Line12_N.dot(Plane1_N)
             p12 = Line12_N.multiply(factor12) + Line12_pt
         else:
-            print("cannot intersect standard p12 with meridian plane 1 to produce rotated inner control point p12")
+            log_poly.warning("cannot intersect standard p12 with meridian plane 1 to produce rotated inner control point p12")
 
         ### define a target 'meridian' plane for p21 and p22
         # contains p00, p23, and Rot_N
@@ -3642,7 +4345,7 @@ class ControlGrid44_3_Rotate:  # made from 3 CubicControlPoly4.
             factor21 = (Plane2_pt - Line21_pt).dot(Plane2_N) / Line21_N.dot(Plane2_N)
             p21 = Line21_N.multiply(factor21) + Line21_pt
         else:
-            print("cannot intersect standard p21 with meridian plane 2 to produce rotated inner control point p21")
+            log_poly.warning("cannot intersect standard p21 with meridian plane 2 to produce rotated inner control point p21")
 
         ## define a line going through p32 and p22_Temp. we will want p22 (final) to be somewhere along his line.
         Line22_pt = p32
@@ -3656,9 +4359,9 @@ class ControlGrid44_3_Rotate:  # made from 3 CubicControlPoly4.
             factor22 = (Plane2_pt - Line22_pt).dot(Plane2_N) / Line22_N.dot(Plane2_N)
             p22 = Line22_N.multiply(factor22) + Line22_pt
         else:
-            print("cannot intersect standard p22 with meridian plane 2 to produce rotated inner control point p22")
+            log_poly.warning("cannot intersect standard p22 with meridian plane 2 to produce rotated inner control point p22")
 
-        fp.Poles = [p00, p01, p02, p03, p10, p11, p12, p13, p20, p21, p22, p23, p30, p31, p32, p33]
+        Poles = [p00, p01, p02, p03, p10, p11, p12, p13, p20, p21, p22, p23, p30, p31, p32, p33]
 
         # weights below are in progress
         w00 = weights1[0]
@@ -3682,13 +4385,15 @@ class ControlGrid44_3_Rotate:  # made from 3 CubicControlPoly4.
         w21 = w31 * w20
         w22 = w23 * w31
 
-        fp.Weights = [w00, w01, w02, w03, w10, w11, w12, w13, w20, w21, w22, w23, w30, w31, w32, w33]
+        Weights = [w00, w01, w02, w03, w10, w11, w12, w13, w20, w21, w22, w23, w30, w31, w32, w33]
 
-        fp.Legs = drawGrid(fp.Poles, 4)
-        fp.Shape = Part.Shape(fp.Legs)
+        commitNet(fp, Poles, Weights)
 
 
 class ControlGrid44_flow:  # create a copy of a ControlGrid44 grid whose internal points will 'flow' instead of providing predictable tangency
+    # tuning properties: a burst of changes is merged into one recompute, see Silk_debounce.py
+    debounced_properties = ["flow_11", "flow_12", "flow_21", "flow_22"]
+
     def __init__(self, obj, input_grid):
         latest_version = "0.01"  # must match in onDocumentRestored()
 
@@ -3816,17 +4521,18 @@ class ControlGrid44_flow:  # create a copy of a ControlGrid44 grid whose interna
         obj.setEditorMode("internalName", 1)
         # mandatory Proxy assignment
         obj.Proxy = self
+        Silk_debounce.attach(obj, self.debounced_properties)
 
     def onDocumentRestored(self, obj):
         # Migration function to set attributes between object versions. Preserves user data in object.
         latest_version = "0.01"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update:
@@ -3952,12 +4658,18 @@ class ControlGrid44_flow:  # create a copy of a ControlGrid44 grid whose interna
             obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
             obj.setEditorMode("internalName", 1)
 
+        Silk_debounce.attach(obj, self.debounced_properties)
+
         # need to recompute otherwise the poles remain unpopulated
         obj.recompute()
 
     def onChanged(self, fp, prop):
+        if prop == "Visibility":
+            showNet(fp)
         if prop == "reverse":
             fp.recompute()
+        if prop in self.debounced_properties:
+            Silk_debounce.request(fp)
 
     def execute(self, fp):
         """Do something when doing a recomputation, this method is mandatory"""
@@ -3965,65 +4677,12 @@ class ControlGrid44_flow:  # create a copy of a ControlGrid44 grid whose interna
         if "Restore" in fp.State:
             # print("Restore in fp.state")
             return  # or do some special thing
-        if fp.reverse == False:
-            Poles = fp.InputGrid.Poles
-            fp.Weights = fp.InputGrid.Weights
-        else:
-            Poles = [0] * 16
-            Poles[0] = fp.InputGrid.Poles[0]
-            Poles[1] = fp.InputGrid.Poles[4]
-            Poles[2] = fp.InputGrid.Poles[8]
-            Poles[3] = fp.InputGrid.Poles[12]
-            Poles[4] = fp.InputGrid.Poles[1]
-            Poles[5] = fp.InputGrid.Poles[5]
-            Poles[6] = fp.InputGrid.Poles[9]
-            Poles[7] = fp.InputGrid.Poles[13]
-            Poles[8] = fp.InputGrid.Poles[2]
-            Poles[9] = fp.InputGrid.Poles[6]
-            Poles[10] = fp.InputGrid.Poles[10]
-            Poles[11] = fp.InputGrid.Poles[14]
-            Poles[12] = fp.InputGrid.Poles[3]
-            Poles[13] = fp.InputGrid.Poles[7]
-            Poles[14] = fp.InputGrid.Poles[11]
-            Poles[15] = fp.InputGrid.Poles[15]
-
-            # fp.Weights = fp.InputGrid.Weights
-            Weights = [0] * 16
-            Weights[0] = fp.InputGrid.Weights[0]
-            Weights[1] = fp.InputGrid.Weights[4]
-            Weights[2] = fp.InputGrid.Weights[8]
-            Weights[3] = fp.InputGrid.Weights[12]
-            Weights[4] = fp.InputGrid.Weights[1]
-            Weights[5] = fp.InputGrid.Weights[5]
-            Weights[6] = fp.InputGrid.Weights[9]
-            Weights[7] = fp.InputGrid.Weights[13]
-            Weights[8] = fp.InputGrid.Weights[2]
-            Weights[9] = fp.InputGrid.Weights[6]
-            Weights[10] = fp.InputGrid.Weights[10]
-            Weights[11] = fp.InputGrid.Weights[14]
-            Weights[12] = fp.InputGrid.Weights[3]
-            Weights[13] = fp.InputGrid.Weights[7]
-            Weights[14] = fp.InputGrid.Weights[11]
-            Weights[15] = fp.InputGrid.Weights[15]
-
-            fp.Weights = [
-                Weights[0],
-                Weights[1],
-                Weights[2],
-                Weights[3],
-                Weights[4],
-                Weights[5],
-                Weights[6],
-                Weights[7],
-                Weights[8],
-                Weights[9],
-                Weights[10],
-                Weights[11],
-                Weights[12],
-                Weights[13],
-                Weights[14],
-                Weights[15],
-            ]
+        grid = GridArray.fromGrid(fp.InputGrid, 4)
+        if fp.reverse == True:
+            # diagonal flip
+            grid = grid.transposed()
+        Poles = grid.poles()
+        Weights = grid.weights()
 
         p00 = Poles[0]
         p01 = Poles[1]
@@ -4152,10 +4811,9 @@ class ControlGrid44_flow:  # create a copy of a ControlGrid44 grid whose interna
         p21_final = p21_flow * fp.flow_21 + p21 * (1 - fp.flow_21)
         p22_final = p22_flow * fp.flow_22 + p22 * (1 - fp.flow_22)
 
-        fp.Poles = [p00, p01, p02, p03, p10, p11_final, p12_final, p13, p20, p21_final, p22_final, p23, p30, p31, p32, p33]
+        Poles = [p00, p01, p02, p03, p10, p11_final, p12_final, p13, p20, p21_final, p22_final, p23, p30, p31, p32, p33]
 
-        fp.Legs = drawGrid(fp.Poles, 4)
-        fp.Shape = Part.Shape(fp.Legs)
+        commitNet(fp, Poles, Weights)
 
 
 class ControlGrid66_4:  # made from 4 CubicControlPoly6.
@@ -4204,11 +4862,11 @@ class ControlGrid66_4:  # made from 4 CubicControlPoly6.
         latest_version = "0.01"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update == True:
@@ -4274,6 +4932,8 @@ class ControlGrid66_4:  # made from 4 CubicControlPoly6.
 
     def onChanged(self, fp, prop):
         # print("onChanged invoked")
+        if prop == "Visibility":
+            showNet(fp)
         if prop == "reverse":
             fp.recompute()
 
@@ -4332,7 +4992,7 @@ class ControlGrid66_4:  # made from 4 CubicControlPoly6.
             message = "first and fourth selected polys do not share endpoints at the current tolerance"
             escape_malformed_loop = 1
         if escape_malformed_loop == 1:
-            print(
+            log_poly.error(
                 fp.Name,
                 ", labeled ",
                 fp.Label,
@@ -4393,7 +5053,7 @@ class ControlGrid66_4:  # made from 4 CubicControlPoly6.
         p23 = p13 + (p25 - p15)
         p32 = p42 + (p30 - p40)
         p33 = p43 + (p35 - p45)
-        fp.Poles = [
+        Poles = [
             p00,
             p01,
             p02,
@@ -4472,7 +5132,7 @@ class ControlGrid66_4:  # made from 4 CubicControlPoly6.
         w42 = w52 * w40
         w32 = w30 * w52
 
-        fp.Weights = [
+        Weights = [
             w00,
             w01,
             w02,
@@ -4511,8 +5171,7 @@ class ControlGrid66_4:  # made from 4 CubicControlPoly6.
             w55,
         ]
 
-        fp.Legs = drawGrid(fp.Poles, 6)
-        fp.Shape = Part.Shape(fp.Legs)
+        commitNet(fp, Poles, Weights)
 
 
 class ControlGrid64_4:  # made from 2 CubicControlPoly6 and 2 CubicControlPoly4.
@@ -4559,11 +5218,11 @@ class ControlGrid64_4:  # made from 2 CubicControlPoly6 and 2 CubicControlPoly4.
         latest_version = "0.01"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update == True:
@@ -4629,6 +5288,8 @@ class ControlGrid64_4:  # made from 2 CubicControlPoly6 and 2 CubicControlPoly4.
 
     def onChanged(self, fp, prop):
         # print("onChanged invoked")
+        if prop == "Visibility":
+            showNet(fp)
         if prop == "reverse":
             fp.recompute()
 
@@ -4678,7 +5339,7 @@ class ControlGrid64_4:  # made from 2 CubicControlPoly6 and 2 CubicControlPoly4.
             message = "first and fourth selected polys do not share endpoints at the current tolerance"
             escape_malformed_loop = 1
         if escape_malformed_loop == 1:
-            print(
+            log_poly.error(
                 fp.Name,
                 ", labeled ",
                 fp.Label,
@@ -4726,7 +5387,7 @@ class ControlGrid64_4:  # made from 2 CubicControlPoly6 and 2 CubicControlPoly4.
         p13 = p03 + (p15 - p05)
         p22 = p32 + (p20 - p30)
         p23 = p33 + (p25 - p35)
-        fp.Poles = [p00, p01, p02, p03, p04, p05, p10, p11, p12, p13, p14, p15, p20, p21, p22, p23, p24, p25, p30, p31, p32, p33, p34, p35]
+        Poles = [p00, p01, p02, p03, p04, p05, p10, p11, p12, p13, p14, p15, p20, p21, p22, p23, p24, p25, p30, p31, p32, p33, p34, p35]
         w00 = weights6_0[0]
         w01 = weights6_0[1]
         w02 = weights6_0[2]
@@ -4755,10 +5416,9 @@ class ControlGrid64_4:  # made from 2 CubicControlPoly6 and 2 CubicControlPoly4.
         w22 = w32 * w20
         w23 = w33 * w25
         w24 = w34 * w25
-        fp.Weights = [w00, w01, w02, w03, w04, w05, w10, w11, w12, w13, w14, w15, w20, w21, w22, w23, w24, w25, w30, w31, w32, w33, w34, w35]
+        Weights = [w00, w01, w02, w03, w04, w05, w10, w11, w12, w13, w14, w15, w20, w21, w22, w23, w24, w25, w30, w31, w32, w33, w34, w35]
 
-        fp.Legs = drawGrid(fp.Poles, 6)
-        fp.Shape = Part.Shape(fp.Legs)
+        commitNet(fp, Poles, Weights)
 
 
 class ControlGrid64_3:  # made from 2 CubicControlPoly4 and 1 CubicControlPoly6. degenerate grid. NOT IN USE ANYWHERE
@@ -4775,7 +5435,7 @@ class ControlGrid64_3:  # made from 2 CubicControlPoly4 and 1 CubicControlPoly6.
 
     def execute(self, fp):
         """Do something when doing a recomputation, this method is mandatory"""
-        print("first one")
+        log_poly.debug("first one")
         poles4_0 = fp.Poly4_0.Poles
         poles6_1 = fp.Poly6_1.Poles
         poles4_2 = fp.Poly4_2.Poles
@@ -4912,11 +5572,11 @@ class CubicCurve_4:
         latest_version = "0.01"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update == True:
@@ -4963,6 +5623,26 @@ class CubicCurve_4:
         if prop == "reverse":
             fp.recompute()
 
+    def gatherInputs(self, fp):
+        # snapshot of everything execute() needs from the document, as plain data.
+        # also used by Silk_scheduler to build the shape away from the document objects
+        poles = fp.Poly.Poles
+        weights = fp.Poly.Weights
+        # get the poles list from the poly. legacy shape function wants 'homogeneous' coords as [[x,y,z],w]
+        WeightedPoles = [
+            [poles[0], weights[0]],
+            [poles[1], weights[1]],
+            [poles[2], weights[2]],
+            [poles[3], weights[3]],
+        ]
+        if fp.reverse == True:
+            WeightedPoles = WeightedPoles[::-1]
+
+        return {"builder": "Bezier_Cubic_curve", "WeightedPoles": weightedPolesToData(WeightedPoles)}
+
+    def commitOutputs(self, fp, shape, data):
+        fp.Shape = shape
+
     def execute(self, fp):
         """Do something when doing a recomputation, this method is mandatory"""
         # print("execute() invoked")
@@ -4970,18 +5650,14 @@ class CubicCurve_4:
             # print("Restore in fp.state")
             return  # or do some special thing
 
-        # get the poles list from the poly. legacy shape function wants 'homogeneous' coords as [[x,y,z],w]
-        WeightedPoles = [
-            [fp.Poly.Poles[0], fp.Poly.Weights[0]],
-            [fp.Poly.Poles[1], fp.Poly.Weights[1]],
-            [fp.Poly.Poles[2], fp.Poly.Weights[2]],
-            [fp.Poly.Poles[3], fp.Poly.Weights[3]],
-        ]
-        if fp.reverse == True:
-            WeightedPoles = WeightedPoles[::-1]
+        data = self.gatherInputs(fp)
+        if Silk_preview.isActive(fp):
+            # a sketch is being dragged: draw a sampled preview, the shape is built when the edit settles
+            Silk_preview.preview(fp, [data])
+            return
 
-        # the legacy function below sets the degree and knot vector
-        fp.Shape = Bezier_Cubic_curve(WeightedPoles).toShape()
+        # the legacy function called by buildShapeFromData() sets the degree and knot vector
+        self.commitOutputs(fp, buildShapeFromData(data), data)
 
 
 class CubicCurve_6:
@@ -5015,11 +5691,11 @@ class CubicCurve_6:
         latest_version = "0.01"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update == True:
@@ -5066,6 +5742,28 @@ class CubicCurve_6:
         if prop == "reverse":
             fp.recompute()
 
+    def gatherInputs(self, fp):
+        # snapshot of everything execute() needs from the document, as plain data.
+        # also used by Silk_scheduler to build the shape away from the document objects
+        poles = fp.Poly.Poles
+        weights = fp.Poly.Weights
+        # get the poles list from the poly. legacy shape function wants 'homogeneous' coords as [[x,y,z],w]
+        WeightedPoles = [
+            [poles[0], weights[0]],
+            [poles[1], weights[1]],
+            [poles[2], weights[2]],
+            [poles[3], weights[3]],
+            [poles[4], weights[4]],
+            [poles[5], weights[5]],
+        ]
+        if fp.reverse == True:
+            WeightedPoles = WeightedPoles[::-1]
+
+        return {"builder": "NURBS_Cubic_6P_curve", "WeightedPoles": weightedPolesToData(WeightedPoles)}
+
+    def commitOutputs(self, fp, shape, data):
+        fp.Shape = shape
+
     def execute(self, fp):
         """Do something when doing a recomputation, this method is mandatory"""
         # print("execute() invoked")
@@ -5073,20 +5771,14 @@ class CubicCurve_6:
             # print("Restore in fp.state")
             return  # or do some special thing
 
-        # get the poles list from the poly. legacy shape function wants 'homogeneous' coords as [[x,y,z],w]
-        WeightedPoles = [
-            [fp.Poly.Poles[0], fp.Poly.Weights[0]],
-            [fp.Poly.Poles[1], fp.Poly.Weights[1]],
-            [fp.Poly.Poles[2], fp.Poly.Weights[2]],
-            [fp.Poly.Poles[3], fp.Poly.Weights[3]],
-            [fp.Poly.Poles[4], fp.Poly.Weights[4]],
-            [fp.Poly.Poles[5], fp.Poly.Weights[5]],
-        ]
-        if fp.reverse == True:
-            WeightedPoles = WeightedPoles[::-1]
+        data = self.gatherInputs(fp)
+        if Silk_preview.isActive(fp):
+            # a sketch is being dragged: draw a sampled preview, the shape is built when the edit settles
+            Silk_preview.preview(fp, [data])
+            return
 
-        # the legacy function below sets the degree and knot vector
-        fp.Shape = NURBS_Cubic_6P_curve(WeightedPoles).toShape()
+        # the legacy function called by buildShapeFromData() sets the degree and knot vector
+        self.commitOutputs(fp, buildShapeFromData(data), data)
 
 
 ### curve derived objects (+curve to input)
@@ -5135,6 +5827,9 @@ class ControlPoly6_Bezier:  # not currently used. ControlPoly6_FirstElement gets
 
 
 class ControlPoly6_FilletBezier:
+    # tuning properties: a burst of changes is merged into one recompute, see Silk_debounce.py
+    debounced_properties = ["Scale_0", "Scale_1", "Scale_2", "Scale_3"]
+
     def __init__(self, obj, cubiccurve4_0, cubiccurve4_1):
         """Add the properties"""
 
@@ -5181,6 +5876,7 @@ class ControlPoly6_FilletBezier:
         obj.setEditorMode("internalName", 1)
         # mandatory Proxy assignment
         obj.Proxy = self
+        Silk_debounce.attach(obj, self.debounced_properties)
 
     def onDocumentRestored(self, obj):
         # Migration function to set attributes between object versions. Preserves user data in object.
@@ -5188,11 +5884,11 @@ class ControlPoly6_FilletBezier:
         latest_version = "0.01"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update == True:
@@ -5264,13 +5960,19 @@ class ControlPoly6_FilletBezier:
             obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
             obj.setEditorMode("internalName", 1)
 
+        Silk_debounce.attach(obj, self.debounced_properties)
+
         # need to recompute otherwise the poles remain unpopulated
         obj.recompute()
 
     def onChanged(self, fp, prop):
         # print("onChanged invoked")
+        if prop == "Visibility":
+            showNet(fp)
         if prop == "reverse":
             fp.recompute()
+        if prop in self.debounced_properties:
+            Silk_debounce.request(fp)
 
     def execute(self, fp):
         """Do something when doing a recomputation, this method is mandatory"""
@@ -5315,7 +6017,7 @@ class ControlPoly6_FilletBezier:
             escape_malformed_corner = 1
 
         if escape_malformed_corner == 1:
-            print(
+            log_poly.error(
                 fp.Name,
                 ", labeled ",
                 fp.Label,
@@ -5338,12 +6040,15 @@ class ControlPoly6_FilletBezier:
 
         if fp.autoG3 == 0:
             blend = blend_poly_2x4_1x6(blend_0, weights_0, blend_1, weights_1, scale_0, scale_1, scale_2, scale_3)
+            self.commitBlend(fp, blend)
 
         if fp.autoG3 == 1:
-            blend = blendG3_poly_2x4_1x6(blend_0, weights_0, blend_1, weights_1, scale_0, scale_1, scale_2, scale_3)
+            # the G3 search is slow. it runs on a worker thread and commits when done, see Silk_background.py
+            Silk_background.submit(fp, blendG3_poly_2x4_1x6, (blend_0, weights_0, blend_1, weights_1, scale_0, scale_1, scale_2, scale_3), self.commitBlend)
 
-        fp.Poles = blend[0]
-        fp.Weights = blend[1]
+    def commitBlend(self, fp, blend):
+        Poles = blend[0]
+        Weights = blend[1]
 
         if fp.reverse == False:
             fp.Scale_1 = blend[2]
@@ -5352,21 +6057,12 @@ class ControlPoly6_FilletBezier:
             fp.Scale_1 = blend[3]
             fp.Scale_2 = blend[2]
 
-        # prepare the lines to draw the polyline
-        Leg0 = Part.LineSegment(fp.Poles[0], fp.Poles[1])
-        Leg1 = Part.LineSegment(fp.Poles[1], fp.Poles[2])
-        Leg2 = Part.LineSegment(fp.Poles[2], fp.Poles[3])
-        Leg3 = Part.LineSegment(fp.Poles[3], fp.Poles[4])
-        Leg4 = Part.LineSegment(fp.Poles[4], fp.Poles[5])
-        # set the polygon legs property
-        fp.Legs = [Leg0, Leg1, Leg2, Leg3, Leg4]
-        # define the shape for visualization
-        fp.Shape = Part.Shape(fp.Legs)
+        commitNet(fp, Poles, Weights)
 
 
 class Point_onCurve:
     def __init__(self, obj, NL_Curve, u):
-        latest_version = "0.01"  # must match in onDocumentRestored()
+        latest_version = "0.02"  # must match in onDocumentRestored()
 
         # original attribute set before versioning of classes
         """
@@ -5388,8 +6084,11 @@ class Point_onCurve:
         obj.addProperty("App::PropertyFloatConstraint", "u", "C1 - Inputs", "parameter along curve").u = (u, lower, upper, step)
 
         obj.addProperty("App::PropertyBool", "reverse", "C1 - Inputs", "reverse the parameter direction").reverse = False
+        obj.addProperty("App::PropertyBool", "arc_length", "C1 - Inputs", "u is a fraction of the curve length instead of a curve parameter").arc_length = False
         # outputs
         obj.addProperty("App::PropertyVector", "Position", "C2 - Outputs", "position vector").Position
+        obj.addProperty("App::PropertyFloat", "Parameter", "C2 - Outputs", "curve parameter of the point").Parameter
+        obj.setEditorMode("Parameter", 1)
         # additional object identifiers
         obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "Point_onCurve"
         obj.setEditorMode("object_type", 1)
@@ -5403,14 +6102,14 @@ class Point_onCurve:
     def onDocumentRestored(self, obj):
         # Migration function to set attributes between object versions. Preserves user data in object.
         # print("onDocumentRestored() invoked")
-        latest_version = "0.01"  # must match in __init__
+        latest_version = "0.02"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update == True:
@@ -5429,6 +6128,15 @@ class Point_onCurve:
             else:
                 old_reverse = False
 
+            if hasattr(obj, "arc_length"):
+                old_arc_length = obj.arc_length
+                obj.removeProperty("arc_length")
+            else:
+                old_arc_length = False
+
+            if hasattr(obj, "Parameter"):
+                obj.removeProperty("Parameter")
+
             if hasattr(obj, "object_type"):
                 obj.removeProperty("object_type")
             if hasattr(obj, "object_version"):
@@ -5447,8 +6155,11 @@ class Point_onCurve:
             obj.addProperty("App::PropertyFloatConstraint", "u", "C1 - Inputs", "parameter along curve").u = (old_u, lower, upper, step)
 
             obj.addProperty("App::PropertyBool", "reverse", "C1 - Inputs", "reverse the parameter direction").reverse = old_reverse
+            obj.addProperty("App::PropertyBool", "arc_length", "C1 - Inputs", "u is a fraction of the curve length instead of a curve parameter").arc_length = old_arc_length
             # outputs
             obj.addProperty("App::PropertyVector", "Position", "C2 - Outputs", "position vector").Position
+            obj.addProperty("App::PropertyFloat", "Parameter", "C2 - Outputs", "curve parameter of the point").Parameter
+            obj.setEditorMode("Parameter", 1)
             # additional object identifiers
             obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "Point_onCurve"
             obj.setEditorMode("object_type", 1)
@@ -5462,7 +6173,7 @@ class Point_onCurve:
 
     def onChanged(self, fp, prop):
         # print("onChanged invoked")
-        if prop == "reverse":
+        if prop == "reverse" or prop == "arc_length":
             fp.recompute()
 
     def execute(self, fp):
@@ -5477,22 +6188,196 @@ class Point_onCurve:
         else:
             u = fp.u
 
+        if fp.arc_length == True:
+            # the same fraction of the length from either end, so reverse applies first
+            u = float(arcLengthParameters(fp.NL_Curve, [u])[0])
+
+        fp.Parameter = u
         fp.Position = fp.NL_Curve.Shape.Curve.value(u)
         fp.Shape = Part.Point(fp.Position).toShape()
 
 
-### point derived objects (+point to input)
-class ControlPoly4_segment:
-    def __init__(self, obj, NL_Curve, Point_onCurve_0, Point_onCurve_1):
-        latest_version = "0.01"  # must match in onDocumentRestored()
-
-        # original attribute set before versioning of classes
-        """
-        FreeCAD.Console.PrintMessage("\nControlPoly4_segment class Init\n")
-        obj.addProperty("App::PropertyLink","NL_Curve","ControlPoly4_segment","reference Curve").NL_Curve = NL_Curve
-        obj.addProperty("App::PropertyLink","Point_onCurve_0","ControlPoly4_segment","first reference point").Point_onCurve_0 = Point_onCurve_0
-        obj.addProperty("App::PropertyLink","Point_onCurve_1","ControlPoly4_segment","second reference point").Point_onCurve_1 = Point_onCurve_1
-        obj.addProperty("Part::PropertyGeometryList","Legs","ControlPoly4_3L","control segments").Legs
+class PointArray_onCurve:  # many points on one curve, from a list of parameters or a spacing rule
+    # all the points are evaluated in one pass (see curvePoints() and arcLengthParameters()). the Shape is a single compound of vertices,
+    # in the order of Positions: Vertex1 is Positions[0]. SilkPose can reference the vertices directly,
+    # ControlPoly4_segment picks its points with index_0 / index_1
+    def PointArray_onCurve_Attributes(self, obj, NL_Curve, spacing, u_list, count, u_start, u_end, reverse, arc_length, object_version):
+        # current attribute set
+        # inputs
+        obj.addProperty("App::PropertyLink", "NL_Curve", "C1 - Inputs", "reference curve").NL_Curve = NL_Curve
+        obj.addProperty("App::PropertyEnumeration", "spacing", "C1 - Inputs", "'list': the parameters of u_list. 'uniform': count parameters from u_start to u_end")
+        obj.spacing = ["list", "uniform"]
+        obj.spacing = spacing
+        obj.addProperty("App::PropertyFloatList", "u_list", "C1 - Inputs", "parameters along curve, for 'list' spacing").u_list = u_list
+        obj.addProperty("App::PropertyIntegerConstraint", "count", "C1 - Inputs", "number of points, for 'uniform' spacing").count = (count, 2, 10000, 1)
+        obj.addProperty("App::PropertyFloatConstraint", "u_start", "C1 - Inputs", "first parameter, for 'uniform' spacing").u_start = (u_start, 0.0, 1.0, 0.01)
+        obj.addProperty("App::PropertyFloatConstraint", "u_end", "C1 - Inputs", "last parameter, for 'uniform' spacing").u_end = (u_end, 0.0, 1.0, 0.01)
+        obj.addProperty("App::PropertyBool", "reverse", "C1 - Inputs", "reverse the parameter direction").reverse = reverse
+        obj.addProperty("App::PropertyBool", "arc_length", "C1 - Inputs", "parameters are fractions of the curve length instead of curve parameters").arc_length = arc_length
+        # outputs
+        obj.addProperty("App::PropertyFloatList", "Parameters", "C2 - Outputs", "curve parameter of each point").Parameters
+        obj.setEditorMode("Parameters", 1)
+        obj.addProperty("App::PropertyVectorList", "Positions", "C2 - Outputs", "position vectors").Positions
+        obj.setEditorMode("Positions", 1)
+        # additional object identifiers
+        obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "PointArray_onCurve"
+        obj.setEditorMode("object_type", 1)
+        obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = object_version
+        obj.setEditorMode("object_version", 1)
+        obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
+        obj.setEditorMode("internalName", 1)
+        return
+
+    def __init__(self, obj, NL_Curve, u_list):
+        latest_version = "0.02"  # must match in onDocumentRestored()
+        if u_list:
+            self.PointArray_onCurve_Attributes(obj, NL_Curve, "list", u_list, max(2, len(u_list)), 0.0, 1.0, False, False, latest_version)
+        else:
+            self.PointArray_onCurve_Attributes(obj, NL_Curve, "uniform", [], 5, 0.0, 1.0, False, False, latest_version)
+        obj.Proxy = self
+
+    def onDocumentRestored(self, obj):
+        # Migration function to set attributes between object versions. Preserves user data in object.
+        latest_version = "0.02"  # must match in __init__
+        if not obj.object_version == latest_version:
+            log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
+
+            # capture, then delete attribute values in user input fields
+            old_NL_Curve = obj.NL_Curve
+            old_spacing = obj.spacing
+            old_u_list = obj.u_list
+            old_count = obj.count
+            old_u_start = obj.u_start
+            old_u_end = obj.u_end
+            old_reverse = obj.reverse
+            if hasattr(obj, "arc_length"):
+                old_arc_length = obj.arc_length
+            else:
+                old_arc_length = False
+            for prop in obj.PropertiesList:
+                if obj.getGroupOfProperty(prop) in ["C1 - Inputs", "C2 - Outputs", "C3 - Identifiers"]:
+                    obj.removeProperty(prop)
+
+            # re/create all attributes in current version format
+            self.PointArray_onCurve_Attributes(obj, old_NL_Curve, old_spacing, old_u_list, old_count, old_u_start, old_u_end, old_reverse, old_arc_length, latest_version)
+
+            # need to recompute otherwise the positions remain unpopulated
+            obj.recompute()
+
+    def onChanged(self, fp, prop):
+        if prop == "reverse" or prop == "arc_length":
+            fp.recompute()
+
+    def parameters(self, fp):
+        # curve parameters of the points, before reverse
+        if fp.spacing == "uniform":
+            return np.linspace(fp.u_start, fp.u_end, fp.count)
+        u = np.array(fp.u_list, dtype=float)
+        if np.any((u < 0.0) | (u > 1.0)):
+            log_kernel.warning(fp.Label, ": parameters outside of 0.0 - 1.0 are clamped")
+        return np.clip(u, 0.0, 1.0)
+
+    def execute(self, fp):
+        """Do something when doing a recomputation, this method is mandatory"""
+        if "Restore" in fp.State:
+            return
+
+        u = self.parameters(fp)
+        if fp.reverse == True:
+            u = 1.0 - u
+        if fp.arc_length == True:
+            # one table lookup for all the points, see arcLengthParameters()
+            u = arcLengthParameters(fp.NL_Curve, u)
+
+        points = curvePoints(fp.NL_Curve, u)
+        Positions = [Base.Vector(*p) for p in points.tolist()]
+        fp.Parameters = u.tolist()
+        fp.Positions = Positions
+        fp.Shape = Part.makeCompound([Part.Vertex(p) for p in Positions])
+
+
+class CurvatureComb:  # curvature comb of a CubicCurve_4 / 6, or of a 4 or 6 pole poly (ControlPoly6_FilletBezier ...)
+    # evaluated from the poles with the cached basis (see curveCurvature()), so the comb follows the curve during sketch
+    # drags without waiting for the OCC curve. the Shape is one compound: the teeth as a single zigzag wire, and the
+    # envelope through the tooth tips
+    def CurvatureComb_Attributes(self, obj, NL_Curve, samples, scale, plot, object_version):
+        # current attribute set
+        # inputs
+        obj.addProperty("App::PropertyLink", "NL_Curve", "C1 - Inputs", "curve or poly").NL_Curve = NL_Curve
+        obj.addProperty("App::PropertyIntegerConstraint", "samples", "C1 - Inputs", "number of teeth").samples = (samples, 3, 2000, 1)
+        obj.addProperty("App::PropertyFloat", "scale", "C1 - Inputs", "tooth length per unit of the plotted value").scale = scale
+        obj.addProperty("App::PropertyEnumeration", "plot", "C1 - Inputs", "'curvature', or its derivative along the curve 'dC/ds'")
+        obj.plot = ["curvature", "dC/ds"]
+        obj.plot = plot
+        # outputs
+        obj.addProperty("App::PropertyFloatList", "Curvature", "C2 - Outputs", "signed curvature at each tooth").Curvature
+        obj.setEditorMode("Curvature", 1)
+        obj.addProperty("App::PropertyFloatList", "CurvatureDerivative", "C2 - Outputs", "dC/ds at each tooth").CurvatureDerivative
+        obj.setEditorMode("CurvatureDerivative", 1)
+        obj.addProperty("App::PropertyFloat", "MaxCurvature", "C2 - Outputs", "largest absolute curvature").MaxCurvature
+        obj.setEditorMode("MaxCurvature", 1)
+        # additional object identifiers
+        obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "CurvatureComb"
+        obj.setEditorMode("object_type", 1)
+        obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = object_version
+        obj.setEditorMode("object_version", 1)
+        obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
+        obj.setEditorMode("internalName", 1)
+        return
+
+    def __init__(self, obj, NL_Curve, scale):
+        latest_version = "0.01"  # must match in onDocumentRestored()
+        self.CurvatureComb_Attributes(obj, NL_Curve, 65, scale, "curvature", latest_version)
+        obj.Proxy = self
+
+    def onDocumentRestored(self, obj):
+        # Migration function to set attributes between object versions. Preserves user data in object.
+        latest_version = "0.01"  # must match in __init__
+        if not obj.object_version == latest_version:
+            log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
+
+    def execute(self, fp):
+        """Do something when doing a recomputation, this method is mandatory"""
+        if "Restore" in fp.State:
+            return
+
+        data = polyCurveData(fp.NL_Curve)
+        if data is None:
+            log_kernel.error(fp.Label, ": ", fp.NL_Curve.Label, " is not a Silk curve, nor a 4 or 6 pole poly")
+            fake_name_to_trigger_error = please_read_message_above
+
+        samples = fp.samples
+        if Silk_preview.sketchInEdit(fp.Document):
+            # a sketch is being dragged: a coarser comb, refined on the next recompute after the edit
+            samples = min(samples, 2 * Silk_preview.settings()[1] + 1)
+        points, normals, k, dcds = curveCurvature(data, samples)
+        values = k if fp.plot == "curvature" else dcds
+        # teeth point away from the center of curvature
+        tips = points - fp.scale * values[:, None] * normals
+
+        zigzag = []
+        for i in range(samples):
+            ends = [points[i], tips[i]] if i % 2 == 0 else [tips[i], points[i]]
+            zigzag += [Base.Vector(*p) for p in np.array(ends).tolist()]
+        envelope = [Base.Vector(*p) for p in tips.tolist()]
+        fp.Curvature = k.tolist()
+        fp.CurvatureDerivative = dcds.tolist()
+        fp.MaxCurvature = float(np.max(np.abs(k)))
+        fp.Shape = Part.makeCompound([Part.makePolygon(zigzag), Part.makePolygon(envelope)])
+
+
+### point derived objects (+point to input)
+class ControlPoly4_segment:
+    def __init__(self, obj, NL_Curve, Point_onCurve_0, Point_onCurve_1, index_0=0, index_1=0):
+        latest_version = "0.02"  # must match in onDocumentRestored()
+
+        # original attribute set before versioning of classes
+        """
+        FreeCAD.Console.PrintMessage("\nControlPoly4_segment class Init\n")
+        obj.addProperty("App::PropertyLink","NL_Curve","ControlPoly4_segment","reference Curve").NL_Curve = NL_Curve
+        obj.addProperty("App::PropertyLink","Point_onCurve_0","ControlPoly4_segment","first reference point").Point_onCurve_0 = Point_onCurve_0
+        obj.addProperty("App::PropertyLink","Point_onCurve_1","ControlPoly4_segment","second reference point").Point_onCurve_1 = Point_onCurve_1
+        obj.addProperty("Part::PropertyGeometryList","Legs","ControlPoly4_3L","control segments").Legs
         obj.addProperty("App::PropertyVectorList","Poles","ControlPoly4_3L","Poles").Poles
         obj.addProperty("App::PropertyFloatList","Weights","ControlPoly4_3L","Weights").Weights = [1.0,1.0,1.0,1.0]
         obj.Proxy = self
@@ -5502,6 +6387,8 @@ class ControlPoly4_segment:
         obj.addProperty("App::PropertyLink", "NL_Curve", "C1 - Inputs", "reference curve").NL_Curve = NL_Curve
         obj.addProperty("App::PropertyLink", "Point_onCurve_0", "C1 - Inputs", "segment start point").Point_onCurve_0 = Point_onCurve_0
         obj.addProperty("App::PropertyLink", "Point_onCurve_1", "C1 - Inputs", "segment end point").Point_onCurve_1 = Point_onCurve_1
+        obj.addProperty("App::PropertyInteger", "index_0", "C1 - Inputs", "start point index, when Point_onCurve_0 is a PointArray_onCurve").index_0 = index_0
+        obj.addProperty("App::PropertyInteger", "index_1", "C1 - Inputs", "end point index, when Point_onCurve_1 is a PointArray_onCurve").index_1 = index_1
         obj.addProperty("App::PropertyBool", "reverse", "C1 - Inputs", "reverse the parameter direction").reverse = False
         # outputs
         obj.addProperty("Part::PropertyGeometryList", "Legs", "C2 - Outputs", "control segments").Legs
@@ -5520,14 +6407,14 @@ class ControlPoly4_segment:
     def onDocumentRestored(self, obj):
         # Migration function to set attributes between object versions. Preserves user data in object.
         # print("onDocumentRestored() invoked")
-        latest_version = "0.01"  # must match in __init__
+        latest_version = "0.02"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update == True:
@@ -5551,6 +6438,18 @@ class ControlPoly4_segment:
             else:
                 old_reverse = False
 
+            if hasattr(obj, "index_0"):
+                old_index_0 = obj.index_0
+                obj.removeProperty("index_0")
+            else:
+                old_index_0 = 0
+
+            if hasattr(obj, "index_1"):
+                old_index_1 = obj.index_1
+                obj.removeProperty("index_1")
+            else:
+                old_index_1 = 0
+
             if hasattr(obj, "object_type"):
                 obj.removeProperty("object_type")
             if hasattr(obj, "object_version"):
@@ -5565,6 +6464,8 @@ class ControlPoly4_segment:
             obj.addProperty("App::PropertyLink", "NL_Curve", "C1 - Inputs", "reference curve").NL_Curve = old_NL_Curve
             obj.addProperty("App::PropertyLink", "Point_onCurve_0", "C1 - Inputs", "segment start point").Point_onCurve_0 = old_Point_onCurve_0
             obj.addProperty("App::PropertyLink", "Point_onCurve_1", "C1 - Inputs", "segment end point").Point_onCurve_1 = old_Point_onCurve_1
+            obj.addProperty("App::PropertyInteger", "index_0", "C1 - Inputs", "start point index, when Point_onCurve_0 is a PointArray_onCurve").index_0 = old_index_0
+            obj.addProperty("App::PropertyInteger", "index_1", "C1 - Inputs", "end point index, when Point_onCurve_1 is a PointArray_onCurve").index_1 = old_index_1
             obj.addProperty("App::PropertyBool", "reverse", "C1 - Inputs", "reverse the parameter direction").reverse = old_reverse
             # outputs
             obj.addProperty("Part::PropertyGeometryList", "Legs", "C2 - Outputs", "control segments").Legs
@@ -5583,6 +6484,8 @@ class ControlPoly4_segment:
 
     def onChanged(self, fp, prop):
         # print("onChanged invoked")
+        if prop == "Visibility":
+            showNet(fp)
         if prop == "reverse":
             fp.recompute()
 
@@ -5596,9 +6499,9 @@ class ControlPoly4_segment:
         # get the curve
         curve = fp.NL_Curve.Shape.Curve
         # get the u span
-        u0 = curve.parameter(fp.Point_onCurve_0.Position)
+        u0 = pointParameter(fp.Point_onCurve_0, fp.index_0, fp.NL_Curve, curve)
         # print(u0)
-        u1 = curve.parameter(fp.Point_onCurve_1.Position)
+        u1 = pointParameter(fp.Point_onCurve_1, fp.index_1, fp.NL_Curve, curve)
         # print(u1)
         if u0 < u1:
             a = u0
@@ -5610,26 +6513,145 @@ class ControlPoly4_segment:
         curve.segment(a, b)
 
         if fp.reverse == False:
-            fp.Poles = curve.getPoles()
-            fp.Weights = curve.getWeights()
+            Poles = curve.getPoles()
+            Weights = curve.getWeights()
         else:
-            fp.Poles = curve.getPoles()[::-1]
-            fp.Weights = curve.getWeights()[::-1]
+            Poles = curve.getPoles()[::-1]
+            Weights = curve.getWeights()[::-1]
 
-        # prepare visualization elements
-        p00 = fp.Poles[0]
-        p01 = fp.Poles[1]
-        p20 = fp.Poles[2]
-        p21 = fp.Poles[3]
+        commitNet(fp, Poles, Weights)
 
-        # prepare the lines to draw the polyline
-        Leg0 = Part.LineSegment(p00, p01)
-        Leg1 = Part.LineSegment(p01, p20)
-        Leg2 = Part.LineSegment(p20, p21)
-        # set the polygon legs property
-        fp.Legs = [Leg0, Leg1, Leg2]
-        # define the shape for visualization
-        fp.Shape = Part.Shape(fp.Legs)
+
+class ControlPoly4_segments:  # made from a curve and a list of cuts. all the pieces between the cuts in one object
+    # cuts are the parameters of u_cuts, and the points of the Point_onCurve / PointArray_onCurve objects of cut_points.
+    # the curve is cut once at all of them (see curvePieces()). the pieces are held end to end in Poles / Weights:
+    # piece k is Poles[3 * k : 3 * k + 4]. ControlPoly4_piece makes one of them a standalone ControlPoly4 for grids
+    def ControlPoly4_segments_Attributes(self, obj, NL_Curve, cut_points, u_cuts, arc_length, reverse, object_version):
+        # current attribute set
+        # inputs
+        obj.addProperty("App::PropertyLink", "NL_Curve", "C1 - Inputs", "reference curve").NL_Curve = NL_Curve
+        obj.addProperty("App::PropertyLinkList", "cut_points", "C1 - Inputs", "Point_onCurve / PointArray_onCurve objects to cut at").cut_points = cut_points
+        obj.addProperty("App::PropertyFloatList", "u_cuts", "C1 - Inputs", "parameters along curve to cut at").u_cuts = u_cuts
+        obj.addProperty("App::PropertyBool", "arc_length", "C1 - Inputs", "u_cuts are fractions of the curve length instead of curve parameters").arc_length = arc_length
+        obj.addProperty("App::PropertyBool", "reverse", "C1 - Inputs", "reverse the parameter direction").reverse = reverse
+        # outputs
+        obj.addProperty("Part::PropertyGeometryList", "Legs", "C2 - Outputs", "control segments").Legs
+        obj.addProperty("App::PropertyVectorList", "Poles", "C2 - Outputs", "Poles of all pieces, end to end").Poles
+        obj.addProperty("App::PropertyFloatList", "Weights", "C2 - Outputs", "Weights of all pieces, end to end").Weights
+        obj.addProperty("App::PropertyFloatList", "Cuts", "C2 - Outputs", "curve parameters of the piece ends, including 0.0 and 1.0").Cuts
+        obj.setEditorMode("Cuts", 1)
+        obj.addProperty("App::PropertyInteger", "Pieces", "C2 - Outputs", "number of pieces").Pieces
+        obj.setEditorMode("Pieces", 1)
+        # additional object identifiers
+        obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlPoly4_segments"
+        obj.setEditorMode("object_type", 1)
+        obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = object_version
+        obj.setEditorMode("object_version", 1)
+        obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
+        obj.setEditorMode("internalName", 1)
+        return
+
+    def __init__(self, obj, NL_Curve, cut_points, u_cuts):
+        latest_version = "0.01"  # must match in onDocumentRestored()
+        self.ControlPoly4_segments_Attributes(obj, NL_Curve, cut_points, u_cuts, False, False, latest_version)
+        obj.Proxy = self
+
+    def onDocumentRestored(self, obj):
+        # Migration function to set attributes between object versions. Preserves user data in object.
+        latest_version = "0.01"  # must match in __init__
+        if not obj.object_version == latest_version:
+            log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
+
+    def onChanged(self, fp, prop):
+        if prop == "Visibility":
+            showNet(fp)
+        if prop == "reverse" or prop == "arc_length":
+            fp.recompute()
+
+    def cuts(self, fp):
+        # sorted curve parameters of all cuts, with the curve ends
+        curve = fp.NL_Curve.Shape.Curve
+        u = np.clip(np.array(fp.u_cuts, dtype=float), 0.0, 1.0)
+        if fp.arc_length == True:
+            u = arcLengthParameters(fp.NL_Curve, u)
+        cuts = u.tolist()
+        for point in fp.cut_points:
+            if hasattr(point, "Positions"):
+                cuts += [pointParameter(point, i, fp.NL_Curve, curve) for i in range(len(point.Positions))]
+            else:
+                cuts.append(pointParameter(point, 0, fp.NL_Curve, curve))
+        cuts = np.unique(np.clip(np.array(cuts + [0.0, 1.0], dtype=float), 0.0, 1.0))
+        # cuts closer than the parameter resolution would make empty pieces
+        return cuts[np.concatenate([[True], np.diff(cuts) > 1.0e-9])].tolist()
+
+    def execute(self, fp):
+        """Do something when doing a recomputation, this method is mandatory"""
+        if "Restore" in fp.State:
+            return
+
+        cuts = self.cuts(fp)
+        cuts[-1] = 1.0  # the last cut may have been merged into the curve end
+        pieces = curvePieces(fp.NL_Curve, cuts)
+        if isinstance(pieces, str):
+            log_poly.error(fp.Name, ", labeled ", fp.Label, "\n", pieces, "\n", "add a cut at the knots of the curve (1/3, 2/3 on CubicCurve_6)")
+            fake_name_to_trigger_error = please_read_message_above
+
+        if fp.reverse == True:
+            pieces = [[poles[::-1], weights[::-1]] for poles, weights in pieces[::-1]]
+
+        # end to end: each piece after the first starts on the last pole of the previous one
+        Poles = pieces[0][0][:1] + [p for poles, weights in pieces for p in poles[1:]]
+        Weights = pieces[0][1][:1] + [w for poles, weights in pieces for w in weights[1:]]
+        fp.Cuts = cuts
+        fp.Pieces = len(pieces)
+        commitNet(fp, Poles, Weights)
+
+
+class ControlPoly4_piece:  # one piece of a ControlPoly4_segments, as a standalone ControlPoly4
+    def ControlPoly4_piece_Attributes(self, obj, Segments, index, object_version):
+        # current attribute set
+        # inputs
+        obj.addProperty("App::PropertyLink", "Segments", "C1 - Inputs", "ControlPoly4_segments to take the piece from").Segments = Segments
+        obj.addProperty("App::PropertyInteger", "index", "C1 - Inputs", "piece index, 0 is the first piece").index = index
+        # outputs
+        obj.addProperty("Part::PropertyGeometryList", "Legs", "C2 - Outputs", "control segments").Legs
+        obj.addProperty("App::PropertyVectorList", "Poles", "C2 - Outputs", "Poles").Poles
+        obj.addProperty("App::PropertyFloatList", "Weights", "C2 - Outputs", "Weights").Weights = [1.0, 1.0, 1.0, 1.0]
+        # additional object identifiers
+        obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlPoly4_piece"
+        obj.setEditorMode("object_type", 1)
+        obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = object_version
+        obj.setEditorMode("object_version", 1)
+        obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
+        obj.setEditorMode("internalName", 1)
+        return
+
+    def __init__(self, obj, Segments, index):
+        latest_version = "0.01"  # must match in onDocumentRestored()
+        self.ControlPoly4_piece_Attributes(obj, Segments, index, latest_version)
+        obj.Proxy = self
+
+    def onDocumentRestored(self, obj):
+        # Migration function to set attributes between object versions. Preserves user data in object.
+        latest_version = "0.01"  # must match in __init__
+        if not obj.object_version == latest_version:
+            log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
+
+    def onChanged(self, fp, prop):
+        if prop == "Visibility":
+            showNet(fp)
+
+    def execute(self, fp):
+        """Do something when doing a recomputation, this method is mandatory"""
+        if "Restore" in fp.State:
+            return
+
+        if not 0 <= fp.index < fp.Segments.Pieces:
+            log_poly.error(fp.Name, ", labeled ", fp.Label, "\n", "index ", fp.index, " is out of range, ", fp.Segments.Label, " has ", fp.Segments.Pieces, " pieces")
+            fake_name_to_trigger_error = please_read_message_above
+
+        start = 3 * fp.index
+        commitNet(fp, fp.Segments.Poles[start : start + 4], fp.Segments.Weights[start : start + 4])
 
 
 ### NURBS surfaces (+grid to input)
@@ -5666,11 +6688,11 @@ class CubicSurface_44:
         latest_version = "0.01"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update == True:
@@ -5717,6 +6739,20 @@ class CubicSurface_44:
         if prop == "reverse":
             fp.recompute()
 
+    def gatherInputs(self, fp):
+        # snapshot of everything execute() needs from the document, as plain data.
+        # also used by Silk_scheduler to build the shape away from the document objects
+        grid = GridArray.fromGrid(fp.Grid, 4)
+        if fp.reverse == True:
+            # invert u, keep v
+            grid = grid.reversedU()
+        return grid.data("Bezier_Bicubic_surf")
+
+    def commitOutputs(self, fp, shape, data):
+        fp.Shape = shape
+        # tessellation settings for the new surface, see Silk_lod.py
+        Silk_lod.update(fp, [data])
+
     def execute(self, fp):
         """Do something when doing a recomputation, this method is mandatory"""
         # print("execute() invoked")
@@ -5724,50 +6760,14 @@ class CubicSurface_44:
             # print("Restore in fp.state")
             return  # or do some special thing
 
-        # get the poles list from the poly. legacy shape function wants 'homogeneous' coords as [[x,y,z],w]
-        if fp.reverse == False:
-            WeightedPoles = [
-                [fp.Grid.Poles[0], fp.Grid.Weights[0]],
-                [fp.Grid.Poles[1], fp.Grid.Weights[1]],
-                [fp.Grid.Poles[2], fp.Grid.Weights[2]],
-                [fp.Grid.Poles[3], fp.Grid.Weights[3]],
-                [fp.Grid.Poles[4], fp.Grid.Weights[4]],
-                [fp.Grid.Poles[5], fp.Grid.Weights[5]],
-                [fp.Grid.Poles[6], fp.Grid.Weights[6]],
-                [fp.Grid.Poles[7], fp.Grid.Weights[7]],
-                [fp.Grid.Poles[8], fp.Grid.Weights[8]],
-                [fp.Grid.Poles[9], fp.Grid.Weights[9]],
-                [fp.Grid.Poles[10], fp.Grid.Weights[10]],
-                [fp.Grid.Poles[11], fp.Grid.Weights[11]],
-                [fp.Grid.Poles[12], fp.Grid.Weights[12]],
-                [fp.Grid.Poles[13], fp.Grid.Weights[13]],
-                [fp.Grid.Poles[14], fp.Grid.Weights[14]],
-                [fp.Grid.Poles[15], fp.Grid.Weights[15]],
-            ]
+        data = self.gatherInputs(fp)
+        if Silk_preview.isActive(fp):
+            # a sketch is being dragged: draw a sampled preview, the shape is built when the edit settles
+            Silk_preview.preview(fp, [data])
+            return
 
-        else:
-            # invert u, keep v
-            WeightedPoles = [
-                [fp.Grid.Poles[3], fp.Grid.Weights[3]],
-                [fp.Grid.Poles[2], fp.Grid.Weights[2]],
-                [fp.Grid.Poles[1], fp.Grid.Weights[2]],
-                [fp.Grid.Poles[0], fp.Grid.Weights[0]],
-                [fp.Grid.Poles[7], fp.Grid.Weights[7]],
-                [fp.Grid.Poles[6], fp.Grid.Weights[6]],
-                [fp.Grid.Poles[5], fp.Grid.Weights[5]],
-                [fp.Grid.Poles[4], fp.Grid.Weights[4]],
-                [fp.Grid.Poles[11], fp.Grid.Weights[11]],
-                [fp.Grid.Poles[10], fp.Grid.Weights[10]],
-                [fp.Grid.Poles[9], fp.Grid.Weights[9]],
-                [fp.Grid.Poles[8], fp.Grid.Weights[8]],
-                [fp.Grid.Poles[15], fp.Grid.Weights[15]],
-                [fp.Grid.Poles[14], fp.Grid.Weights[14]],
-                [fp.Grid.Poles[13], fp.Grid.Weights[13]],
-                [fp.Grid.Poles[12], fp.Grid.Weights[12]],
-            ]
-
-        # the legacy function below sets the degree and knot vector
-        fp.Shape = Bezier_Bicubic_surf(WeightedPoles).toShape()
+        # the legacy function called by buildShapeFromData() sets the degree and knot vector
+        self.commitOutputs(fp, buildShapeFromData(data), data)
 
 
 class CubicSurface_66:
@@ -5804,11 +6804,11 @@ class CubicSurface_66:
         latest_version = "0.01"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update == True:
@@ -5841,6 +6841,20 @@ class CubicSurface_66:
         if prop == "reverse":
             fp.recompute()
 
+    def gatherInputs(self, fp):
+        # snapshot of everything execute() needs from the document, as plain data.
+        # also used by Silk_scheduler to build the shape away from the document objects
+        grid = GridArray.fromGrid(fp.Grid, 6)
+        if fp.reverse == True:
+            # invert u, keep v
+            grid = grid.reversedU()
+        return grid.data("NURBS_Cubic_66_surf")
+
+    def commitOutputs(self, fp, shape, data):
+        fp.Shape = shape
+        # tessellation settings for the new surface, see Silk_lod.py
+        Silk_lod.update(fp, [data])
+
     def execute(self, fp):
         """Do something when doing a recomputation, this method is mandatory"""
         # print("execute() invoked")
@@ -5848,89 +6862,14 @@ class CubicSurface_66:
             # print("Restore in fp.state")
             return  # or do some special thing
 
-        # get the poles list from the poly. legacy shape function wants 'homogeneous' coords as [[x,y,z],w]
-        if fp.reverse == False:
-            WeightedPoles = [
-                [fp.Grid.Poles[0], fp.Grid.Weights[0]],
-                [fp.Grid.Poles[1], fp.Grid.Weights[1]],
-                [fp.Grid.Poles[2], fp.Grid.Weights[2]],
-                [fp.Grid.Poles[3], fp.Grid.Weights[3]],
-                [fp.Grid.Poles[4], fp.Grid.Weights[4]],
-                [fp.Grid.Poles[5], fp.Grid.Weights[5]],
-                [fp.Grid.Poles[6], fp.Grid.Weights[6]],
-                [fp.Grid.Poles[7], fp.Grid.Weights[7]],
-                [fp.Grid.Poles[8], fp.Grid.Weights[8]],
-                [fp.Grid.Poles[9], fp.Grid.Weights[9]],
-                [fp.Grid.Poles[10], fp.Grid.Weights[10]],
-                [fp.Grid.Poles[11], fp.Grid.Weights[11]],
-                [fp.Grid.Poles[12], fp.Grid.Weights[12]],
-                [fp.Grid.Poles[13], fp.Grid.Weights[13]],
-                [fp.Grid.Poles[14], fp.Grid.Weights[14]],
-                [fp.Grid.Poles[15], fp.Grid.Weights[15]],
-                [fp.Grid.Poles[16], fp.Grid.Weights[16]],
-                [fp.Grid.Poles[17], fp.Grid.Weights[17]],
-                [fp.Grid.Poles[18], fp.Grid.Weights[18]],
-                [fp.Grid.Poles[19], fp.Grid.Weights[19]],
-                [fp.Grid.Poles[20], fp.Grid.Weights[20]],
-                [fp.Grid.Poles[21], fp.Grid.Weights[21]],
-                [fp.Grid.Poles[22], fp.Grid.Weights[22]],
-                [fp.Grid.Poles[23], fp.Grid.Weights[23]],
-                [fp.Grid.Poles[24], fp.Grid.Weights[24]],
-                [fp.Grid.Poles[25], fp.Grid.Weights[25]],
-                [fp.Grid.Poles[26], fp.Grid.Weights[26]],
-                [fp.Grid.Poles[27], fp.Grid.Weights[27]],
-                [fp.Grid.Poles[28], fp.Grid.Weights[28]],
-                [fp.Grid.Poles[29], fp.Grid.Weights[29]],
-                [fp.Grid.Poles[30], fp.Grid.Weights[30]],
-                [fp.Grid.Poles[31], fp.Grid.Weights[31]],
-                [fp.Grid.Poles[32], fp.Grid.Weights[32]],
-                [fp.Grid.Poles[33], fp.Grid.Weights[33]],
-                [fp.Grid.Poles[34], fp.Grid.Weights[34]],
-                [fp.Grid.Poles[35], fp.Grid.Weights[35]],
-            ]
-        else:
-            # invert u, keep v
-            WeightedPoles = [
-                [fp.Grid.Poles[5], fp.Grid.Weights[5]],
-                [fp.Grid.Poles[4], fp.Grid.Weights[4]],
-                [fp.Grid.Poles[3], fp.Grid.Weights[3]],
-                [fp.Grid.Poles[2], fp.Grid.Weights[2]],
-                [fp.Grid.Poles[1], fp.Grid.Weights[2]],
-                [fp.Grid.Poles[0], fp.Grid.Weights[0]],
-                [fp.Grid.Poles[11], fp.Grid.Weights[11]],
-                [fp.Grid.Poles[10], fp.Grid.Weights[10]],
-                [fp.Grid.Poles[9], fp.Grid.Weights[9]],
-                [fp.Grid.Poles[8], fp.Grid.Weights[8]],
-                [fp.Grid.Poles[7], fp.Grid.Weights[7]],
-                [fp.Grid.Poles[6], fp.Grid.Weights[6]],
-                [fp.Grid.Poles[17], fp.Grid.Weights[17]],
-                [fp.Grid.Poles[16], fp.Grid.Weights[16]],
-                [fp.Grid.Poles[15], fp.Grid.Weights[15]],
-                [fp.Grid.Poles[14], fp.Grid.Weights[14]],
-                [fp.Grid.Poles[13], fp.Grid.Weights[13]],
-                [fp.Grid.Poles[12], fp.Grid.Weights[12]],
-                [fp.Grid.Poles[23], fp.Grid.Weights[23]],
-                [fp.Grid.Poles[22], fp.Grid.Weights[22]],
-                [fp.Grid.Poles[21], fp.Grid.Weights[21]],
-                [fp.Grid.Poles[20], fp.Grid.Weights[20]],
-                [fp.Grid.Poles[19], fp.Grid.Weights[19]],
-                [fp.Grid.Poles[18], fp.Grid.Weights[18]],
-                [fp.Grid.Poles[29], fp.Grid.Weights[29]],
-                [fp.Grid.Poles[28], fp.Grid.Weights[28]],
-                [fp.Grid.Poles[27], fp.Grid.Weights[27]],
-                [fp.Grid.Poles[26], fp.Grid.Weights[26]],
-                [fp.Grid.Poles[25], fp.Grid.Weights[25]],
-                [fp.Grid.Poles[24], fp.Grid.Weights[24]],
-                [fp.Grid.Poles[35], fp.Grid.Weights[35]],
-                [fp.Grid.Poles[34], fp.Grid.Weights[34]],
-                [fp.Grid.Poles[33], fp.Grid.Weights[33]],
-                [fp.Grid.Poles[32], fp.Grid.Weights[32]],
-                [fp.Grid.Poles[31], fp.Grid.Weights[31]],
-                [fp.Grid.Poles[30], fp.Grid.Weights[30]],
-            ]
-
-        # the legacy function below sets the degree and knot vector
-        fp.Shape = NURBS_Cubic_66_surf(WeightedPoles).toShape()
+        data = self.gatherInputs(fp)
+        if Silk_preview.isActive(fp):
+            # a sketch is being dragged: draw a sampled preview, the shape is built when the edit settles
+            Silk_preview.preview(fp, [data])
+            return
+
+        # the legacy function called by buildShapeFromData() sets the degree and knot vector
+        self.commitOutputs(fp, buildShapeFromData(data), data)
 
 
 class CubicSurface_64:
@@ -5967,11 +6906,11 @@ class CubicSurface_64:
         latest_version = "0.01"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update == True:
@@ -6004,6 +6943,20 @@ class CubicSurface_64:
         if prop == "reverse":
             fp.recompute()
 
+    def gatherInputs(self, fp):
+        # snapshot of everything execute() needs from the document, as plain data.
+        # also used by Silk_scheduler to build the shape away from the document objects
+        grid = GridArray.fromGrid(fp.Grid, 6)
+        if fp.reverse == True:
+            # invert u, keep v
+            grid = grid.reversedU()
+        return grid.data("NURBS_Cubic_64_surf")
+
+    def commitOutputs(self, fp, shape, data):
+        fp.Shape = shape
+        # tessellation settings for the new surface, see Silk_lod.py
+        Silk_lod.update(fp, [data])
+
     def execute(self, fp):
         """Do something when doing a recomputation, this method is mandatory"""
         # print("execute() invoked")
@@ -6011,65 +6964,114 @@ class CubicSurface_64:
             # print("Restore in fp.state")
             return  # or do some special thing
 
-        # get the poles list from the poly. legacy shape function wants 'homogeneous' coords as [[x,y,z],w]
-        if fp.reverse == False:
-            WeightedPoles = [
-                [fp.Grid.Poles[0], fp.Grid.Weights[0]],
-                [fp.Grid.Poles[1], fp.Grid.Weights[1]],
-                [fp.Grid.Poles[2], fp.Grid.Weights[2]],
-                [fp.Grid.Poles[3], fp.Grid.Weights[3]],
-                [fp.Grid.Poles[4], fp.Grid.Weights[4]],
-                [fp.Grid.Poles[5], fp.Grid.Weights[5]],
-                [fp.Grid.Poles[6], fp.Grid.Weights[6]],
-                [fp.Grid.Poles[7], fp.Grid.Weights[7]],
-                [fp.Grid.Poles[8], fp.Grid.Weights[8]],
-                [fp.Grid.Poles[9], fp.Grid.Weights[9]],
-                [fp.Grid.Poles[10], fp.Grid.Weights[10]],
-                [fp.Grid.Poles[11], fp.Grid.Weights[11]],
-                [fp.Grid.Poles[12], fp.Grid.Weights[12]],
-                [fp.Grid.Poles[13], fp.Grid.Weights[13]],
-                [fp.Grid.Poles[14], fp.Grid.Weights[14]],
-                [fp.Grid.Poles[15], fp.Grid.Weights[15]],
-                [fp.Grid.Poles[16], fp.Grid.Weights[16]],
-                [fp.Grid.Poles[17], fp.Grid.Weights[17]],
-                [fp.Grid.Poles[18], fp.Grid.Weights[18]],
-                [fp.Grid.Poles[19], fp.Grid.Weights[19]],
-                [fp.Grid.Poles[20], fp.Grid.Weights[20]],
-                [fp.Grid.Poles[21], fp.Grid.Weights[21]],
-                [fp.Grid.Poles[22], fp.Grid.Weights[22]],
-                [fp.Grid.Poles[23], fp.Grid.Weights[23]],
-            ]
-        else:
-            # invert u, keep v
-            WeightedPoles = [
-                [fp.Grid.Poles[5], fp.Grid.Weights[5]],
-                [fp.Grid.Poles[4], fp.Grid.Weights[4]],
-                [fp.Grid.Poles[3], fp.Grid.Weights[3]],
-                [fp.Grid.Poles[2], fp.Grid.Weights[2]],
-                [fp.Grid.Poles[1], fp.Grid.Weights[1]],
-                [fp.Grid.Poles[0], fp.Grid.Weights[0]],
-                [fp.Grid.Poles[11], fp.Grid.Weights[11]],
-                [fp.Grid.Poles[10], fp.Grid.Weights[10]],
-                [fp.Grid.Poles[9], fp.Grid.Weights[9]],
-                [fp.Grid.Poles[8], fp.Grid.Weights[8]],
-                [fp.Grid.Poles[7], fp.Grid.Weights[7]],
-                [fp.Grid.Poles[6], fp.Grid.Weights[6]],
-                [fp.Grid.Poles[17], fp.Grid.Weights[17]],
-                [fp.Grid.Poles[16], fp.Grid.Weights[16]],
-                [fp.Grid.Poles[15], fp.Grid.Weights[15]],
-                [fp.Grid.Poles[14], fp.Grid.Weights[14]],
-                [fp.Grid.Poles[13], fp.Grid.Weights[13]],
-                [fp.Grid.Poles[12], fp.Grid.Weights[12]],
-                [fp.Grid.Poles[23], fp.Grid.Weights[23]],
-                [fp.Grid.Poles[22], fp.Grid.Weights[22]],
-                [fp.Grid.Poles[21], fp.Grid.Weights[21]],
-                [fp.Grid.Poles[20], fp.Grid.Weights[20]],
-                [fp.Grid.Poles[19], fp.Grid.Weights[19]],
-                [fp.Grid.Poles[18], fp.Grid.Weights[18]],
-            ]
-
-        # the legacy function below sets the degree and knot vector
-        fp.Shape = NURBS_Cubic_64_surf(WeightedPoles).toShape()
+        data = self.gatherInputs(fp)
+        if Silk_preview.isActive(fp):
+            # a sketch is being dragged: draw a sampled preview, the shape is built when the edit settles
+            Silk_preview.preview(fp, [data])
+            return
+
+        # the legacy function called by buildShapeFromData() sets the degree and knot vector
+        self.commitOutputs(fp, buildShapeFromData(data), data)
+
+
+class CubicSurface44_4Sketch:  # made from 4 sketches. polys, grid and surface in a single object
+    # the 4 ControlPoly4, the ControlGrid44_4 and the CubicSurface_44 of a basic patch are built in one execute(),
+    # polys and grid are only held in memory unless expose_intermediates is set.
+    # each sketch is read as ControlPoly4 reads a single sketch: 3 lines, or its first element
+    def CubicSurface44_4Sketch_Attributes(self, obj, sketches, tolerance, reverse, expose_intermediates, object_version):
+        # current attribute set
+        # inputs
+        obj.addProperty("App::PropertyLink", "Sketch0", "C1 - Inputs", "first sketch").Sketch0 = sketches[0]
+        obj.addProperty("App::PropertyLink", "Sketch1", "C1 - Inputs", "second sketch").Sketch1 = sketches[1]
+        obj.addProperty("App::PropertyLink", "Sketch2", "C1 - Inputs", "third sketch").Sketch2 = sketches[2]
+        obj.addProperty("App::PropertyLink", "Sketch3", "C1 - Inputs", "fourth sketch").Sketch3 = sketches[3]
+        obj.addProperty("App::PropertyFloat", "tolerance", "C1 - Inputs", "point-to-point connection tolerance for the 4 corners").tolerance = tolerance
+        obj.addProperty("App::PropertyBool", "reverse", "C1 - Inputs", "reverse the surface normal direction").reverse = reverse
+        obj.addProperty(
+            "App::PropertyBool", "expose_intermediates", "C1 - Inputs", "also output the grid (Poles, Weights) and the polys, so grid tools can use this object"
+        ).expose_intermediates = expose_intermediates
+        # outputs
+        obj.addProperty("App::PropertyVectorList", "Poles", "C2 - Outputs", "grid Poles, when expose_intermediates is set").Poles
+        obj.setEditorMode("Poles", 1)
+        obj.addProperty("App::PropertyFloatList", "Weights", "C2 - Outputs", "grid Weights, when expose_intermediates is set").Weights
+        obj.setEditorMode("Weights", 1)
+        obj.addProperty("App::PropertyVectorList", "PolyPoles", "C2 - Outputs", "Poles of the 4 polys, 4 each, when expose_intermediates is set").PolyPoles
+        obj.setEditorMode("PolyPoles", 1)
+        obj.addProperty("App::PropertyFloatList", "PolyWeights", "C2 - Outputs", "Weights of the 4 polys, 4 each, when expose_intermediates is set").PolyWeights
+        obj.setEditorMode("PolyWeights", 1)
+        # additional object identifiers
+        obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "CubicSurface44_4Sketch"
+        obj.setEditorMode("object_type", 1)
+        obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = object_version
+        obj.setEditorMode("object_version", 1)
+        obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
+        obj.setEditorMode("internalName", 1)
+        return
+
+    def __init__(self, obj, sketch0, sketch1, sketch2, sketch3):
+        latest_version = "0.01"  # must match in onDocumentRestored()
+        self.CubicSurface44_4Sketch_Attributes(obj, [sketch0, sketch1, sketch2, sketch3], default_tol, False, False, latest_version)
+        obj.Proxy = self
+
+    def onDocumentRestored(self, obj):
+        # Migration function to set attributes between object versions. Preserves user data in object.
+        latest_version = "0.01"  # must match in __init__
+        if not obj.object_version == latest_version:
+            log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
+
+    def onChanged(self, fp, prop):
+        if prop == "expose_intermediates" and not fp.expose_intermediates and "Restore" not in fp.State:
+            fp.Poles = []
+            fp.Weights = []
+            fp.PolyPoles = []
+            fp.PolyWeights = []
+
+    def gatherInputs(self, fp):
+        # snapshot of everything execute() needs from the document, as plain data.
+        # also used by Silk_scheduler to build the shape away from the document objects
+        polys = [sketchRead(sketch, poly4FromSketch, fp.tolerance) for sketch in [fp.Sketch0, fp.Sketch1, fp.Sketch2, fp.Sketch3]]
+        if fp.reverse == True:
+            polys = polys[::-1]
+        grid = grid44FromPolys(polys, fp.tolerance)
+        if isinstance(grid, str):
+            log_grid.error(
+                fp.Name,
+                ", labeled ",
+                fp.Label,
+                "\n",
+                grid.replace("polys", "sketches"),
+                "\n",
+                "the object is created in the document, but awaits resolution of endpoint matching.",
+                " prioritize coincident constraints for the endpoints.",
+            )
+            fake_name_to_trigger_error = please_read_message_above
+        data = GridArray.fromLists(grid[0], grid[1], 4).data("Bezier_Bicubic_surf")
+        # the intermediate polys, for the optional outputs
+        data["Polys"] = [[[(p[0], p[1], p[2]) for p in poly[0]], [float(w) for w in poly[1]]] for poly in polys]
+        return data
+
+    def commitOutputs(self, fp, shape, data):
+        if fp.expose_intermediates:
+            fp.Poles = [Base.Vector(*p[0]) for p in data["WeightedPoles"]]
+            fp.Weights = [p[1] for p in data["WeightedPoles"]]
+            fp.PolyPoles = [Base.Vector(*p) for poly in data["Polys"] for p in poly[0]]
+            fp.PolyWeights = [w for poly in data["Polys"] for w in poly[1]]
+        fp.Shape = shape
+        # tessellation settings for the new surface, see Silk_lod.py
+        Silk_lod.update(fp, [data])
+
+    def execute(self, fp):
+        """Do something when doing a recomputation, this method is mandatory"""
+        if "Restore" in fp.State:
+            return
+
+        data = self.gatherInputs(fp)
+        if Silk_preview.isActive(fp):
+            # a sketch is being dragged: draw a sampled preview, the shape is built when the edit settles
+            Silk_preview.preview(fp, [data])
+            return
+
+        self.commitOutputs(fp, buildShapeFromData(data), data)
 
 
 # 11/25/2016. update 12/09/2016.
@@ -6282,11 +7284,11 @@ class ControlGrid44_EdgeSegment:
         latest_version = "0.01"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update == True:
@@ -6326,6 +7328,8 @@ class ControlGrid44_EdgeSegment:
 
     def onChanged(self, fp, prop):
         # print("onChanged invoked")
+        if prop == "Visibility":
+            showNet(fp)
         if prop == "reverse":
             fp.recompute()
 
@@ -6369,12 +7373,12 @@ class ControlGrid44_EdgeSegment:
         # one day i need to revisit my control point ordering scheme to avoid this flip
         # print(poles_2dArray)
         if len(poles_2dArray[0]) == 1:
-            print("collapsed surface segment")
-            print("t0 ", t0)
-            print("t1 ", t1)
-            print("poles_2dArray", poles_2dArray)
+            log_grid.warning("collapsed surface segment")
+            log_grid.debug("t0 ", t0)
+            log_grid.debug("t1 ", t1)
+            log_grid.debug("poles_2dArray", poles_2dArray)
 
-        fp.Poles = [
+        Poles = [
             poles_2dArray[3][0],
             poles_2dArray[3][1],
             poles_2dArray[3][2],
@@ -6393,7 +7397,7 @@ class ControlGrid44_EdgeSegment:
             poles_2dArray[0][3],
         ]
 
-        fp.Weights = [
+        Weights = [
             weights_2dArray[3][0],
             weights_2dArray[3][1],
             weights_2dArray[3][2],
@@ -6412,8 +7416,7 @@ class ControlGrid44_EdgeSegment:
             weights_2dArray[0][3],
         ]
 
-        fp.Legs = drawGrid(fp.Poles, 4)
-        fp.Shape = Part.Shape(fp.Legs)
+        commitNet(fp, Poles, Weights)
 
 
 class ControlGrid44_2EdgeSegments:
@@ -6462,11 +7465,11 @@ class ControlGrid44_2EdgeSegments:
         latest_version = "0.01"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update == True:
@@ -6509,6 +7512,8 @@ class ControlGrid44_2EdgeSegments:
 
     def onChanged(self, fp, prop):
         # print("onChanged invoked")
+        if prop == "Visibility":
+            showNet(fp)
         if prop == "reverse":
             fp.recompute()
 
@@ -6625,16 +7630,16 @@ class ControlGrid44_2EdgeSegments:
         # one day i need to revisit my control point ordering scheme to avoid this flip
         poles_2dArray = surface.getPoles()
         if len(poles_2dArray[0]) == 1:
-            print("collapsed surface segment")
-            print("segdira: ", segdira)
-            print("segdirb: ", segdirb)
-            print("s0 ", s0)
-            print("s1 ", s1)
-            print("t0 ", t0)
-            print("t1 ", t1)
-            print("poles_2dArray", poles_2dArray)
-
-        fp.Poles = [
+            log_grid.warning("collapsed surface segment")
+            log_grid.debug("segdira: ", segdira)
+            log_grid.debug("segdirb: ", segdirb)
+            log_grid.debug("s0 ", s0)
+            log_grid.debug("s1 ", s1)
+            log_grid.debug("t0 ", t0)
+            log_grid.debug("t1 ", t1)
+            log_grid.debug("poles_2dArray", poles_2dArray)
+
+        Poles = [
             poles_2dArray[3][0],
             poles_2dArray[3][1],
             poles_2dArray[3][2],
@@ -6654,7 +7659,7 @@ class ControlGrid44_2EdgeSegments:
         ]
 
         weights_2dArray = surface.getWeights()
-        fp.Weights = [
+        Weights = [
             weights_2dArray[3][0],
             weights_2dArray[3][1],
             weights_2dArray[3][2],
@@ -6673,12 +7678,15 @@ class ControlGrid44_2EdgeSegments:
             weights_2dArray[0][3],
         ]
 
-        fp.Legs = drawGrid(fp.Poles, 4)
-        fp.Shape = Part.Shape(fp.Legs)
+        commitNet(fp, Poles, Weights)
 
 
 class ControlGrid64_2Grid44:  # surfaces not strictly used as input, but this is the logical position,
     # since the input grids are intended to come from surface segmentation
+
+    # tuning properties: a burst of changes is merged into one recompute, see Silk_debounce.py
+    debounced_properties = ["scale_tangent_0", "scale_tangent_1", "scale_inner_0", "scale_inner_1"]
+
     def ControlGrid64_2Grid44_Attributes(self, obj, Grid_0, Grid_1, scale_tangent_0, scale_tangent_1, scale_inner_0, scale_inner_1, autoG3, tolerance, reverse, object_version):
         # current attribute set
         # inputs
@@ -6726,6 +7734,7 @@ class ControlGrid64_2Grid44:  # surfaces not strictly used as input, but this is
         """
         self.ControlGrid64_2Grid44_Attributes(obj, Grid_0, Grid_1, 2.0, 2.0, [2.0, 2.0, 2.0, 2.0], [2.0, 2.0, 2.0, 2.0], False, default_tol, False, latest_version)
         obj.Proxy = self
+        Silk_debounce.attach(obj, self.debounced_properties)
 
     def onDocumentRestored(self, obj):
         # Migration function to set attributes between object versions. Preserves user data in object.
@@ -6733,11 +7742,11 @@ class ControlGrid64_2Grid44:  # surfaces not strictly used as input, but this is
         latest_version = "0.01"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update == True:
@@ -6792,13 +7801,19 @@ class ControlGrid64_2Grid44:  # surfaces not strictly used as input, but this is
                 obj, old_Grid_0, old_Grid_1, old_scale_tangent_0, old_scale_tangent_1, old_scale_inner_0, old_scale_inner_1, old_autoG3, old_tolerance, old_reverse, latest_version
             )
 
+        Silk_debounce.attach(obj, self.debounced_properties)
+
         # need to recompute otherwise the poles remain unpopulated
         obj.recompute()
 
     def onChanged(self, fp, prop):
         # print("onChanged invoked")
+        if prop == "Visibility":
+            showNet(fp)
         if prop == "reverse":
             fp.recompute()
+        if prop in self.debounced_properties:
+            Silk_debounce.request(fp)
 
     def execute(self, fp):
         """Do something when doing a recomputation, this method is mandatory"""
@@ -6814,16 +7829,56 @@ class ControlGrid64_2Grid44:  # surfaces not strictly used as input, but this is
         # -blend: upgrade, stitch, scale
         # -stack each blend poly back into a grid
 
+        grid_0 = GridArray.fromGrid(fp.Grid_0, 4)
+        grid_1 = GridArray.fromGrid(fp.Grid_1, 4)
+
+        # the seam is the border row the two grids share, see TopologyResolver. border k runs from corner k to k + 1
+        tol = fp.tolerance
+        gridTopology(fp.Grid_0, tol, 4)
+        resolver = gridTopology(fp.Grid_1, tol, 4)
+        borders_0 = resolver.patches[fp.Grid_0.Name][1]
+        # collapsed borders of degenerate grids match each other, they are never the seam
+        shared = [edge for edge in resolver.sharedEdges(fp.Grid_0.Name, fp.Grid_1.Name) if any(math.dist(p, borders_0[edge[0]][0]) > tol for p in borders_0[edge[0]])]
+        if len(shared) == 1:
+            # rotate the grids so that the seam is on the right side for Grid_0 (border 1) and the left side for Grid_1 (border 3)
+            rotate_0 = (shared[0][0] - 1) % 4  # times 90 degrees clockwise
+            rotate_1 = (shared[0][1] + 1) % 4
+        else:
+            # grids whose seam poles do not all match: the seam is found from the corners
+            rotate_0, rotate_1 = self.seamRotations(fp, grid_0, grid_1, resolver)
+
+        log_grid.debug("rotate left: ", rotate_0)
+        log_grid.debug("rotate right: ", rotate_1)
+
+        # apply rotation correction. the rotated grids are views, the rows are copied out once
+        uv_grid_0 = grid_0.rotated(rotate_0)
+        uv_grid_1 = grid_1.rotated(rotate_1)
+        uv_poles_0 = [uv_grid_0.rowPoles(i) for i in range(0, 4)]
+        uv_weights_0 = [uv_grid_0.rowWeights(i) for i in range(0, 4)]
+        uv_poles_1 = [uv_grid_1.rowPoles(i) for i in range(0, 4)]
+        uv_weights_1 = [uv_grid_1.rowWeights(i) for i in range(0, 4)]
+
+        # run ControlPoly6_FilletBezier or equivalent internal function on each pair running across the seam
+        row_inputs = [uv_poles_0, uv_weights_0, uv_poles_1, uv_weights_1, fp.scale_tangent_0, fp.scale_inner_0, fp.scale_inner_1, fp.scale_tangent_1]
+        if fp.autoG3 == True:
+            # four G3 searches are slow. they run on a worker thread and commit when done, see Silk_background.py
+            Silk_background.submit(fp, self.blendRows, [blendG3_poly_2x4_1x6] + row_inputs, self.commitRows)
+
+        if fp.autoG3 == False:
+            self.commitRows(fp, self.blendRows(blend_poly_2x4_1x6, *row_inputs))
+
+    def seamRotations(self, fp, grid_0, grid_1, resolver):
+        # rotations (times 90 degrees clockwise) bringing the seam to the right side of grid_0 and the left side of grid_1,
+        # from the common corners of the grids. degenerate grids have more than two common corners
         # extract corner points
-        corners_0 = [fp.Grid_0.Poles[0], fp.Grid_0.Poles[3], fp.Grid_0.Poles[15], fp.Grid_0.Poles[12]]
-        corners_1 = [fp.Grid_1.Poles[0], fp.Grid_1.Poles[3], fp.Grid_1.Poles[15], fp.Grid_1.Poles[12]]
+        corners_0 = grid_0.corners()
+        corners_1 = grid_1.corners()
 
         # additional processing for degenerate grids
         # do not assume which edge is collapsed. it is predictable for ControlGrid44_3_Rotate and its segmentation,
         # but future segments may not be. for example when we eventually segment 64s and 66s, which may also include
         # degenerate grids
 
-        tol = fp.tolerance
         degen_tol = 0.000001
 
         # grid 0
@@ -6844,8 +7899,8 @@ class ControlGrid64_2Grid44:  # surfaces not strictly used as input, but this is
             degen_0 = 0
             degen_0_index = []
 
-        print("degen_0: ", degen_0)
-        print("degen_0_index: ", degen_0_index)
+        log_grid.debug("degen_0: ", degen_0)
+        log_grid.debug("degen_0_index: ", degen_0_index)
 
         # grid 1
         if equalVectors(corners_1[0], corners_1[1], degen_tol):
@@ -6864,26 +7919,22 @@ class ControlGrid64_2Grid44:  # surfaces not strictly used as input, but this is
             degen_1 = 0
             degen_1_index = []
 
-        print("degen_1: ", degen_1)
-        print("degen_1_index: ", degen_1_index)
+        log_grid.debug("degen_1: ", degen_1)
+        log_grid.debug("degen_1_index: ", degen_1_index)
 
         degen = degen_0 + degen_1
 
-        # find all matching corner points across the two grids
+        # find all matching corner points across the two grids, see TopologyResolver
         # degenerate edges will cause repeat values
-        seam_index_raw_0 = []
-        seam_index_raw_1 = []
-        for i in range(0, 4):
-            for j in range(0, 4):
-                if equalVectors(corners_0[i], corners_1[j], tol):
-                    seam_index_raw_0.append(i)
-                    seam_index_raw_1.append(j)
+        common = resolver.commonCorners(fp.Grid_0.Name, fp.Grid_1.Name)
+        seam_index_raw_0 = [i for i, j in common]
+        seam_index_raw_1 = [j for i, j in common]
         seam_index_dedupe_0 = [*set(seam_index_raw_0)]  # the * unpacks the set into the list
         seam_index_dedupe_0.sort()
-        print("seam_index_dedupe_0: ", seam_index_dedupe_0)
+        log_grid.debug("seam_index_dedupe_0: ", seam_index_dedupe_0)
         seam_index_dedupe_1 = [*set(seam_index_raw_1)]
         seam_index_dedupe_1.sort()
-        print("seam_index_dedupe_1: ", seam_index_dedupe_1)
+        log_grid.debug("seam_index_dedupe_1: ", seam_index_dedupe_1)
 
         if len(seam_index_dedupe_0) == 3:
             # the true seam is the non-degenerate point, and the degenerate point closest to it
@@ -6891,8 +7942,8 @@ class ControlGrid64_2Grid44:  # surfaces not strictly used as input, but this is
                 if seam_index_dedupe_0[i] not in degen_0_index:
                     non_degen_index_0 = i
                     non_degen_corner_0 = seam_index_dedupe_0[i]
-            print("non_degen_index_0: ", non_degen_index_0)
-            print("non_degen_corner_0: ", non_degen_corner_0)
+            log_grid.debug("non_degen_index_0: ", non_degen_index_0)
+            log_grid.debug("non_degen_corner_0: ", non_degen_corner_0)
             if non_degen_index_0 == 0:
                 if (seam_index_dedupe_0[1] - seam_index_dedupe_0[0]) == 1:
                     seam_0 = [seam_index_dedupe_0[0], seam_index_dedupe_0[1]]
@@ -6910,7 +7961,7 @@ class ControlGrid64_2Grid44:  # surfaces not strictly used as input, but this is
                     seam_0 = [seam_index_dedupe_0[0], seam_index_dedupe_0[2]]
         elif len(seam_index_dedupe_0) == 2:
             seam_0 = seam_index_dedupe_0
-        print("seam_0 ", seam_0)
+        log_grid.debug("seam_0 ", seam_0)
 
         if len(seam_index_dedupe_1) == 3:
             # the true seam is the non-degenerate point, and the degenerate point closest to it
@@ -6918,8 +7969,8 @@ class ControlGrid64_2Grid44:  # surfaces not strictly used as input, but this is
                 if seam_index_dedupe_1[i] not in degen_1_index:
                     non_degen_index_1 = i
                     non_degen_corner_1 = seam_index_dedupe_1[i]
-            print("non_degen_index_1: ", non_degen_index_1)
-            print("non_degen_corner_1: ", non_degen_corner_1)
+            log_grid.debug("non_degen_index_1: ", non_degen_index_1)
+            log_grid.debug("non_degen_corner_1: ", non_degen_corner_1)
             if non_degen_index_1 == 0:
                 if (seam_index_dedupe_1[1] - seam_index_dedupe_1[0]) == 1:
                     seam_1 = [seam_index_dedupe_1[0], seam_index_dedupe_1[1]]
@@ -6937,7 +7988,7 @@ class ControlGrid64_2Grid44:  # surfaces not strictly used as input, but this is
                     seam_1 = [seam_index_dedupe_1[0], seam_index_dedupe_1[2]]
         elif len(seam_index_dedupe_1) == 2:
             seam_1 = seam_index_dedupe_1
-        print("seam_1 ", seam_1)
+        log_grid.debug("seam_1 ", seam_1)
 
         # rotate the grids so that the seam is on the right side for Grid_0 and the left side for Grid_1
         # in the ideal case, no rotation is required:
@@ -6964,265 +8015,29 @@ class ControlGrid64_2Grid44:  # surfaces not strictly used as input, but this is
         if seam_1 == [3, 2] or seam_1 == [2, 3]:
             rotate_1 = 3
 
-        print("rotate left: ", rotate_0)
-        print("rotate right: ", rotate_1)
-
-        # get grid data back into array form (currently a 1D list)
-        lin_poles_0 = fp.Grid_0.Poles
-        lin_weights_0 = fp.Grid_0.Weights
-
-        lin_poles_1 = fp.Grid_1.Poles
-        lin_weights_1 = fp.Grid_1.Weights
-
-        # first shot: simple partition.this is an array of rows
-        poles_0 = [
-            [lin_poles_0[0], lin_poles_0[1], lin_poles_0[2], lin_poles_0[3]],
-            [lin_poles_0[4], lin_poles_0[5], lin_poles_0[6], lin_poles_0[7]],
-            [lin_poles_0[8], lin_poles_0[9], lin_poles_0[10], lin_poles_0[11]],
-            [lin_poles_0[12], lin_poles_0[13], lin_poles_0[14], lin_poles_0[15]],
-        ]
-
-        weights_0 = [
-            [lin_weights_0[0], lin_weights_0[1], lin_weights_0[2], lin_weights_0[3]],
-            [lin_weights_0[4], lin_weights_0[5], lin_weights_0[6], lin_weights_0[7]],
-            [lin_weights_0[8], lin_weights_0[9], lin_weights_0[10], lin_weights_0[11]],
-            [lin_weights_0[12], lin_weights_0[13], lin_weights_0[14], lin_weights_0[15]],
-        ]
-
-        poles_1 = [
-            [lin_poles_1[0], lin_poles_1[1], lin_poles_1[2], lin_poles_1[3]],
-            [lin_poles_1[4], lin_poles_1[5], lin_poles_1[6], lin_poles_1[7]],
-            [lin_poles_1[8], lin_poles_1[9], lin_poles_1[10], lin_poles_1[11]],
-            [lin_poles_1[12], lin_poles_1[13], lin_poles_1[14], lin_poles_1[15]],
-        ]
-
-        weights_1 = [
-            [lin_weights_1[0], lin_weights_1[1], lin_weights_1[2], lin_weights_1[3]],
-            [lin_weights_1[4], lin_weights_1[5], lin_weights_1[6], lin_weights_1[7]],
-            [lin_weights_1[8], lin_weights_1[9], lin_weights_1[10], lin_weights_1[11]],
-            [lin_weights_1[12], lin_weights_1[13], lin_weights_1[14], lin_weights_1[15]],
-        ]
-
-        # print 'poles_0', poles_0
-        # print 'poles_1', poles_1
-
-        # apply rotation correction. vector type gets stripped in numpy!!
-        uv_poles_0_temp = np.rot90(poles_0, rotate_0).tolist()
-        uv_weights_0 = np.rot90(weights_0, rotate_0).tolist()
-        # print ("uv_weights_0 ")
-        # print (uv_weights_0)
-
-        uv_poles_1_temp = np.rot90(poles_1, rotate_1).tolist()
-        uv_weights_1 = np.rot90(weights_1, rotate_1).tolist()
-        # print ("uv_weights_1 ")
-        # print (uv_weights_1)
-
-        # print 'uv_poles_0_temp', uv_poles_0_temp
-        # print 'uv_poles_1_temp', uv_poles_1_temp
-        # print 'uv_poles_0_temp[0][0] ', uv_poles_0_temp[0][0]
-        # print 'uv_poles_0_temp[3][3] ', uv_poles_0_temp[3][3]
-
-        # get ready to recast to vector
-        uv_poles_0 = [[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
-        uv_poles_1 = [[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
+        return rotate_0, rotate_1
 
+    def blendRows(self, blend_function, uv_poles_0, uv_weights_0, uv_poles_1, uv_weights_1, scale_tangent_0, scale_inner_0, scale_inner_1, scale_tangent_1):
+        # one blend poly per pair of rows across the seam. does not read the document, so it can run on a worker thread
+        rows = []
         for i in range(0, 4):
-            for j in range(0, 4):
-                uv_poles_0[i][j] = Base.Vector(uv_poles_0_temp[i][j][0], uv_poles_0_temp[i][j][1], uv_poles_0_temp[i][j][2])
-            # print uv_poles_0
-
-        for i in range(0, 4):
-            for j in range(0, 4):
-                uv_poles_1[i][j] = Base.Vector(uv_poles_1_temp[i][j][0], uv_poles_1_temp[i][j][1], uv_poles_1_temp[i][j][2])
-            # print uv_poles_1
-
-        # print 'uv_poles_0', uv_poles_0
-        # print 'uv_poles_1', uv_poles_1
-
-        # b=Base.Vector(a[0],a[1],a[2])
+            log_grid.debug("blend on row_", i)
+            rows.append(blend_function(uv_poles_0[i], uv_weights_0[i], uv_poles_1[i], uv_weights_1[i], scale_tangent_0, scale_inner_0[i], scale_inner_1[i], scale_tangent_1))
+        return rows
 
-        # run ControlPoly6_FilletBezier or equivalent internal function on each pair running across the seam
+    def commitRows(self, fp, rows):
         if fp.autoG3 == True:
-            print("G3 on row_0")
-            row_0 = blendG3_poly_2x4_1x6(
-                uv_poles_0[0], uv_weights_0[0], uv_poles_1[0], uv_weights_1[0], fp.scale_tangent_0, fp.scale_inner_0[0], fp.scale_inner_1[0], fp.scale_tangent_1
-            )
-            blend_poles_0 = row_0[0]
-            blend_weights_0 = row_0[1]
-
-            print("G3 on row_1")
-            row_1 = blendG3_poly_2x4_1x6(
-                uv_poles_0[1], uv_weights_0[1], uv_poles_1[1], uv_weights_1[1], fp.scale_tangent_0, fp.scale_inner_0[1], fp.scale_inner_1[1], fp.scale_tangent_1
-            )
-            blend_poles_1 = row_1[0]
-            blend_weights_1 = row_1[1]
-
-            print("G3 on row_2")
-            row_2 = blendG3_poly_2x4_1x6(
-                uv_poles_0[2], uv_weights_0[2], uv_poles_1[2], uv_weights_1[2], fp.scale_tangent_0, fp.scale_inner_0[2], fp.scale_inner_1[2], fp.scale_tangent_1
-            )
-            blend_poles_2 = row_2[0]
-            blend_weights_2 = row_2[1]
-
-            print("G3 on row_3")
-            row_3 = blendG3_poly_2x4_1x6(
-                uv_poles_0[3], uv_weights_0[3], uv_poles_1[3], uv_weights_1[3], fp.scale_tangent_0, fp.scale_inner_0[3], fp.scale_inner_1[3], fp.scale_tangent_1
-            )
-            blend_poles_3 = row_3[0]
-            blend_weights_3 = row_3[1]
-
-            fp.scale_inner_0 = [row_0[2], row_1[2], row_2[2], row_3[2]]
-            fp.scale_inner_1 = [row_0[3], row_1[3], row_2[3], row_3[3]]
-
-        if fp.autoG3 == False:
-            row_0 = blend_poly_2x4_1x6(
-                uv_poles_0[0], uv_weights_0[0], uv_poles_1[0], uv_weights_1[0], fp.scale_tangent_0, fp.scale_inner_0[0], fp.scale_inner_1[0], fp.scale_tangent_1
-            )
-            blend_poles_0 = row_0[0]
-            blend_weights_0 = row_0[1]
-            # print (blend_weights_0)
-
-            # print ("uv_weights_0[1]")
-            # print (uv_weights_0[1])
-            row_1 = blend_poly_2x4_1x6(
-                uv_poles_0[1], uv_weights_0[1], uv_poles_1[1], uv_weights_1[1], fp.scale_tangent_0, fp.scale_inner_0[1], fp.scale_inner_1[1], fp.scale_tangent_1
-            )
-            blend_poles_1 = row_1[0]
-            blend_weights_1 = row_1[1]
-            # print (blend_weights_1)
-
-            # print ("uv_weights_0[2]")
-            # print (uv_weights_0[2])
-            row_2 = blend_poly_2x4_1x6(
-                uv_poles_0[2], uv_weights_0[2], uv_poles_1[2], uv_weights_1[2], fp.scale_tangent_0, fp.scale_inner_0[2], fp.scale_inner_1[2], fp.scale_tangent_1
-            )
-            blend_poles_2 = row_2[0]
-            blend_weights_2 = row_2[1]
-            # print (blend_weights_2)
-
-            row_3 = blend_poly_2x4_1x6(
-                uv_poles_0[3], uv_weights_0[3], uv_poles_1[3], uv_weights_1[3], fp.scale_tangent_0, fp.scale_inner_0[3], fp.scale_inner_1[3], fp.scale_tangent_1
-            )
-            blend_poles_3 = row_3[0]
-            blend_weights_3 = row_3[1]
-            # print (blend_weights_3)
+            # the G3 search found the inner scales
+            fp.scale_inner_0 = [row[2] for row in rows]
+            fp.scale_inner_1 = [row[3] for row in rows]
 
         # stack the ControlPoly6s into a 64 grid - poles and weights
-
-        if fp.reverse == False:
-            fp.Poles = [
-                blend_poles_0[0],
-                blend_poles_0[1],
-                blend_poles_0[2],
-                blend_poles_0[3],
-                blend_poles_0[4],
-                blend_poles_0[5],
-                blend_poles_1[0],
-                blend_poles_1[1],
-                blend_poles_1[2],
-                blend_poles_1[3],
-                blend_poles_1[4],
-                blend_poles_1[5],
-                blend_poles_2[0],
-                blend_poles_2[1],
-                blend_poles_2[2],
-                blend_poles_2[3],
-                blend_poles_2[4],
-                blend_poles_2[5],
-                blend_poles_3[0],
-                blend_poles_3[1],
-                blend_poles_3[2],
-                blend_poles_3[3],
-                blend_poles_3[4],
-                blend_poles_3[5],
-            ]
-
-            fp.Weights = [
-                blend_weights_0[0],
-                blend_weights_0[1],
-                blend_weights_0[2],
-                blend_weights_0[3],
-                blend_weights_0[4],
-                blend_weights_0[5],
-                blend_weights_1[0],
-                blend_weights_1[1],
-                blend_weights_1[2],
-                blend_weights_1[3],
-                blend_weights_1[4],
-                blend_weights_1[5],
-                blend_weights_2[0],
-                blend_weights_2[1],
-                blend_weights_2[2],
-                blend_weights_2[3],
-                blend_weights_2[4],
-                blend_weights_2[5],
-                blend_weights_3[0],
-                blend_weights_3[1],
-                blend_weights_3[2],
-                blend_weights_3[3],
-                blend_weights_3[4],
-                blend_weights_3[5],
-            ]
-
+        grid = GridArray.fromLists([p for row in rows for p in row[0]], [w for row in rows for w in row[1]], 6)
         if fp.reverse == True:
             # keep row positions, reverse columns
-            fp.Poles = [
-                blend_poles_0[5],
-                blend_poles_0[4],
-                blend_poles_0[3],
-                blend_poles_0[2],
-                blend_poles_0[1],
-                blend_poles_0[0],
-                blend_poles_1[5],
-                blend_poles_1[4],
-                blend_poles_1[3],
-                blend_poles_1[2],
-                blend_poles_1[1],
-                blend_poles_1[0],
-                blend_poles_2[5],
-                blend_poles_2[4],
-                blend_poles_2[3],
-                blend_poles_2[2],
-                blend_poles_2[1],
-                blend_poles_2[0],
-                blend_poles_3[5],
-                blend_poles_3[4],
-                blend_poles_3[3],
-                blend_poles_3[2],
-                blend_poles_3[1],
-                blend_poles_3[0],
-            ]
-
-            fp.Weights = [
-                blend_weights_0[5],
-                blend_weights_0[4],
-                blend_weights_0[3],
-                blend_weights_0[2],
-                blend_weights_0[1],
-                blend_weights_0[0],
-                blend_weights_1[5],
-                blend_weights_1[4],
-                blend_weights_1[3],
-                blend_weights_1[2],
-                blend_weights_1[1],
-                blend_weights_1[0],
-                blend_weights_2[5],
-                blend_weights_2[4],
-                blend_weights_2[3],
-                blend_weights_2[2],
-                blend_weights_2[1],
-                blend_weights_2[0],
-                blend_weights_3[5],
-                blend_weights_3[4],
-                blend_weights_3[3],
-                blend_weights_3[2],
-                blend_weights_3[1],
-                blend_weights_3[0],
-            ]
-
-        # build the leg list for viz
-        fp.Legs = drawGrid(fp.Poles, 6)
-        fp.Shape = Part.Shape(fp.Legs)
+            grid = grid.reversedU()
+
+        commitNet(fp, grid.poles(), grid.weights())
 
 
 class SubGrid33_2Grid64:
@@ -7273,11 +8088,11 @@ class SubGrid33_2Grid64:
         latest_version = "0.01"  # must match in __init__
         update = False
         if not hasattr(obj, "object_version"):
-            print(obj.Name, " has no version attribute. Attribute format will be updated")
+            log_migration.info(obj.Name, " has no version attribute. Attribute format will be updated")
             update = True
         else:
             if not obj.object_version == latest_version:
-                print(obj.Name, " is out of date. Attribute format will be updated")
+                log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
                 update = True
 
         if update == True:
@@ -7323,6 +8138,8 @@ class SubGrid33_2Grid64:
 
     def onChanged(self, fp, prop):
         # print("onChanged invoked")
+        if prop == "Visibility":
+            showNet(fp)
         if prop == "reverse":
             fp.recompute()
 
@@ -7340,23 +8157,20 @@ class SubGrid33_2Grid64:
         # -build a corner focused 33 grid using similar logic as the corner focused 66 grid.
         # the $10 question here is whether this even maintains G1? maybe...it has been many steps since the bezier surface was segmented.
 
-        # extract corner points
-        corners_0 = [fp.Grid_0.Poles[0], fp.Grid_0.Poles[5], fp.Grid_0.Poles[18], fp.Grid_0.Poles[23]]
-        corners_1 = [fp.Grid_1.Poles[0], fp.Grid_1.Poles[5], fp.Grid_1.Poles[18], fp.Grid_1.Poles[23]]
-        # find the common point
-        common = "not_found_yet"
-        for i in range(0, 4):
-            for j in range(0, 4):
-                if equalVectors(corners_0[i], corners_1[j], fp.tolerance):
-                    if common == "not_found_yet":
-                        common = [i, j]
-                    else:
-                        print("multiple common corners found at the current tolerance. \n reduce tolerance, or improve corner matching")
-                        fake_name_to_trigger_error = please_read_message_above
-
-        if common == "not_found_yet":
-            print("""common point of grids not found. If this object was working previously, this is an evaluation error. 
+        grid_0 = GridArray.fromGrid(fp.Grid_0, 6)
+        grid_1 = GridArray.fromGrid(fp.Grid_1, 6)
+
+        # find the common point, see TopologyResolver. corners are numbered below as Poles[0], [5], [18], [23]
+        gridTopology(fp.Grid_0, fp.tolerance, 6)
+        found = gridTopology(fp.Grid_1, fp.tolerance, 6).commonCorners(fp.Grid_0.Name, fp.Grid_1.Name)
+        if len(found) > 1:
+            log_grid.error("multiple common corners found at the current tolerance. \n reduce tolerance, or improve corner matching")
+            fake_name_to_trigger_error = please_read_message_above
+
+        if len(found) == 0:
+            log_grid.error("""common point of grids not found. If this object was working previously, this is an evaluation error. 
                       \n if this is a new object, check the corner matching vs tolerance""")
+        common = [corner_diagonal_order[found[0][0]], corner_diagonal_order[found[0][1]]]
         # print ('common ', common)
         # tested-runs-
 
@@ -7366,43 +8180,31 @@ class SubGrid33_2Grid64:
 
         # check input grid order, swap grids if necessary
         if (common[0] == 1 or common[0] == 2) and (common[1] == 0 or common[1] == 3):
-            print("swapping grid order")
+            log_grid.debug("swapping grid order")
             temp = fp.Grid_0
             fp.Grid_0 = fp.Grid_1
             fp.Grid_1 = temp
-            # get the corners again
-            corners_0 = [fp.Grid_0.Poles[0], fp.Grid_0.Poles[5], fp.Grid_0.Poles[18], fp.Grid_0.Poles[23]]
-            corners_1 = [fp.Grid_1.Poles[0], fp.Grid_1.Poles[5], fp.Grid_1.Poles[18], fp.Grid_1.Poles[23]]
-            # find common again
-            for i in range(0, 4):
-                for j in range(0, 4):
-                    if equalVectors(corners_0[i], corners_1[j], fp.tolerance):
-                        common = [i, j]
+            grid_0, grid_1 = grid_1, grid_0
+            # the common corner is the same point, seen from the other grid
+            common = [common[1], common[0]]
             # print ('common ', common)
 
-        if common[0] == 0:
-            v_col0_poles = [fp.Grid_0.Poles[0], fp.Grid_0.Poles[1], fp.Grid_0.Poles[2]]
-            v_col0_weights = [fp.Grid_0.Weights[0], fp.Grid_0.Weights[1], fp.Grid_0.Weights[2]]
-            v_col1_poles = [fp.Grid_0.Poles[6], fp.Grid_0.Poles[7], fp.Grid_0.Poles[8]]
-            v_col1_weights = [fp.Grid_0.Weights[6], fp.Grid_0.Weights[7], fp.Grid_0.Weights[8]]
-
+        # bring the common corner of each grid to the 00 position, the V legs are then the first two rows
         if common[0] == 3:
-            v_col0_poles = [fp.Grid_0.Poles[23], fp.Grid_0.Poles[22], fp.Grid_0.Poles[21]]
-            v_col0_weights = [fp.Grid_0.Weights[23], fp.Grid_0.Weights[22], fp.Grid_0.Weights[21]]
-            v_col1_poles = [fp.Grid_0.Poles[17], fp.Grid_0.Poles[16], fp.Grid_0.Poles[15]]
-            v_col1_weights = [fp.Grid_0.Weights[17], fp.Grid_0.Weights[16], fp.Grid_0.Weights[15]]
+            grid_0 = grid_0.rotated(2)
+        v_col0_poles = grid_0.rowPoles(0)[:3]
+        v_col0_weights = grid_0.rowWeights(0)[:3]
+        v_col1_poles = grid_0.rowPoles(1)[:3]
+        v_col1_weights = grid_0.rowWeights(1)[:3]
 
         if common[1] == 1:
-            u_row0_poles = [fp.Grid_1.Poles[5], fp.Grid_1.Poles[4], fp.Grid_1.Poles[3]]
-            u_row0_weights = [fp.Grid_1.Weights[5], fp.Grid_1.Weights[4], fp.Grid_1.Weights[3]]
-            u_row1_poles = [fp.Grid_1.Poles[11], fp.Grid_1.Poles[10], fp.Grid_1.Poles[9]]
-            u_row1_weights = [fp.Grid_1.Weights[11], fp.Grid_1.Weights[10], fp.Grid_1.Weights[9]]
-
+            grid_1 = grid_1.reversedU()
         if common[1] == 2:
-            u_row0_poles = [fp.Grid_1.Poles[18], fp.Grid_1.Poles[19], fp.Grid_1.Poles[20]]
-            u_row0_weights = [fp.Grid_1.Weights[18], fp.Grid_1.Weights[19], fp.Grid_1.Weights[20]]
-            u_row1_poles = [fp.Grid_1.Poles[12], fp.Grid_1.Poles[13], fp.Grid_1.Poles[14]]
-            u_row1_weights = [fp.Grid_1.Weights[12], fp.Grid_1.Weights[13], fp.Grid_1.Weights[14]]
+            grid_1 = grid_1.reversedV()
+        u_row0_poles = grid_1.rowPoles(0)[:3]
+        u_row0_weights = grid_1.rowWeights(0)[:3]
+        u_row1_poles = grid_1.rowPoles(1)[:3]
+        u_row1_weights = grid_1.rowWeights(1)[:3]
 
         u_tan_ratio = (u_row0_poles[1] - u_row0_poles[0]).Length / (v_col1_poles[0] - v_col0_poles[0]).Length
         v_tan_ratio = (v_col0_poles[1] - v_col0_poles[0]).Length / (u_row1_poles[0] - u_row0_poles[0]).Length
@@ -7423,7 +8225,7 @@ class SubGrid33_2Grid64:
 
         p22 = p22_temp + fp.adjust_0 * (p01 - p00) + fp.adjust_1 * (p10 - p00)
 
-        fp.Poles = [p00, p01, p02, p10, p11, p12, p20, p21, p22]
+        Poles = [p00, p01, p02, p10, p11, p12, p20, p21, p22]
 
         w00 = u_row0_weights[0]
         w01 = u_row0_weights[1]
@@ -7436,15 +8238,14 @@ class SubGrid33_2Grid64:
         w21 = w01 * w20
         w22 = w02 * w20
 
-        fp.Weights = [w00, w01, w02, w10, w11, w12, w20, w21, w22]
+        Weights = [w00, w01, w02, w10, w11, w12, w20, w21, w22]
 
+        grid = GridArray.fromLists(Poles, Weights, 3)
         if fp.reverse == True:
             # diagonal flip
-            fp.Poles = [p00, p10, p20, p01, p11, p21, p02, p12, p22]
-            fp.Weights = [w00, w10, w20, w01, w11, w21, w02, w12, w22]
+            grid = grid.transposed()
 
-        fp.Legs = drawGrid(fp.Poles, 3)
-        fp.Shape = Part.Shape(fp.Legs)
+        commitNet(fp, grid.poles(), grid.weights())
 
 
 class ControlGrid66_4Sub:
@@ -7460,178 +8261,20 @@ class ControlGrid66_4Sub:
         obj.addProperty("App::PropertyFloatList", "Weights", "ControlGrid66_4Sub", "Weights").Weights
         obj.Proxy = self
 
+    def onChanged(self, fp, prop):
+        if prop == "Visibility":
+            showNet(fp)
+
     def execute(self, fp):
         """Do something when doing a recomputation, this method is mandatory"""
-        p00 = fp.SubGrid_0.Poles[0]
-        p01 = fp.SubGrid_0.Poles[1]
-        p02 = fp.SubGrid_0.Poles[2]
-        p03 = fp.SubGrid_1.Poles[6]
-        p04 = fp.SubGrid_1.Poles[3]
-        p05 = fp.SubGrid_1.Poles[0]
-
-        p15 = fp.SubGrid_1.Poles[1]
-        p25 = fp.SubGrid_1.Poles[2]
-        p35 = fp.SubGrid_2.Poles[6]
-        p45 = fp.SubGrid_2.Poles[3]
-        p55 = fp.SubGrid_2.Poles[0]
-
-        p54 = fp.SubGrid_2.Poles[1]
-        p53 = fp.SubGrid_2.Poles[2]
-        p52 = fp.SubGrid_3.Poles[6]
-        p51 = fp.SubGrid_3.Poles[3]
-        p50 = fp.SubGrid_3.Poles[0]
-
-        p40 = fp.SubGrid_3.Poles[1]
-        p30 = fp.SubGrid_3.Poles[2]
-        p20 = fp.SubGrid_0.Poles[6]
-        p10 = fp.SubGrid_0.Poles[3]
-
-        p11 = fp.SubGrid_0.Poles[4]
-        p12 = fp.SubGrid_0.Poles[5]
-        p13 = fp.SubGrid_1.Poles[7]
-        p14 = fp.SubGrid_1.Poles[4]
-
-        p24 = fp.SubGrid_1.Poles[5]
-        p34 = fp.SubGrid_2.Poles[7]
-        p44 = fp.SubGrid_2.Poles[4]
-
-        p43 = fp.SubGrid_2.Poles[5]
-        p42 = fp.SubGrid_3.Poles[7]
-        p41 = fp.SubGrid_3.Poles[4]
-
-        p31 = fp.SubGrid_3.Poles[5]
-        p21 = fp.SubGrid_0.Poles[7]
-
-        p22 = fp.SubGrid_0.Poles[8]
-        p23 = fp.SubGrid_1.Poles[8]
-        p33 = fp.SubGrid_2.Poles[8]
-        p32 = fp.SubGrid_3.Poles[8]
-
-        fp.Poles = [
-            p00,
-            p01,
-            p02,
-            p03,
-            p04,
-            p05,
-            p10,
-            p11,
-            p12,
-            p13,
-            p14,
-            p15,
-            p20,
-            p21,
-            p22,
-            p23,
-            p24,
-            p25,
-            p30,
-            p31,
-            p32,
-            p33,
-            p34,
-            p35,
-            p40,
-            p41,
-            p42,
-            p43,
-            p44,
-            p45,
-            p50,
-            p51,
-            p52,
-            p53,
-            p54,
-            p55,
-        ]
-
-        w00 = fp.SubGrid_0.Weights[0]
-        w01 = fp.SubGrid_0.Weights[1]
-        w02 = fp.SubGrid_0.Weights[2]
-        w03 = fp.SubGrid_1.Weights[6]
-        w04 = fp.SubGrid_1.Weights[3]
-        w05 = fp.SubGrid_1.Weights[0]
-
-        w15 = fp.SubGrid_1.Weights[1]
-        w25 = fp.SubGrid_1.Weights[2]
-        w35 = fp.SubGrid_2.Weights[6]
-        w45 = fp.SubGrid_2.Weights[3]
-        w55 = fp.SubGrid_2.Weights[0]
-
-        w54 = fp.SubGrid_2.Weights[1]
-        w53 = fp.SubGrid_2.Weights[2]
-        w52 = fp.SubGrid_3.Weights[6]
-        w51 = fp.SubGrid_3.Weights[3]
-        w50 = fp.SubGrid_3.Weights[0]
-
-        w40 = fp.SubGrid_3.Weights[1]
-        w30 = fp.SubGrid_3.Weights[2]
-        w20 = fp.SubGrid_0.Weights[6]
-        w10 = fp.SubGrid_0.Weights[3]
-
-        w11 = fp.SubGrid_0.Weights[4]
-        w12 = fp.SubGrid_0.Weights[5]
-        w13 = fp.SubGrid_1.Weights[7]
-        w14 = fp.SubGrid_1.Weights[4]
-
-        w24 = fp.SubGrid_1.Weights[5]
-        w34 = fp.SubGrid_2.Weights[7]
-        w44 = fp.SubGrid_2.Weights[4]
-
-        w43 = fp.SubGrid_2.Weights[5]
-        w42 = fp.SubGrid_3.Weights[7]
-        w41 = fp.SubGrid_3.Weights[4]
-
-        w31 = fp.SubGrid_3.Weights[5]
-        w21 = fp.SubGrid_0.Weights[7]
-
-        w22 = fp.SubGrid_0.Weights[8]
-        w23 = fp.SubGrid_1.Weights[8]
-        w33 = fp.SubGrid_2.Weights[8]
-        w32 = fp.SubGrid_3.Weights[8]
-
-        fp.Weights = [
-            w00,
-            w01,
-            w02,
-            w03,
-            w04,
-            w05,
-            w10,
-            w11,
-            w12,
-            w13,
-            w14,
-            w15,
-            w20,
-            w21,
-            w22,
-            w23,
-            w24,
-            w25,
-            w30,
-            w31,
-            w32,
-            w33,
-            w34,
-            w35,
-            w40,
-            w41,
-            w42,
-            w43,
-            w44,
-            w45,
-            w50,
-            w51,
-            w52,
-            w53,
-            w54,
-            w55,
-        ]
+        # each sub grid has its 00 corner at a corner of the 66 grid. quarter turns bring them into their quadrant
+        sub_0 = GridArray.fromGrid(fp.SubGrid_0, 3)
+        sub_1 = GridArray.fromGrid(fp.SubGrid_1, 3).rotated(3)
+        sub_2 = GridArray.fromGrid(fp.SubGrid_2, 3).rotated(2)
+        sub_3 = GridArray.fromGrid(fp.SubGrid_3, 3).rotated(1)
+        grid = GridArray.fromBlocks([[sub_0, sub_1], [sub_3, sub_2]])
 
-        fp.Legs = drawGrid(fp.Poles, 6)
-        fp.Shape = Part.Shape(fp.Legs)
+        commitNet(fp, grid.poles(), grid.weights())
 
 
 class ControlGrid64_3_1Grid44:
@@ -7645,6 +8288,10 @@ class ControlGrid64_3_1Grid44:
         obj.addProperty("App::PropertyFloatList", "Weights", "ControlGrid64_3_1Grid44", "Weights").Weights
         obj.Proxy = self
 
+    def onChanged(self, fp, prop):
+        if prop == "Visibility":
+            showNet(fp)
+
     def execute(self, fp):
         """Do something when doing a recomputation, this method is mandatory"""
         # get the control poly of the bezier
@@ -7662,82 +8309,9 @@ class ControlGrid64_3_1Grid44:
             rotate = 3
 
         # rotate the grid so that the corner is in the 00 position
-        # get grid data back into array
-        lin_poles = grid_44.Poles
-        lin_weights = grid_44.Weights
-
-        # first shot: simple partition.this is an array of rows
-        Apoles = [
-            [lin_poles[0], lin_poles[1], lin_poles[2], lin_poles[3]],
-            [lin_poles[4], lin_poles[5], lin_poles[6], lin_poles[7]],
-            [lin_poles[8], lin_poles[9], lin_poles[10], lin_poles[11]],
-            [lin_poles[12], lin_poles[13], lin_poles[14], lin_poles[15]],
-        ]
-
-        Aweights = [
-            [lin_weights[0], lin_weights[1], lin_weights[2], lin_weights[3]],
-            [lin_weights[4], lin_weights[5], lin_weights[6], lin_weights[7]],
-            [lin_weights[8], lin_weights[9], lin_weights[10], lin_weights[11]],
-            [lin_weights[12], lin_weights[13], lin_weights[14], lin_weights[15]],
-        ]
-
-        # print 'Apoles', Apoles
-
-        # apply rotation correction. vector type gets stripped in numpy
-        uv_poles_temp = np.rot90(Apoles, rotate).tolist()
-        uv_weights = np.rot90(Aweights, rotate).tolist()
-
-        # print 'uv_poles_temp', uv_poles_temp
-        # print 'uv_poles_temp[0][0] ', uv_poles_temp[0][0]
-        # print 'uv_poles_temp[3][3] ', uv_poles_temp[3][3]
-
-        # get ready to recast to vector
-        uv_poles = [[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
-
-        for i in range(0, 4):
-            for j in range(0, 4):
-                uv_poles[i][j] = Base.Vector(uv_poles_temp[i][j][0], uv_poles_temp[i][j][1], uv_poles_temp[i][j][2])
-            # print uv_poles
-
-        # print 'uv_poles', uv_poles
-
-        set_poles = [
-            uv_poles[0][0],
-            uv_poles[0][1],
-            uv_poles[0][2],
-            uv_poles[0][3],
-            uv_poles[1][0],
-            uv_poles[1][1],
-            uv_poles[1][2],
-            uv_poles[1][3],
-            uv_poles[2][0],
-            uv_poles[2][1],
-            uv_poles[2][2],
-            uv_poles[2][3],
-            uv_poles[3][0],
-            uv_poles[3][1],
-            uv_poles[3][2],
-            uv_poles[3][3],
-        ]
-
-        set_weights = [
-            uv_weights[0][0],
-            uv_weights[0][1],
-            uv_weights[0][2],
-            uv_weights[0][3],
-            uv_weights[1][0],
-            uv_weights[1][1],
-            uv_weights[1][2],
-            uv_weights[1][3],
-            uv_weights[2][0],
-            uv_weights[2][1],
-            uv_weights[2][2],
-            uv_weights[2][3],
-            uv_weights[3][0],
-            uv_weights[3][1],
-            uv_weights[3][2],
-            uv_weights[3][3],
-        ]
+        uv_grid = GridArray.fromGrid(grid_44, 4).rotated(rotate)
+        set_poles = uv_grid.poles()
+        set_weights = uv_grid.weights()
 
         # first degenerate topology try. naive Grid44 to Grid64 triangle mapping with some midpoints. p22=p23=p24=p25=set_poles[10]. this causes folding.
         # second iteration: add tiny spacing around p22, p23, p24, p25. this will break G1 slightly. The goal is to balance G1 loss versus folding over.
@@ -7796,7 +8370,7 @@ class ControlGrid64_3_1Grid44:
         p12 = (set_poles[5] + p11).multiply(0.5)
         p13 = (set_poles[5] + p14).multiply(0.5)
 
-        fp.Poles = [p00, p01, p02, p03, p04, p05, p10, p11, p12, p13, p14, p15, p20, p21, p22, p23, p24, p25, p30, p31, p32, p33, p34, p35]
+        Poles = [p00, p01, p02, p03, p04, p05, p10, p11, p12, p13, p14, p15, p20, p21, p22, p23, p24, p25, p30, p31, p32, p33, p34, p35]
 
         w00 = set_weights[12]
         w01 = set_weights[8]
@@ -7828,10 +8402,9 @@ class ControlGrid64_3_1Grid44:
         w12 = (w02 + w21) / 2
         w13 = (w03 + w24) / 2
 
-        fp.Weights = [w00, w01, w02, w03, w04, w05, w10, w11, w12, w13, w14, w15, w20, w21, w22, w23, w24, w25, w30, w31, w32, w33, w34, w35]
+        Weights = [w00, w01, w02, w03, w04, w05, w10, w11, w12, w13, w14, w15, w20, w21, w22, w23, w24, w25, w30, w31, w32, w33, w34, w35]
 
-        fp.Legs = drawGrid(fp.Poles, 6)
-        fp.Shape = Part.Shape(fp.Legs)
+        commitNet(fp, Poles, Weights)
 
 
 class ControlGrid64_normal:
@@ -7848,6 +8421,10 @@ class ControlGrid64_normal:
         obj.addProperty("App::PropertyFloatList", "Weights", "ControlGrid64_normal", "Weights").Weights
         obj.Proxy = self
 
+    def onChanged(self, fp, prop):
+        if prop == "Visibility":
+            showNet(fp)
+
     def execute(self, fp):
         """Do something when doing a recomputation, this method is mandatory"""
         Poles = fp.Input_Grid.Poles
@@ -7901,12 +8478,7 @@ class ControlGrid64_normal:
             Poles_15_temp = ClosestPointOnLine(Poles[21], Poles[21] + v3_tan_4, Poles[15])
             Poles[15] = Poles[21] + fp.v3_normalize_21 * (Poles_15_temp - Poles[21])
 
-        fp.Poles = Poles
-        fp.Weights = Weights
-        Legs = drawGrid(fp.Poles, 6)
-        # the intermediary step makes the 'Legs' object list appendable.
-        fp.Legs = Legs
-        fp.Shape = Part.Shape(fp.Legs)
+        commitNet(fp, Poles, Weights)
 
 
 class ControlGrid64_Surf44:
@@ -7920,139 +8492,100 @@ class ControlGrid64_Surf44:
         obj.addProperty("App::PropertyFloatList", "Weights", "ControlGrid64_normal", "Weights").Weights
         obj.Proxy = self
 
+    def onChanged(self, fp, prop):
+        if prop == "Visibility":
+            showNet(fp)
+
     def execute(self, fp):
         """Do something when doing a recomputation, this method is mandatory"""
 
         Surf64 = fp.Input_Surf44.Shape.Surface
         if fp.direction_to_raise == "u":
-            print("inserting U knots")
+            log_grid.debug("inserting U knots")
             Surf64.insertUKnot(1.0 / 3.0, 1, 0.0000001)
             Surf64.insertUKnot(2.0 / 3.0, 1, 0.0000001)
         if fp.direction_to_raise == "v":
-            print("inserting V knots")
+            log_grid.debug("inserting V knots")
             Surf64.insertVKnot(1.0 / 3.0, 1, 0.0000001)
             Surf64.insertVKnot(2.0 / 3.0, 1, 0.0000001)
 
-        print("NbUPoles", Surf64.NbUPoles)
-        print("NbVPoles", Surf64.NbVPoles)
-        raw_Poles = Surf64.getPoles()
-        raw_Weights = Surf64.getWeights()
-        print("raw_Poles", raw_Poles)
+        log_grid.debug("NbUPoles", Surf64.NbUPoles)
+        log_grid.debug("NbVPoles", Surf64.NbVPoles)
+        grid = GridArray.fromSurface(Surf64)
+        if fp.direction_to_raise == "v":
+            # the 6 poles now run along v: swap u and v, keeping the surface normal
+            grid = grid.transposed().reversedV()
 
-        if fp.direction_to_raise == "u":
-            Poles = [
-                raw_Poles[0][0],
-                raw_Poles[1][0],
-                raw_Poles[2][0],
-                raw_Poles[3][0],
-                raw_Poles[4][0],
-                raw_Poles[5][0],
-                raw_Poles[0][1],
-                raw_Poles[1][1],
-                raw_Poles[2][1],
-                raw_Poles[3][1],
-                raw_Poles[4][1],
-                raw_Poles[5][1],
-                raw_Poles[0][2],
-                raw_Poles[1][2],
-                raw_Poles[2][2],
-                raw_Poles[3][2],
-                raw_Poles[4][2],
-                raw_Poles[5][2],
-                raw_Poles[0][3],
-                raw_Poles[1][3],
-                raw_Poles[2][3],
-                raw_Poles[3][3],
-                raw_Poles[4][3],
-                raw_Poles[5][3],
-            ]
-
-            Weights = [
-                raw_Weights[0][0],
-                raw_Weights[1][0],
-                raw_Weights[2][0],
-                raw_Weights[3][0],
-                raw_Weights[4][0],
-                raw_Weights[5][0],
-                raw_Weights[0][1],
-                raw_Weights[1][1],
-                raw_Weights[2][1],
-                raw_Weights[3][1],
-                raw_Weights[4][1],
-                raw_Weights[5][1],
-                raw_Weights[0][2],
-                raw_Weights[1][2],
-                raw_Weights[2][2],
-                raw_Weights[3][2],
-                raw_Weights[4][2],
-                raw_Weights[5][2],
-                raw_Weights[0][3],
-                raw_Weights[1][3],
-                raw_Weights[2][3],
-                raw_Weights[3][3],
-                raw_Weights[4][3],
-                raw_Weights[5][3],
-            ]
+        commitNet(fp, grid.poles(), grid.weights())
 
-        if fp.direction_to_raise == "v":
-            Poles = [
-                raw_Poles[3][0],
-                raw_Poles[3][1],
-                raw_Poles[3][2],
-                raw_Poles[3][3],
-                raw_Poles[3][4],
-                raw_Poles[3][5],
-                raw_Poles[2][0],
-                raw_Poles[2][1],
-                raw_Poles[2][2],
-                raw_Poles[2][3],
-                raw_Poles[2][4],
-                raw_Poles[2][5],
-                raw_Poles[1][0],
-                raw_Poles[1][1],
-                raw_Poles[1][2],
-                raw_Poles[1][3],
-                raw_Poles[1][4],
-                raw_Poles[1][5],
-                raw_Poles[0][0],
-                raw_Poles[0][1],
-                raw_Poles[0][2],
-                raw_Poles[0][3],
-                raw_Poles[0][4],
-                raw_Poles[0][5],
-            ]
-
-            Weights = [
-                raw_Weights[3][0],
-                raw_Weights[3][1],
-                raw_Weights[3][2],
-                raw_Weights[3][3],
-                raw_Weights[3][4],
-                raw_Weights[3][5],
-                raw_Weights[2][0],
-                raw_Weights[2][1],
-                raw_Weights[2][2],
-                raw_Weights[2][3],
-                raw_Weights[2][4],
-                raw_Weights[2][5],
-                raw_Weights[1][0],
-                raw_Weights[1][1],
-                raw_Weights[1][2],
-                raw_Weights[1][3],
-                raw_Weights[1][4],
-                raw_Weights[1][5],
-                raw_Weights[0][0],
-                raw_Weights[0][1],
-                raw_Weights[0][2],
-                raw_Weights[0][3],
-                raw_Weights[0][4],
-                raw_Weights[0][5],
-            ]
-
-        fp.Poles = Poles
-        fp.Weights = Weights
-        fp.Legs = drawGrid(fp.Poles, 6)
-        fp.Shape = Part.Shape(fp.Legs)
+
+class ControlGrid_Offset:  # grid of the same layout as a CubicSurface_44 / 64 / 66, for an approximate offset of it
+    # see offsetGridArrays(). the offset follows the displayed normal of the surface, 'reverse' included
+
+    # tuning properties: a burst of changes is merged into one recompute, see Silk_debounce.py
+    debounced_properties = ["distance"]
+
+    def ControlGrid_Offset_Attributes(self, obj, NL_Surface, distance, samples, object_version):
+        # current attribute set
+        # inputs
+        obj.addProperty("App::PropertyLink", "NL_Surface", "C1 - Inputs", "CubicSurface_44 / 64 / 66 to offset").NL_Surface = NL_Surface
+        obj.addProperty("App::PropertyFloat", "distance", "C1 - Inputs", "offset distance along the surface normal, negative for the other side").distance = distance
+        obj.addProperty("App::PropertyIntegerConstraint", "samples", "C1 - Inputs", "offset points fitted per direction").samples = (samples, 7, 200, 1)
+        # outputs
+        obj.addProperty("App::PropertyVectorList", "Poles", "C2 - Outputs", "Poles").Poles
+        obj.addProperty("App::PropertyFloatList", "Weights", "C2 - Outputs", "Weights").Weights
+        obj.addProperty("Part::PropertyGeometryList", "Legs", "C2 - Outputs", "control segments").Legs
+        obj.addProperty("App::PropertyInteger", "Columns", "C2 - Outputs", "poles along u, 4 or 6 as the source surface").Columns
+        obj.setEditorMode("Columns", 1)
+        obj.addProperty("App::PropertyFloat", "MaxError", "C2 - Outputs", "largest distance between the fitted surface and the true offset").MaxError
+        obj.setEditorMode("MaxError", 1)
+        # additional object identifiers
+        obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "ControlGrid_Offset"
+        obj.setEditorMode("object_type", 1)
+        obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = object_version
+        obj.setEditorMode("object_version", 1)
+        obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
+        obj.setEditorMode("internalName", 1)
+        return
+
+    def __init__(self, obj, NL_Surface, distance):
+        latest_version = "0.01"  # must match in onDocumentRestored()
+        self.ControlGrid_Offset_Attributes(obj, NL_Surface, distance, 25, latest_version)
+        Silk_debounce.attach(obj, self.debounced_properties)
+        obj.Proxy = self
+
+    def onDocumentRestored(self, obj):
+        # Migration function to set attributes between object versions. Preserves user data in object.
+        latest_version = "0.01"  # must match in __init__
+        if not obj.object_version == latest_version:
+            log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
+        Silk_debounce.attach(obj, self.debounced_properties)
+
+    def onChanged(self, fp, prop):
+        if prop == "Visibility":
+            showNet(fp)
+        if prop in self.debounced_properties:
+            Silk_debounce.request(fp)
+
+    def execute(self, fp):
+        """Do something when doing a recomputation, this method is mandatory"""
+        if "Restore" in fp.State:
+            return
+
+        datas = Silk_lod.surfaceDatas(fp.NL_Surface)
+        if len(datas) != 1 or len(shape_layouts[datas[0]["builder"]]) != 2:
+            log_grid.error(fp.Label, ": ", fp.NL_Surface.Label, " is not a CubicSurface_44 / 64 / 66")
+            fake_name_to_trigger_error = please_read_message_above
+
+        nu, nv = shape_layouts[datas[0]["builder"]]
+        P, W = surfaceArrays([p[0] for p in datas[0]["WeightedPoles"]], [p[1] for p in datas[0]["WeightedPoles"]], nu, nv)
+        poles, error = offsetGridArrays(P, W, fp.distance, fp.samples)
+        log_grid.debug(fp.Label, ": offset max error ", error)
+
+        fp.Columns = nu
+        fp.MaxError = error
+        # back to the flat grid order, u running fastest
+        commitNet(fp, [Base.Vector(*p) for p in poles.transpose(1, 0, 2).reshape(-1, 3).tolist()], W.T.ravel().tolist())
 
 
 class SubGrid63_2Surf64:
@@ -8078,19 +8611,14 @@ class SubGrid63_2Surf64:
         Surf_0 = fp.Surf_0.Shape.Surface
         Surf_1 = fp.Surf_1.Shape.Surface
 
-        # extract corner points
-        corners_0 = [Grid_0.Poles[0], Grid_0.Poles[5], Grid_0.Poles[18], Grid_0.Poles[23]]
-        corners_1 = [Grid_1.Poles[0], Grid_1.Poles[5], Grid_1.Poles[18], Grid_1.Poles[23]]
-
-        # find the common point that defines the corner
-        common = "not_found_yet"
-        for i in range(0, 4):
-            for j in range(0, 4):
-                if equalVectors(corners_0[i], corners_1[j], 0.000001):
-                    common = [i, j]
-        if common == "not_found_yet":
-            print("common point of grids not found. If this object was working previously, this is an evaluation error")
-        print("common ", common)
+        # find the common point that defines the corner, see TopologyResolver. corners are numbered below as
+        # Poles[0], [5], [18], [23]
+        gridTopology(Grid_0, 0.000001, 6)
+        found = gridTopology(Grid_1, 0.000001, 6).commonCorners(Grid_0.Name, Grid_1.Name)
+        if len(found) == 0:
+            log_grid.warning("common point of grids not found. If this object was working previously, this is an evaluation error")
+        common = [corner_diagonal_order[found[-1][0]], corner_diagonal_order[found[-1][1]]]
+        log_grid.debug("common ", common)
 
         # the two 6 point sides of each grid should form a V when looking at the future grid
         # a is the left leg of the V, i.e. common[0] = 0 or 3
@@ -8098,7 +8626,7 @@ class SubGrid63_2Surf64:
 
         # check input grid order, swap grids if necessary
         if (common[0] == 1 or common[0] == 2) and (common[1] == 0 or common[1] == 3):
-            print("swap surfaces - internal only?")
+            log_grid.debug("swap surfaces - internal only?")
             temp_grid = Grid_0
             Grid_0 = Grid_1
             Grid_1 = temp_grid
@@ -8107,15 +8635,9 @@ class SubGrid63_2Surf64:
             Surf_0 = Surf_1
             Surf_1 = temp_surf
 
-            # get the corners again, based on swapped grids
-            corners_0 = [Grid_0.Poles[0], Grid_0.Poles[5], Grid_0.Poles[18], Grid_0.Poles[23]]
-            corners_1 = [Grid_1.Poles[0], Grid_1.Poles[5], Grid_1.Poles[18], Grid_1.Poles[23]]
-            # find common again
-            for i in range(0, 4):
-                for j in range(0, 4):
-                    if equalVectors(corners_0[i], corners_1[j], 0.000001):
-                        common = [i, j]
-            print("common ", common)
+            # the common corner is the same point, seen from the other grid
+            common = [common[1], common[0]]
+            log_grid.debug("common ", common)
 
         # cut surfaces in half, insert knots to re-establish Poly6 along u
         if common[0] == 0:
@@ -8318,7 +8840,7 @@ class SubGrid63_2Surf64:
         if equalVectors(proj_u_rows_u2[0], p12, 0.0000001):
             p22_u = proj_u_rows_u2[1]
         else:
-            print("failed to match tangent segment on p22_u calculation")
+            log_grid.warning("failed to match tangent segment on p22_u calculation")
         p22_u_ext = p22_u + (p12 - p02) * 5.0
         p22_u_ext_L = Part.LineSegment(p22_u, p22_u_ext)
         # p22 using v_cols : surf_0 points with surf_1 tangent ratio
@@ -8326,7 +8848,7 @@ class SubGrid63_2Surf64:
         if equalVectors(proj_v_cols_v2[0], p21, 0.0000001):
             p22_v = proj_v_cols_v2[1]
         else:
-            print("failed to match tangent segment on p22_v calculation")
+            log_grid.warning("failed to match tangent segment on p22_v calculation")
         p22_v_ext = p22_v + (p21 - p20) * 5.0
         p22_v_ext_L = Part.LineSegment(p22_v, p22_v_ext)
         # combine both p22 versions
@@ -8339,40 +8861,40 @@ class SubGrid63_2Surf64:
         if equalVectors(proj_u_rows_u3[0], p13, 0.0000001):
             p23_h = proj_u_rows_u3[1]
         else:
-            print("failed to match tangent segment on p23_h calculation")
+            log_grid.warning("failed to match tangent segment on p23_h calculation")
 
         # p24 using u_rows: surf_1 points with surf_0 tangent ratio
         proj_u_rows_u4 = match_r_6P_6P_Cubic(u_row0_poles[4], u_row1_poles[4], u_row2_poles[4], v_tan_ratio)
         if equalVectors(proj_u_rows_u4[0], p14, 0.0000001):
             p24_h = proj_u_rows_u4[1]
         else:
-            print("failed to match tangent segment on p24_h calculation")
+            log_grid.warning("failed to match tangent segment on p24_h calculation")
 
         # p25 using u_rows: surf_1 points with surf_0 tangent ratio
         proj_u_rows_u5 = match_r_6P_6P_Cubic(u_row0_poles[5], u_row1_poles[5], u_row2_poles[5], v_tan_ratio)
         if equalVectors(proj_u_rows_u5[0], p15, 0.0000001):
             p25_h = proj_u_rows_u5[1]
         else:
-            print("failed to match tangent segment on p25_h calculation")
+            log_grid.warning("failed to match tangent segment on p25_h calculation")
 
         # p32 using v_cols : surf_0 points with surf_1 tangent ratio
         proj_v_cols_v3 = match_r_6P_6P_Cubic(v_col0_poles[3], v_col1_poles[3], v_col2_poles[3], u_tan_ratio)
         if equalVectors(proj_v_cols_v3[0], p31, 0.0000001):
             p32_h = proj_v_cols_v3[1]
         else:
-            print("failed to match tangent segment on p32_h calculation")
+            log_grid.warning("failed to match tangent segment on p32_h calculation")
         # p42 using v_cols : surf_0 points with surf_1 tangent ratio
         proj_v_cols_v4 = match_r_6P_6P_Cubic(v_col0_poles[4], v_col1_poles[4], v_col2_poles[4], u_tan_ratio)
         if equalVectors(proj_v_cols_v4[0], p41, 0.0000001):
             p42_h = proj_v_cols_v4[1]
         else:
-            print("failed to match tangent segment on p42_h calculation")
+            log_grid.warning("failed to match tangent segment on p42_h calculation")
         # p52 using v_cols : surf_0 points with surf_1 tangent ratio
         proj_v_cols_v5 = match_r_6P_6P_Cubic(v_col0_poles[5], v_col1_poles[5], v_col2_poles[5], u_tan_ratio)
         if equalVectors(proj_v_cols_v5[0], p51, 0.0000001):
             p52_h = proj_v_cols_v5[1]
         else:
-            print("failed to match tangent segment on p52_h calculation")
+            log_grid.warning("failed to match tangent segment on p52_h calculation")
 
         v00 = Base.Vector(0, 0, 0)
 
@@ -8464,7 +8986,7 @@ class SubGrid63_2Surf64:
         # Legs[35]=Part.LineSegment(p51, p52_h)
 
         fp.Legs = Legs
-        fp.Shape = Part.Shape(fp.Legs)
+        fp.Shape = Part.Shape(Legs)
 
 
 class ControlGridNStar66_NSub:
@@ -8741,9 +9263,9 @@ class ControlGridNStar66_NSub:
         self.StarDiag4_SubLoop(fp, fp.N)
         if fp.SquishDiag4 == 1:
             self.StarDiag4_squish(fp, fp.N)
-            print("Squish Diagonal 4")
+            log_star.debug("Squish Diagonal 4")
         else:
-            print("no Squish Diagonal 4!")
+            log_star.debug("no Squish Diagonal 4!")
 
         self.StarRow4_SubLoop(fp, fp.N)
         self.StarCenter(fp, fp.N)
@@ -8781,21 +9303,29 @@ class CubicNStarSurface_NStar66:
             HomogeneousGrids[i] = HGrid_i
         return HomogeneousGrids
 
-    def makeNSurf(self, fp, HomogeneousGrids, N):
+    def makeNSurf(self, HomogeneousGrids, N):  # worker thread: plain data in, no document object
         NSurf = [0] * N
         for i in range(N):
             NSurf[i] = NURBS_Cubic_66_surf(HomogeneousGrids[i])
         return NSurf
 
     def execute(self, fp):
+        if Silk_preview.isActive(fp):
+            datas = [{"builder": "NURBS_Cubic_66_surf", "WeightedPoles": StarGrid_i} for StarGrid_i in fp.NStarGrid.StarGrid]
+            Silk_preview.preview(fp, datas)
+            return
+
         # cast [x ,y, z] in linked NstarGrid back to Base.Vector
         HomogeneousGrids = self.HomogeneousGrids(fp, fp.NStarGrid.N)
 
-        # loop over the homogeneous grids to make the surfaces
-        NSurf = self.makeNSurf(fp, HomogeneousGrids, fp.NStarGrid.N)
+        # loop over the homogeneous grids to make the surfaces, on a worker thread. see Silk_background.py
+        Silk_background.submit(fp, self.makeNSurf, (HomogeneousGrids, fp.NStarGrid.N), self.commitNSurf)
+
+    def commitNSurf(self, fp, NSurf):
         fp.NSurf = NSurf
 
         fp.Shape = Part.Shape(fp.NSurf)
+        Silk_lod.update(fp, Silk_lod.surfaceDatas(fp))
 
 
 class StarTrim_CubicNStar:
@@ -8810,37 +9340,43 @@ class StarTrim_CubicNStar:
         obj.Proxy = self
 
     def execute(self, fp):
-        N = fp.CubicNStar.NStarGrid.N
+        # segmenting runs on a worker thread, from copies of the base surfaces. see Silk_background.py
+        Silk_background.submit(fp, self.trimStar, (fp.CubicNStar.NSurf, fp.CubicNStar.NStarGrid.N), self.commitTrim)
 
+    def trimStar(self, NSurf, N):
         NSurf_main = [0] * N
         for i in range(N):
-            surf_main = fp.CubicNStar.NSurf[i]
+            surf_main = NSurf[i].copy()
             surf_main.segment(0.0, 0.5, 0.0, 0.5)
             NSurf_main[i] = surf_main
-        fp.NSurf_main = NSurf_main
 
         NSurf_lead = [0] * N
         for i in range(N):
-            surf_lead = fp.CubicNStar.NSurf[i]
+            surf_lead = NSurf[i].copy()
             surf_lead.segment(0.5, 1.0, 0.0, 0.5)
             NSurf_lead[i] = surf_lead
-        fp.NSurf_lead = NSurf_lead
 
         NSurf_lag = [0] * N
         for i in range(N):
-            surf_lag = fp.CubicNStar.NSurf[i]
+            surf_lag = NSurf[i].copy()
             surf_lag.segment(0.0, 0.5, 0.5, 1.0)
             NSurf_lag[i] = surf_lag
-        fp.NSurf_lag = NSurf_lag
 
         NSurf_center = [0] * N
         for i in range(N):
-            surf_center = fp.CubicNStar.NSurf[i]
+            surf_center = NSurf[i].copy()
             surf_center.segment(0.5, 1.0, 0.5, 1.0)
             surf_center.insertUKnots([5.0 / 6.0], [1], 0.000001)
             surf_center.insertVKnots([5.0 / 6.0], [1], 0.000001)
             NSurf_center[i] = surf_center
-        fp.NSurf_center = NSurf_center
+
+        return [NSurf_main, NSurf_lead, NSurf_lag, NSurf_center]
+
+    def commitTrim(self, fp, trims):
+        fp.NSurf_main = trims[0]
+        fp.NSurf_lead = trims[1]
+        fp.NSurf_lag = trims[2]
+        fp.NSurf_center = trims[3]
 
         trim = fp.NSurf_main + fp.NSurf_lead + fp.NSurf_lag
 
@@ -9099,7 +9635,7 @@ class ControlGridNStar66_StarTrim:  # quick and dirty test for star center refin
         fp.StarGrid = [0] * fp.N
         # compile all SubGrid Poles and Weights into StarGrid attribute
         for n in range(fp.N):
-            print("n = ", n)
+            log_star.debug("n = ", n)
             # extract subgrid info from each StarTrim center section
             PoleArray = fp.StarTrim.NSurf_center[n].getPoles()
             Poles = [0] * 36
@@ -9116,7 +9652,7 @@ class ControlGridNStar66_StarTrim:  # quick and dirty test for star center refin
             StarGrid_n = [0] * 36
             for i in range(36):
                 # set Pole/Weight format [Base.Vector(), Float]
-                print("i = ", i)
+                log_star.debug("i = ", i)
                 StarGrid_n_i = [0, 0]
                 StarGrid_n_i[0] = Poles[i]
                 StarGrid_n_i[1] = Weights[i]
@@ -9148,3 +9684,72 @@ class ControlGridNStar66_StarTrim:  # quick and dirty test for star center refin
                 StarGrid_n_i[1] = fp.StarGrid[n][i][1]
                 StarGrid_n[i] = StarGrid_n_i
             fp.StarGrid[n] = StarGrid_n
+
+
+### surface analysis objects (+surfaces to input)
+class Isophotes:  # isophotes (zebra stripe borders) of Silk surfaces, for a light direction and a number of bands
+    # the normals are sampled once per surface and kept until its poles change (see surfaceNormals()), changing the
+    # light or the bands only contours the cached grids again (see marchingSquares()). the Shape is one compound of wires
+    def Isophotes_Attributes(self, obj, Surfaces, light, bands, samples, object_version):
+        # current attribute set
+        # inputs
+        obj.addProperty("App::PropertyLinkList", "Surfaces", "C1 - Inputs", "Silk surfaces").Surfaces = Surfaces
+        obj.addProperty("App::PropertyVector", "light", "C1 - Inputs", "light direction").light = light
+        obj.addProperty("App::PropertyIntegerConstraint", "bands", "C1 - Inputs", "number of stripes between 0 and 90 degrees from the light").bands = (bands, 2, 180, 1)
+        obj.addProperty("App::PropertyIntegerConstraint", "samples", "C1 - Inputs", "samples per surface direction").samples = (samples, 5, 400, 1)
+        # outputs
+        obj.addProperty("App::PropertyFloatList", "Levels", "C2 - Outputs", "angles between normal and light of the stripe borders").Levels
+        obj.setEditorMode("Levels", 1)
+        obj.addProperty("App::PropertyInteger", "Stripes", "C2 - Outputs", "number of wires").Stripes
+        obj.setEditorMode("Stripes", 1)
+        # additional object identifiers
+        obj.addProperty("App::PropertyString", "object_type", "C3 - Identifiers", "the workbench class used to create this object").object_type = "Isophotes"
+        obj.setEditorMode("object_type", 1)
+        obj.addProperty("App::PropertyString", "object_version", "C3 - Identifiers", "the class version of this object").object_version = object_version
+        obj.setEditorMode("object_version", 1)
+        obj.addProperty("App::PropertyString", "internalName", "C3 - Identifiers", "the permanent internal FreeCAD name for this object").internalName = obj.Name
+        obj.setEditorMode("internalName", 1)
+        return
+
+    def __init__(self, obj, Surfaces, light):
+        latest_version = "0.01"  # must match in onDocumentRestored()
+        self.Isophotes_Attributes(obj, Surfaces, light, 12, 41, latest_version)
+        obj.Proxy = self
+
+    def onDocumentRestored(self, obj):
+        # Migration function to set attributes between object versions. Preserves user data in object.
+        latest_version = "0.01"  # must match in __init__
+        if not obj.object_version == latest_version:
+            log_migration.info(obj.Name, " is out of date. Attribute format will be updated")
+
+    def execute(self, fp):
+        """Do something when doing a recomputation, this method is mandatory"""
+        if "Restore" in fp.State:
+            return
+
+        light = np.array([fp.light.x, fp.light.y, fp.light.z], dtype=float)
+        if np.linalg.norm(light) == 0.0:
+            log_kernel.error(fp.Label, ": the light direction is a zero vector")
+            fake_name_to_trigger_error = please_read_message_above
+        light = light / np.linalg.norm(light)
+
+        samples = fp.samples
+        if Silk_preview.sketchInEdit(fp.Document):
+            # a sketch is being dragged: coarser stripes, refined on the next recompute after the edit
+            samples = min(samples, 2 * Silk_preview.settings()[1] + 1)
+        levels = isophoteLevels(fp.bands)
+
+        wires = []
+        for surface in fp.Surfaces:
+            grids = surfaceNormals(surface, samples)
+            if not grids:
+                log_kernel.error(fp.Label, ": ", surface.Label, " is not a Silk surface")
+                fake_name_to_trigger_error = please_read_message_above
+            for points, normals in grids:
+                field = isophoteField(normals, light)
+                for level in levels:
+                    for line in marchingSquares(field, points, level):
+                        wires.append(Part.makePolygon([Base.Vector(*p) for p in line.tolist()]))
+        fp.Levels = levels
+        fp.Stripes = len(wires)
+        fp.Shape = Part.makeCompound(wires)
@@ -0,0 +1,58 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+
+import FreeCAD
+from FreeCAD import Gui
+import Silk_continuity
+from popup import tipsDialog
+
+# Locate Workbench Directory
+import os, Silk_dummy
+path_Silk = os.path.dirname(Silk_dummy.__file__)
+path_Silk_icons =  os.path.join( path_Silk, 'Resources', 'Icons')
+
+
+class Continuity_Silk():
+	def Activated(self):
+		# first click: analyze the seams of the active document and show the overlay. second click: remove the overlay
+		doc = FreeCAD.ActiveDocument
+		if doc is None:
+			return
+		if doc.Name in Silk_continuity.overlays:
+			Silk_continuity.clearOverlay(doc)
+			return
+
+		start = time.monotonic()
+		results = Silk_continuity.analyze(doc)
+		report = Silk_continuity.report(results)
+		FreeCAD.Console.PrintMessage("Silk Continuity: %d seams in %.2f s\n" % (len(results), time.monotonic() - start) + report + "\n")
+		Silk_continuity.showOverlay(doc, results)
+		tipsDialog("Silk Continuity: seams, worst first", report)
+
+	def GetResources(self):
+		return {'Pixmap' : path_Silk_icons + '/WIP.svg',
+				'MenuText': 'Silk Continuity',
+				'ToolTip': ' click once to check the continuity of every seam between Silk surfaces of the document \n'
+							' each seam is colored by the continuity reached: red gap, orange G0, yellow G1, cyan G2, green G3 \n'
+							' the table lists the worst gap, normal angle, curvature ratio and dC/ds mismatch of each seam \n'
+							' click again to remove the colored seams'}
+
+Gui.addCommand('Continuity_Silk', Continuity_Silk())
@@ -25,6 +25,7 @@ import FreeCAD as App
 import FreeCADGui as Gui
 
 import ArachNURBS as AN
+import Silk_viewproviders
 import Silk_tooltips
 from ToolTipWindow import tipsDialog
 
@@ -64,7 +65,7 @@ class ControlGrid44:
             poly3 = Gui.Selection.getSelection()[3]
             a = App.ActiveDocument.addObject("Part::FeaturePython", "ControlGrid44_4_000")
             AN.ControlGrid44_4(a, poly0, poly1, poly2, poly3)
-            a.ViewObject.Proxy = 0  # just set it to something different from None (this assignment is needed to run an internal notification)
+            Silk_viewproviders.ViewProviderControlNet(a.ViewObject)  # draws the control net straight from Poles
             a.ViewObject.LineWidth = 1.00
             a.ViewObject.LineColor = (0.67, 1.00, 1.00)
             a.ViewObject.PointSize = 4.00
@@ -76,7 +77,7 @@ class ControlGrid44:
             poly1 = Gui.Selection.getSelection()[1]
             poly2 = Gui.Selection.getSelection()[2]
             a = App.ActiveDocument.addObject("Part::FeaturePython", "ControlGrid44_3_000")
-            a.ViewObject.Proxy = 0  # just set it to something different from None (this assignment is needed to run an internal notification)
+            Silk_viewproviders.ViewProviderControlNet(a.ViewObject)  # draws the control net straight from Poles
             AN.ControlGrid44_3(a, poly0, poly1, poly2)
             a.ViewObject.LineWidth = 1.00
             a.ViewObject.LineColor = (0.67, 1.00, 1.00)
@@ -22,6 +22,7 @@ import FreeCAD, Part, math
 from FreeCAD import Base
 from FreeCAD import Gui
 import ArachNURBS as AN
+import Silk_viewproviders
 from popup import tipsDialog
 import Silk_tooltips
 
@@ -45,7 +46,7 @@ class ControlGrid44_flow():
 		grid=Gui.Selection.getSelection()[0]
 		a=FreeCAD.ActiveDocument.addObject("Part::FeaturePython","ControlGrid44_flow_000")
 		AN.ControlGrid44_flow(a,grid)
-		a.ViewObject.Proxy=0 # just set it to something different from None (this assignment is needed to run an internal notification)
+		Silk_viewproviders.ViewProviderControlNet(a.ViewObject)  # draws the control net straight from Poles
 		a.ViewObject.LineWidth = 1.00
 		a.ViewObject.LineColor = (0.67,1.00,1.00)
 		a.ViewObject.PointSize = 4.00
@@ -22,6 +22,7 @@ import FreeCAD, Part, math
 from FreeCAD import Base
 from FreeCAD import Gui
 import ArachNURBS as AN
+import Silk_viewproviders
 
 # Locate Workbench Directory
 import os, Silk_dummy
@@ -43,7 +44,7 @@ class ControlGrid64():
 			poly3=Gui.Selection.getSelection()[3]
 			a=FreeCAD.ActiveDocument.addObject("Part::FeaturePython","ControlGrid64_4_000")
 			AN.ControlGrid64_4(a,poly0, poly1, poly2, poly3)
-			a.ViewObject.Proxy=0 # just set it to something different from None (this assignment is needed to run an internal notification)
+			Silk_viewproviders.ViewProviderControlNet(a.ViewObject)  # draws the control net straight from Poles
 			a.ViewObject.LineWidth = 1.00
 			a.ViewObject.LineColor = (0.67,1.00,1.00)
 			a.ViewObject.PointSize = 4.00
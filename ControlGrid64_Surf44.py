@@ -23,6 +23,7 @@ import FreeCAD, Part, math
 from FreeCAD import Base
 from FreeCAD import Gui
 import ArachNURBS as AN
+import Silk_viewproviders
 from popup import tipsDialog
 import Silk_tooltips
 
@@ -69,7 +70,7 @@ class ControlGrid64_Surf44():
 
 		a=FreeCAD.ActiveDocument.addObject("Part::FeaturePython","ControlGrid64_Surf44_000")
 		AN.ControlGrid64_Surf44(a,Surf44, direction_to_raise)
-		a.ViewObject.Proxy=0 # just set it to something different from None (this assignment is needed to run an internal notification)
+		Silk_viewproviders.ViewProviderControlNet(a.ViewObject)  # draws the control net straight from Poles
 		a.ViewObject.LineWidth = 1.00
 		a.ViewObject.LineColor = (0.67,1.00,1.00)
 		a.ViewObject.PointSize = 4.00
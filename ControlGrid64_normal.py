@@ -22,6 +22,7 @@ import FreeCAD, Part, math
 from FreeCAD import Base
 from FreeCAD import Gui
 import ArachNURBS as AN
+import Silk_viewproviders
 from ArachNURBS import equalVectors
 
 # Locate Workbench Directory
@@ -81,7 +82,7 @@ class ControlGrid64_normal():
 
 			a=FreeCAD.ActiveDocument.addObject("Part::FeaturePython","ControlGrid64_normal_000")
 			AN.ControlGrid64_normal(a, Grid64, v0_normalize_2, v0_normalize_3, v3_normalize_20, v3_normalize_21)
-			a.ViewObject.Proxy=0 # just set it to something different from None (this assignment is needed to run an internal notification)
+			Silk_viewproviders.ViewProviderControlNet(a.ViewObject)  # draws the control net straight from Poles
 			a.ViewObject.LineWidth = 1.00
 			a.ViewObject.LineColor = (0.67,1.00,1.00)
 			a.ViewObject.PointSize = 4.00
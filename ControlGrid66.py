@@ -22,6 +22,7 @@ import FreeCAD, Part, math
 from FreeCAD import Base
 from FreeCAD import Gui
 import ArachNURBS as AN
+import Silk_viewproviders
 from popup import tipsDialog
 import Silk_tooltips
 
@@ -54,7 +55,7 @@ class ControlGrid66():
 			poly3=Gui.Selection.getSelection()[3]
 			a=FreeCAD.ActiveDocument.addObject("Part::FeaturePython","ControlGrid66_4_000")
 			AN.ControlGrid66_4(a,poly0, poly1, poly2, poly3)
-			a.ViewObject.Proxy=0 # just set it to something different from None (this assignment is needed to run an internal notification)
+			Silk_viewproviders.ViewProviderControlNet(a.ViewObject)  # draws the control net straight from Poles
 			a.ViewObject.LineWidth = 1.00
 			a.ViewObject.LineColor = (0.67,1.00,1.00)
 			a.ViewObject.PointSize = 4.00
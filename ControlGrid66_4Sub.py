@@ -22,6 +22,7 @@ import FreeCAD, Part, math
 from FreeCAD import Base
 from FreeCAD import Gui
 import ArachNURBS as AN
+import Silk_viewproviders
 
 # Locate Workbench Directory
 import os, Silk_dummy
@@ -38,7 +39,7 @@ class ControlGrid66_4Sub():
 		SubGrid_3=Gui.Selection.getSelection()[3]
 		a=FreeCAD.ActiveDocument.addObject("Part::FeaturePython","ControlGrid66_4Sub_000")
 		AN.ControlGrid66_4Sub(a,SubGrid_0, SubGrid_1, SubGrid_2, SubGrid_3)
-		a.ViewObject.Proxy=0 # just set it to something different from None (this assignment is needed to run an internal notification)
+		Silk_viewproviders.ViewProviderControlNet(a.ViewObject)  # draws the control net straight from Poles
 		a.ViewObject.LineWidth = 1.00
 		a.ViewObject.LineColor = (0.67,1.00,1.00)
 		a.ViewObject.PointSize = 4.00
@@ -0,0 +1,78 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2017
+#    edwardvmills@gmail.com
+#	
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench) 
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import division # allows floating point division from integers
+import FreeCAD
+from FreeCAD import Gui
+import ArachNURBS as AN
+import Silk_lod
+import Silk_viewproviders
+from popup import tipsDialog
+import Silk_tooltips
+
+# get strings
+tooltip = (Silk_tooltips.ControlGrid_Offset_baseTip + Silk_tooltips.standardTipFooter)
+moreInfo = (Silk_tooltips.ControlGrid_Offset_baseTip + Silk_tooltips.ControlGrid_Offset_moreInfo)
+
+# Locate Workbench Directory
+import os, Silk_dummy
+path_Silk = os.path.dirname(Silk_dummy.__file__)
+path_Silk_icons =  os.path.join( path_Silk, 'Resources', 'Icons')
+iconPath = path_Silk_icons + '/WIP.svg'
+
+# surface class and name for each grid layout
+surface_classes = {
+	"Bezier_Bicubic_surf": (AN.CubicSurface_44, "CubicSurface_44_000"),
+	"NURBS_Cubic_64_surf": (AN.CubicSurface_64, "CubicSurface_64_000"),
+	"NURBS_Cubic_66_surf": (AN.CubicSurface_66, "CubicSurface_66_000"),
+}
+
+class ControlGrid_Offset():
+	def Activated(self):
+		sel=Gui.Selection.getSelection()
+		surfaces = [obj for obj in sel if len(Silk_lod.surfaceDatas(obj)) == 1 and Silk_lod.surfaceDatas(obj)[0]["builder"] in surface_classes]
+		if len(surfaces)==0:
+			tipsDialog("Silk: ControlGrid_Offset", moreInfo)
+			return
+
+		# one grid / surface pair per selected surface, all with the same distance so their borders stay together
+		for surface in surfaces:
+			builder = Silk_lod.surfaceDatas(surface)[0]["builder"]
+			a=FreeCAD.ActiveDocument.addObject("Part::FeaturePython","ControlGrid_Offset_000")
+			AN.ControlGrid_Offset(a,surface,1.0)
+			Silk_viewproviders.ViewProviderControlNet(a.ViewObject)  # draws the control net straight from Poles
+			a.ViewObject.LineWidth = 1.00
+			a.ViewObject.LineColor = (0.67,1.00,1.00)
+			a.ViewObject.PointSize = 4.00
+			a.ViewObject.PointColor = (0.00,0.33,1.00)
+
+			surface_class, name = surface_classes[builder]
+			b=FreeCAD.ActiveDocument.addObject("Part::FeaturePython",name)
+			surface_class(b,a)
+			b.ViewObject.Proxy=0 # just set it to something different from None (this assignment is needed to run an internal notification)
+			b.ViewObject.DisplayMode = u"Shaded"
+			b.ViewObject.ShapeColor = (0.33,0.67,1.00)
+		FreeCAD.ActiveDocument.recompute()
+
+	def GetResources(self):
+		return {'Pixmap' :  iconPath,
+	  			'MenuText': 'ControlGrid_Offset',
+				'ToolTip': tooltip}
+
+Gui.addCommand('ControlGrid_Offset', ControlGrid_Offset())
@@ -25,6 +25,7 @@ import FreeCAD as App
 import FreeCADGui as Gui
 
 import ArachNURBS as AN
+import Silk_viewproviders
 import Silk_tooltips
 from ToolTipWindow import tipsDialog
 
@@ -179,7 +180,7 @@ class ControlPoly4:
             print("Selection not recognized, check tooltip")
 
         if cp4:
-            cp4.ViewObject.Proxy = 0  # just set it to something different from None (this assignment is needed to run an internal notification)
+            Silk_viewproviders.ViewProviderControlNet(cp4.ViewObject)  # draws the control net straight from Poles
             cp4.ViewObject.LineWidth = 1.00
             cp4.ViewObject.LineColor = (0.00, 1.00, 1.00)
             cp4.ViewObject.PointSize = 4.00
@@ -22,6 +22,7 @@ import FreeCAD, Part, math
 from FreeCAD import Base
 from FreeCAD import Gui
 import ArachNURBS as AN
+import Silk_viewproviders
 from popup import tipsDialog
 import Silk_tooltips
 
@@ -46,10 +47,17 @@ class ControlPoly4_segment():
 		NL_Curve=selx[0].Object			# this is a resilient link to the underlying object
 		Point_onCurve_0=selx[1].Object	# this is a resilient link to the underlying object
 		Point_onCurve_1=selx[2].Object	# this is a resilient link to the underlying object
+		# a vertex picked on a PointArray_onCurve gives the index of the point: Vertex1 is index 0
+		index_0=0
+		index_1=0
+		if selx[1].SubElementNames and selx[1].SubElementNames[0].startswith("Vertex"):
+			index_0=int(selx[1].SubElementNames[0][6:])-1
+		if selx[2].SubElementNames and selx[2].SubElementNames[0].startswith("Vertex"):
+			index_1=int(selx[2].SubElementNames[0][6:])-1
 
 		a=FreeCAD.ActiveDocument.addObject("Part::FeaturePython","ControlPoly4_segment_000")
-		AN.ControlPoly4_segment(a,NL_Curve, Point_onCurve_0, Point_onCurve_1)
-		a.ViewObject.Proxy=0 # just set it to something different from None (this assignment is needed to run an internal notification)
+		AN.ControlPoly4_segment(a,NL_Curve, Point_onCurve_0, Point_onCurve_1, index_0, index_1)
+		Silk_viewproviders.ViewProviderControlNet(a.ViewObject)  # draws the control net straight from Poles
 		a.ViewObject.LineWidth = 1.00
 		a.ViewObject.LineColor = (0.00,1.00,1.00)
 		a.ViewObject.PointSize = 4.00
@@ -0,0 +1,83 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#	
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench) 
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import division # allows floating point division from integers
+import FreeCAD
+from FreeCAD import Gui
+import ArachNURBS as AN
+import Silk_viewproviders
+from popup import tipsDialog
+import Silk_tooltips
+
+# get strings
+tooltip = (Silk_tooltips.ControlPoly4_segments_baseTip + Silk_tooltips.standardTipFooter)
+moreInfo = (Silk_tooltips.ControlPoly4_segments_baseTip + Silk_tooltips.ControlPoly4_segments_moreInfo)
+
+# Locate Workbench Directory
+import os, Silk_dummy
+path_Silk = os.path.dirname(Silk_dummy.__file__)
+path_Silk_icons =  os.path.join( path_Silk, 'Resources', 'Icons')
+iconPath = path_Silk_icons + '/ControlPoly4_segment.svg'
+
+def setNetView(a):
+	Silk_viewproviders.ViewProviderControlNet(a.ViewObject)  # draws the control net straight from Poles
+	a.ViewObject.LineWidth = 1.00
+	a.ViewObject.LineColor = (0.00,1.00,1.00)
+	a.ViewObject.PointSize = 4.00
+	a.ViewObject.PointColor = (0.00,0.00,1.00)
+
+class ControlPoly4_segments():
+	def Activated(self):
+		sel=Gui.Selection.getSelection()
+		if len(sel)==0:
+			tipsDialog("Silk: ControlPoly4_segments", moreInfo)
+			return
+		
+		selx=Gui.Selection.getSelectionEx()
+		if len(selx)==1 and hasattr(selx[0].Object, "object_type") and selx[0].Object.object_type=="ControlPoly4_segments":
+			# a ControlPoly4_segments alone: one standalone ControlPoly4_piece per piece, for the grid tools
+			Segments=selx[0].Object
+			for index in range(Segments.Pieces):
+				a=FreeCAD.ActiveDocument.addObject("Part::FeaturePython","ControlPoly4_piece_000")
+				AN.ControlPoly4_piece(a,Segments, index)
+				setNetView(a)
+			Segments.ViewObject.Visibility = False
+			FreeCAD.ActiveDocument.recompute()
+			return
+
+		NL_Curve=selx[0].Object			# this is a resilient link to the underlying object
+		cut_points=[s.Object for s in selx[1:]]	# Point_onCurve / PointArray_onCurve objects
+		# points picked on the curve give the cuts when no point object is selected
+		u_cuts=[]
+		if len(cut_points)==0:
+			u_cuts=sorted([NL_Curve.Shape.Curve.parameter(Pick) for Pick in selx[0].PickedPoints])
+			if len(u_cuts)==0:
+				u_cuts=[0.5]
+
+		a=FreeCAD.ActiveDocument.addObject("Part::FeaturePython","ControlPoly4_segments_000")
+		AN.ControlPoly4_segments(a,NL_Curve, cut_points, u_cuts)
+		setNetView(a)
+		FreeCAD.ActiveDocument.recompute()
+	
+	def GetResources(self):
+		return {'Pixmap' :  iconPath,
+	  			'MenuText': 'ControlPoly4_segments',
+				'ToolTip': tooltip}
+
+Gui.addCommand('ControlPoly4_segments', ControlPoly4_segments())
@@ -22,6 +22,7 @@ import FreeCAD, Part, math
 from FreeCAD import Base
 from FreeCAD import Gui
 import ArachNURBS as AN
+import Silk_viewproviders
 from popup import tipsDialog
 import Silk_tooltips
 
@@ -78,7 +79,7 @@ class ControlPoly6():
 			sketch=Gui.Selection.getSelection()[0]
 			a=FreeCAD.ActiveDocument.addObject("Part::FeaturePython","ControlPoly6_5L_000")
 			AN.ControlPoly6_5L(a,sketch)
-			a.ViewObject.Proxy=0 # just set it to something different from None (this assignment is needed to run an internal notification)
+			Silk_viewproviders.ViewProviderControlNet(a.ViewObject)  # draws the control net straight from Poles
 			a.ViewObject.LineWidth = 1.00
 			a.ViewObject.LineColor = (0.00,1.00,1.00)
 			a.ViewObject.PointSize = 4.00
@@ -89,7 +90,7 @@ class ControlPoly6():
 			sketch=Gui.Selection.getSelection()[0]
 			a=FreeCAD.ActiveDocument.addObject("Part::FeaturePython","ControlPoly6_FirstElement_000")
 			AN.ControlPoly6_FirstElement(a,sketch)
-			a.ViewObject.Proxy=0 # just set it to something different from None (this assignment is needed to run an internal notification)
+			Silk_viewproviders.ViewProviderControlNet(a.ViewObject)  # draws the control net straight from Poles
 			a.ViewObject.LineWidth = 1.00
 			a.ViewObject.LineColor = (0.00,1.00,1.00)
 			a.ViewObject.PointSize = 4.00
@@ -101,7 +102,7 @@ class ControlPoly6():
 			sketch1=Gui.Selection.getSelection()[1]
 			a=FreeCAD.ActiveDocument.addObject("Part::FeaturePython","ControlPoly6_2N_000")
 			AN.ControlPoly6_2N(a,sketch0,sketch1)
-			a.ViewObject.Proxy=0 # just set it to something different from None (this assignment is needed to run an internal notification)
+			Silk_viewproviders.ViewProviderControlNet(a.ViewObject)  # draws the control net straight from Poles
 			a.ViewObject.LineWidth = 1.00
 			a.ViewObject.LineColor = (0.00,1.00,1.00)
 			a.ViewObject.PointSize = 4.00
@@ -113,7 +114,7 @@ class ControlPoly6():
 			CubicCurve4_1=Gui.Selection.getSelection()[1]
 			a=FreeCAD.ActiveDocument.addObject("Part::FeaturePython","ControlPoly6_FilletBezier_000")
 			AN.ControlPoly6_FilletBezier(a,CubicCurve4_0,CubicCurve4_1)
-			a.ViewObject.Proxy=0 # just set it to something different from None (this assignment is needed to run an internal notification)
+			Silk_viewproviders.ViewProviderControlNet(a.ViewObject)  # draws the control net straight from Poles
 			a.ViewObject.LineWidth = 1.00
 			a.ViewObject.LineColor = (0.00,1.00,1.00)
 			a.ViewObject.PointSize = 4.00
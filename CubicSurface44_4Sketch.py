@@ -0,0 +1,63 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# spellchecker: ignore Arach NURBS pixmap
+
+from __future__ import division  # allows floating point division from integers
+
+import FreeCAD as App
+import FreeCADGui as Gui
+
+import ArachNURBS as AN
+import Silk_tooltips
+from ToolTipWindow import tipsDialog
+
+# get strings
+tooltip = Silk_tooltips.CubicSurface44_4Sketch_baseTip + Silk_tooltips.standardTipFooter
+moreInfo = Silk_tooltips.CubicSurface44_4Sketch_baseTip + Silk_tooltips.CubicSurface44_4Sketch_moreInfo
+
+# Locate Workbench Directory & icon
+import os
+
+import Silk_dummy
+
+path_Silk = os.path.dirname(Silk_dummy.__file__)
+path_Silk_icons = os.path.join(path_Silk, "Resources", "Icons")
+iconPath = path_Silk_icons + "/CubicSurface_44.svg"
+
+
+class CubicSurface44_4Sketch:
+    def Activated(self):
+        sel = Gui.Selection.getSelection()
+        if len(sel) != 4:
+            tipsDialog("Silk: CubicSurface44_4Sketch", moreInfo)
+            return
+
+        a = App.ActiveDocument.addObject("Part::FeaturePython", "CubicSurface44_4Sketch_000")
+        AN.CubicSurface44_4Sketch(a, sel[0], sel[1], sel[2], sel[3])
+        a.ViewObject.Proxy = 0  # just set it to something different from None (this assignment is needed to run an internal notification)
+        a.ViewObject.DisplayMode = "Shaded"
+        a.ViewObject.ShapeColor = (0.33, 0.67, 1.00)
+        App.ActiveDocument.recompute()
+
+    def GetResources(self):
+        return {"Pixmap": iconPath, "MenuText": "CubicSurface44_4Sketch", "ToolTip": tooltip}
+
+
+Gui.addCommand("CubicSurface44_4Sketch", CubicSurface44_4Sketch())
@@ -0,0 +1,72 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+# spellchecker: ignore Arach NURBS pixmap
+
+from __future__ import division  # allows floating point division from integers
+
+import FreeCAD as App
+import FreeCADGui as Gui
+import numpy as np
+
+import ArachNURBS as AN
+import Silk_tooltips
+from ToolTipWindow import tipsDialog
+
+# get strings
+tooltip = Silk_tooltips.CurvatureComb_baseTip + Silk_tooltips.standardTipFooter
+moreInfo = Silk_tooltips.CurvatureComb_baseTip + Silk_tooltips.CurvatureComb_moreInfo
+
+# Locate Workbench Directory & icon
+import os
+
+import Silk_dummy
+
+path_Silk = os.path.dirname(Silk_dummy.__file__)
+path_Silk_icons = os.path.join(path_Silk, "Resources", "Icons")
+iconPath = path_Silk_icons + "/CubicCurve_6.svg"
+
+
+class CurvatureComb:
+    def Activated(self):
+        sel = Gui.Selection.getSelection()
+        curves = [obj for obj in sel if AN.polyCurveData(obj) is not None]
+        if len(curves) == 0:
+            tipsDialog("Silk: CurvatureComb", moreInfo)
+            return
+
+        for curve in curves:
+            # initial scale: the longest tooth is a quarter of the curve size
+            points, normals, k, dcds = AN.curveCurvature(AN.polyCurveData(curve), 65)
+            size = float(np.linalg.norm(points.max(axis=0) - points.min(axis=0)))
+            peak = float(np.max(np.abs(k)))
+            scale = 0.25 * size / peak if peak > 0.0 else 1.0
+
+            a = App.ActiveDocument.addObject("Part::FeaturePython", "CurvatureComb_000")
+            AN.CurvatureComb(a, curve, scale)
+            a.ViewObject.Proxy = 0  # just set it to something different from None (this assignment is needed to run an internal notification)
+            a.ViewObject.LineWidth = 1.00
+            a.ViewObject.LineColor = (1.00, 0.33, 0.00)
+            a.ViewObject.PointSize = 1.00
+        App.ActiveDocument.recompute()
+
+    def GetResources(self):
+        return {"Pixmap": iconPath, "MenuText": "CurvatureComb", "ToolTip": tooltip}
+
+
+Gui.addCommand("CurvatureComb", CurvatureComb())
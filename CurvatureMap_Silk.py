@@ -0,0 +1,64 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+
+import FreeCAD
+from FreeCAD import Gui
+import Silk_curvature
+from popup import tipsDialog
+
+# Locate Workbench Directory
+import os, Silk_dummy
+path_Silk = os.path.dirname(Silk_dummy.__file__)
+path_Silk_icons =  os.path.join( path_Silk, 'Resources', 'Icons')
+
+
+class CurvatureMap_Silk():
+	def Activated(self):
+		# first click: curvature maps of the active document, shown over the surfaces. second click: remove the overlay
+		doc = FreeCAD.ActiveDocument
+		if doc is None:
+			return
+		if doc.Name in Silk_curvature.overlays:
+			Silk_curvature.clearOverlay(doc)
+			return
+
+		start = time.monotonic()
+		samples, measure, flat_factor, export_path = Silk_curvature.settings()
+		results = Silk_curvature.analyze(doc)
+		if not results:
+			return
+		report = Silk_curvature.report(results)
+		FreeCAD.Console.PrintMessage("Silk Curvature Map: %d patches in %.2f s\n" % (len(results), time.monotonic() - start) + report + "\n")
+		if export_path:
+			Silk_curvature.export(export_path, results)
+		Silk_curvature.showOverlay(doc, results, measure)
+		tipsDialog("Silk Curvature Map: patches, highest curvature first", report)
+
+	def GetResources(self):
+		return {'Pixmap' : path_Silk_icons + '/WIP.svg',
+				'MenuText': 'Silk Curvature Map',
+				'ToolTip': ' click once to map the curvature of every Silk surface of the document \n'
+							' surfaces are colored by Gaussian curvature by default: blue negative, white flat, red positive \n'
+							' the table lists the curvature range of each patch, its highest curvature and its flat share \n'
+							' the measure shown, the samples and an export file (.csv / .npz) are set in Preferences/Mod/Silk, see Silk_curvature.py \n'
+							' click again to remove the colors'}
+
+Gui.addCommand('CurvatureMap_Silk', CurvatureMap_Silk())
@@ -33,11 +33,16 @@ class Silk (Workbench):
 		import ControlPoly4
 		import CubicCurve_4
 		import Point_onCurve
+		import PointArray_onCurve
 		import ControlPoly4_segment
+		import ControlPoly4_segments
+		import CurvatureComb
+		import Isophotes
 		import ControlGrid44
 		import ControlGrid44_Rotate
 		import ControlGrid44_flow
 		import CubicSurface_44
+		import CubicSurface44_4Sketch
 		import ControlGrid44_EdgeSegment
 		import ControlGrid44_2EdgeSegments
 		import ControlPoly6
@@ -50,6 +55,7 @@ class Silk (Workbench):
 		import ControlGrid64_3_1Grid44
 		import ControlGrid64_normal
 		import ControlGrid64_Surf44
+		import ControlGrid_Offset
 		import SubGrid33_2Grid64
 		import ControlGrid66_4Sub
 		import SubGrid63_2Surf64
@@ -57,16 +63,26 @@ class Silk (Workbench):
 		import CubicNStarSurface_NStar66
 		import StarTrim_CubicNStar
 		import Reload_Silk
+		import Recompute_Silk
+		import Profiler_Silk
+		import Continuity_Silk
+		import CurvatureMap_Silk
+		import MassProperties_Silk
 
 		# A list of command names created by the imports above
 		self.list = ["ControlPoly4",
 					"CubicCurve_4", 
 					"Point_onCurve", 
+					"PointArray_onCurve",
 					"ControlPoly4_segment",
+					"ControlPoly4_segments",
+					"CurvatureComb",
+					"Isophotes",
 					"ControlGrid44",
 					"ControlGrid44_Rotate",
 					"ControlGrid44_flow",
 					"CubicSurface_44",
+					"CubicSurface44_4Sketch",
 					"ControlGrid44_EdgeSegment",
 					"ControlGrid44_2EdgeSegments",
 					"ControlPoly6",
@@ -79,6 +95,7 @@ class Silk (Workbench):
 					"ControlGrid64_3_1Grid44",
 					"ControlGrid64_normal",
 					"ControlGrid64_Surf44",
+					"ControlGrid_Offset",
 					"SubGrid33_2Grid64",
 					"ControlGrid66_4Sub",
 					"SubGrid63_2Surf64",
@@ -86,6 +103,11 @@ class Silk (Workbench):
 					"CubicNStarSurface_NStar66",
 					"StarTrim_CubicNStar",
 					"Reload_Silk",
+					"Recompute_Silk",
+					"Profiler_Silk",
+					"Continuity_Silk",
+					"CurvatureMap_Silk",
+					"MassProperties_Silk",
 					"SilkPose"] 
 					
 		
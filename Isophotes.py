@@ -0,0 +1,69 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+# spellchecker: ignore Arach NURBS pixmap isophotes
+
+from __future__ import division  # allows floating point division from integers
+
+import FreeCAD as App
+import FreeCADGui as Gui
+
+import ArachNURBS as AN
+import Silk_lod
+import Silk_tooltips
+from ToolTipWindow import tipsDialog
+
+# get strings
+tooltip = Silk_tooltips.Isophotes_baseTip + Silk_tooltips.standardTipFooter
+moreInfo = Silk_tooltips.Isophotes_baseTip + Silk_tooltips.Isophotes_moreInfo
+
+# Locate Workbench Directory & icon
+import os
+
+import Silk_dummy
+
+path_Silk = os.path.dirname(Silk_dummy.__file__)
+path_Silk_icons = os.path.join(path_Silk, "Resources", "Icons")
+iconPath = path_Silk_icons + "/WIP.svg"
+
+
+class Isophotes:
+    def Activated(self):
+        sel = Gui.Selection.getSelection()
+        surfaces = [obj for obj in sel if Silk_lod.surfaceDatas(obj)]
+        if len(surfaces) == 0:
+            tipsDialog("Silk: Isophotes", moreInfo)
+            return
+
+        # light from the current view, so the first stripes look like the reflections on screen
+        view = Gui.ActiveDocument.ActiveView
+        light = view.getViewDirection() if hasattr(view, "getViewDirection") else App.Vector(0, 0, -1)
+
+        a = App.ActiveDocument.addObject("Part::FeaturePython", "Isophotes_000")
+        AN.Isophotes(a, surfaces, light)
+        a.ViewObject.Proxy = 0  # just set it to something different from None (this assignment is needed to run an internal notification)
+        a.ViewObject.LineWidth = 1.00
+        a.ViewObject.LineColor = (0.00, 0.00, 0.00)
+        a.ViewObject.PointSize = 1.00
+        App.ActiveDocument.recompute()
+
+    def GetResources(self):
+        return {"Pixmap": iconPath, "MenuText": "Isophotes", "ToolTip": tooltip}
+
+
+Gui.addCommand("Isophotes", Isophotes())
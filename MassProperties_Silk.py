@@ -0,0 +1,54 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+
+import FreeCAD
+from FreeCAD import Gui
+import Silk_lod
+import Silk_mass
+from popup import tipsDialog
+
+# Locate Workbench Directory
+import os, Silk_dummy
+path_Silk = os.path.dirname(Silk_dummy.__file__)
+path_Silk_icons =  os.path.join( path_Silk, 'Resources', 'Icons')
+
+
+class MassProperties_Silk():
+	def Activated(self):
+		# the selected Silk surfaces, or all those of the active document when none is selected
+		if FreeCAD.ActiveDocument is None:
+			return
+		objects = [obj for obj in Gui.Selection.getSelection() if Silk_lod.surfaceDatas(obj)]
+
+		start = time.monotonic()
+		result = Silk_mass.analyze(objects or None)
+		report = Silk_mass.report(result)
+		FreeCAD.Console.PrintMessage("Silk Mass Properties: %d patches in %.3f s\n" % (len(result["patches"]), time.monotonic() - start) + report + "\n")
+		tipsDialog("Silk Mass Properties", report)
+
+	def GetResources(self):
+		return {'Pixmap' : path_Silk_icons + '/WIP.svg',
+				'MenuText': 'Silk Mass Properties',
+				'ToolTip': ' area, centroid and inertia of the selected Silk surfaces, or of all those of the document \n'
+							' when the surfaces form closed shells, also the enclosed volume, its center and inertia \n'
+							' patches are oriented from their shared borders, the normals of the surfaces do not need to agree'}
+
+Gui.addCommand('MassProperties_Silk', MassProperties_Silk())
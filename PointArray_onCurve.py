@@ -0,0 +1,62 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#	
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench) 
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from __future__ import division # allows floating point division from integers
+import FreeCAD
+from FreeCAD import Gui
+import ArachNURBS as AN
+from popup import tipsDialog
+import Silk_tooltips
+
+# get strings
+tooltip = (Silk_tooltips.PointArray_onCurve_baseTip + Silk_tooltips.standardTipFooter)
+moreInfo = (Silk_tooltips.PointArray_onCurve_baseTip + Silk_tooltips.PointArray_onCurve_moreInfo)
+
+# Locate Workbench Directory
+import os, Silk_dummy
+path_Silk = os.path.dirname(Silk_dummy.__file__)
+path_Silk_icons =  os.path.join( path_Silk, 'Resources', 'Icons')
+iconPath = path_Silk_icons + '/Point_onCurve.svg'
+
+class PointArray_onCurve():
+	def Activated(self):
+		sel=Gui.Selection.getSelection()
+		if len(sel)==0:
+			tipsDialog("Silk: PointArray_onCurve", moreInfo)
+			return	
+
+		selx=Gui.Selection.getSelectionEx()[0]
+		AN_Curve=selx.Object					# this is a resilient link to the underlying object
+		# picked points, if any, give the initial parameter list. otherwise the points are evenly spaced
+		u_list=sorted([AN_Curve.Shape.Curve.parameter(Pick) for Pick in selx.PickedPoints])
+
+		a=FreeCAD.ActiveDocument.addObject("Part::FeaturePython","PointArray_onCurve_000")
+		AN.PointArray_onCurve(a,AN_Curve, u_list)
+		a.ViewObject.Proxy=0 # just set it to something different from None (this assignment is needed to run an internal notification)
+		a.ViewObject.PointSize = 5.00
+		a.ViewObject.PointColor = (1.00,0.00,0.00)
+		FreeCAD.ActiveDocument.recompute()
+			
+	def GetResources(self):
+		return {'Pixmap' :  iconPath,
+	  			'MenuText': 'PointArray_onCurve',
+				'ToolTip': tooltip}
+
+Gui.addCommand('PointArray_onCurve', PointArray_onCurve())
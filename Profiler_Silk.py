@@ -0,0 +1,59 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import FreeCAD
+from FreeCAD import Gui
+import Silk_profiler
+from popup import tipsDialog
+
+# Locate Workbench Directory
+import os, Silk_dummy
+path_Silk = os.path.dirname(Silk_dummy.__file__)
+path_Silk_icons =  os.path.join( path_Silk, 'Resources', 'Icons')
+
+
+class Profiler_Silk():
+	def Activated(self):
+		# first click: start recording. second click: report, offer the trace export, stop recording.
+		if not Silk_profiler.enabled:
+			Silk_profiler.reset()
+			Silk_profiler.enable()
+			FreeCAD.Console.PrintMessage("Silk Profiler: recording. recompute or edit the model, then click Silk Profiler again for the report\n")
+			return
+
+		Silk_profiler.disable()
+		report = Silk_profiler.summary()
+		FreeCAD.Console.PrintMessage("Silk Profiler: slowest objects\n" + report + "\n")
+		tipsDialog("Silk Profiler: slowest objects", report)
+
+		from PySide import QtGui
+		path = QtGui.QFileDialog.getSaveFileName(None, "Export Chrome trace", "silk_trace.json", "Chrome trace (*.json)")[0]
+		if path:
+			count = Silk_profiler.exportChromeTrace(path)
+			FreeCAD.Console.PrintMessage("Silk Profiler: %d events written to %s\n" % (count, path))
+
+	def GetResources(self):
+		return {'Pixmap' : path_Silk_icons + '/WIP.svg',
+				'MenuText': 'Silk Profiler',
+				'ToolTip': ' click once to start recording Silk recompute timings \n'
+							' click again to show the slowest objects (execute time, OCC constructions, segment(), \n'
+							' parameter(), insertKnot calls, property writes) and export them as a Chrome trace \n'
+							' the profiler costs nothing while it is not recording'}
+
+Gui.addCommand('Profiler_Silk', Profiler_Silk())
@@ -0,0 +1,49 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+import FreeCAD
+from FreeCAD import Gui
+import Silk_scheduler
+
+# Locate Workbench Directory
+import os, Silk_dummy
+path_Silk = os.path.dirname(Silk_dummy.__file__)
+path_Silk_icons =  os.path.join( path_Silk, 'Resources', 'Icons')
+
+
+class Recompute_Silk():
+	def Activated(self):
+		if FreeCAD.ActiveDocument is None:
+			return
+		start = time.perf_counter()
+		count = Silk_scheduler.recompute(FreeCAD.ActiveDocument)
+		FreeCAD.Console.PrintMessage("Recompute_Silk: %d objects recomputed in %.3f s\n" % (count, time.perf_counter() - start))
+
+	def IsActive(self):
+		return FreeCAD.ActiveDocument is not None
+
+	def GetResources(self):
+		return {'Pixmap' : path_Silk_icons + '/WIP.svg',
+				'MenuText': 'Recompute_Silk',
+				'ToolTip': ' recompute the active document, building independent Silk curves and surfaces \n serially or on a pool of worker processes (or threads) \n'
+							' mode and number of workers: Tools -> Edit parameters -> Preferences/Mod/Silk \n'
+							' RecomputeMode = serial (default), thread or process, RecomputeWorkers = 0 for one per core'}
+
+Gui.addCommand('Recompute_Silk', Recompute_Silk())
@@ -1,3 +1,6 @@
+import ast
+import re
+import FreeCAD
 from FreeCAD import Gui
 from importlib import reload
 
@@ -7,15 +10,80 @@ path_Silk = os.path.dirname(Silk_dummy.__file__)
 path_Silk_icons =  os.path.join( path_Silk, 'Resources', 'Icons')
 
 
+def topLevelSources(module):
+	# {name: source text} for every top level class and function of the module file
+	with open(module.__file__.replace('.pyc', '.py')) as f:
+		text = f.read()
+	sources = {}
+	for node in ast.parse(text).body:
+		if isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+			sources[node.name] = ast.get_source_segment(text, node)
+	return sources
+
+def changedClasses(old_sources, new_sources):
+	# classes whose own source changed, or which use a top level function whose source changed
+	changed_functions = [name for name, src in new_sources.items() if not src.startswith('class ') and old_sources.get(name) != src]
+	changed = set()
+	for name, src in new_sources.items():
+		if not src.startswith('class '):
+			continue
+		if old_sources.get(name) != src or any(re.search(r'\b' + f + r'\b', src) for f in changed_functions):
+			changed.add(name)
+	return changed
+
+def rebind(owner, module):
+	# swap owner.Proxy for an instance of the reloaded class of the same name, keeping its state
+	proxy = getattr(owner, 'Proxy', None)
+	if proxy is None or type(proxy).__module__ != module.__name__:
+		return None
+	new_class = getattr(module, type(proxy).__name__, None)
+	if new_class is None:
+		return None
+	new_proxy = new_class.__new__(new_class)
+	new_proxy.__dict__.update(proxy.__dict__)
+	owner.Proxy = new_proxy
+	return new_class.__name__
+
+
+# snapshot of the kernel source as it was loaded. the file on disk is already the edited one by the time
+# the reload is requested, so this is what the reloaded classes are compared against
+import ArachNURBS
+loaded_sources = topLevelSources(ArachNURBS)
+
+
 class Reload_Silk():
 	def Activated(self):
-		import ArachNURBS
+		import Silk_profiler
+		# the profiler wraps kernel functions, let it put the originals back first
+		Silk_profiler.disable()
+
+		global loaded_sources
 		reload(ArachNURBS)
+		new_sources = topLevelSources(ArachNURBS)
+		changed = changedClasses(loaded_sources, new_sources)
+		loaded_sources = new_sources
+
+		for doc in FreeCAD.listDocuments().values():
+			rebound = 0
+			touched = 0
+			for obj in doc.Objects:
+				class_name = rebind(obj, ArachNURBS)
+				if class_name is not None:
+					rebound = rebound + 1
+				if hasattr(obj, 'ViewObject') and obj.ViewObject is not None:
+					rebind(obj.ViewObject, ArachNURBS)
+				if class_name in changed:
+					obj.touch()
+					touched = touched + 1
+			if touched:
+				doc.recompute()
+			FreeCAD.Console.PrintMessage("Reload_Silk: %s, %d objects rebound, %d recomputed (changed classes: %s)\n"
+				% (doc.Label, rebound, touched, ', '.join(sorted(changed)) or 'none'))
 
 	def GetResources(self):
 		return {'Pixmap' : path_Silk_icons + '/WIP.svg',
 				'MenuText': 'Reload_Silk',
-				'ToolTip': ' reload the Silk workbench (actually just the core library) \n without exiting FreeCAD \n if you have made code changes'}
+				'ToolTip': ' reload the Silk workbench (actually just the core library) \n without exiting FreeCAD \n if you have made code changes \n'
+							' objects in open documents are switched over to the reloaded classes, \n and only objects whose class changed are recomputed'}
 
 Gui.addCommand('Reload_Silk', Reload_Silk())
-
@@ -0,0 +1,149 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+## Background construction for the slow Silk objects (autoG3 blends, N-star surfaces, StarTrim).
+##
+## An execute() splits its work in three:
+##   - read everything it needs from the document, as plain values (GUI thread, inside the recompute)
+##   - compute(*args): the slow part. must not touch the document (worker thread)
+##   - commit(fp, result): write all the outputs (GUI thread, once the worker is done)
+## and calls submit(fp, compute, args, commit). The object keeps showing its previous outputs meanwhile,
+## and a busy indicator is shown in the status bar.
+##
+## All the outputs of a job are written in one go, then the objects depending on it are recomputed.
+## A new submit() for the same object supersedes the previous job: it is cancelled if it has not started yet,
+## and its result is dropped otherwise.
+##
+## Without a GUI, or with the setting off, submit() computes and commits right away, inside execute().
+##
+## Settings, in Tools -> Edit parameters -> Preferences/Mod/Silk:
+##   BackgroundJobs      enable background construction   default: True
+##   BackgroundWorkers   number of worker threads         default: 2
+
+import concurrent.futures
+import time
+
+import FreeCAD
+
+import Silk_debounce
+import Silk_log
+
+log = Silk_log.getLogger("background")
+
+param_path = "User parameter:BaseApp/Preferences/Mod/Silk"
+
+jobs = {}  # (document name, object name) -> [future, commit, start time]. a superseded job is no longer listed
+_pool = None
+_timer = None
+_indicator = None
+
+
+def enabled():
+    return FreeCAD.GuiUp and FreeCAD.ParamGet(param_path).GetBool("BackgroundJobs", True)
+
+
+def pool():
+    global _pool
+    if _pool is None:
+        workers = max(1, FreeCAD.ParamGet(param_path).GetInt("BackgroundWorkers", 2))
+        _pool = concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="Silk")
+    return _pool
+
+
+def submit(fp, compute, args, commit):
+    if not enabled():
+        commit(fp, compute(*args))
+        return
+    key = (fp.Document.Name, fp.Name)
+    cancel(key)
+    jobs[key] = [pool().submit(compute, *args), commit, time.monotonic()]
+    _startTimer()
+    _showProgress()
+
+
+def cancel(key):
+    job = jobs.pop(key, None)
+    if job is not None and not job[0].cancel():
+        log.debug("superseded job of ", key[1], " still running, its result will be dropped")
+
+
+def _startTimer():
+    global _timer
+    if _timer is None:
+        from PySide import QtCore
+
+        _timer = QtCore.QTimer()
+        _timer.timeout.connect(poll)
+    if not _timer.isActive():
+        _timer.start(50)
+
+
+def poll():
+    # GUI thread. commits the finished jobs, then recomputes what depends on them
+    documents = FreeCAD.listDocuments()
+    to_recompute = {}
+    for key, job in list(jobs.items()):
+        future, commit, start = job
+        if not future.done():
+            continue
+        del jobs[key]
+        doc = documents.get(key[0])
+        fp = doc.getObject(key[1]) if doc is not None else None
+        if fp is None:
+            continue
+        try:
+            result = future.result()
+        except Exception as err:
+            log.error(fp.Label, ": background construction failed: ", err)
+            continue
+        Silk_debounce.suspend()  # commits write properties like the autoG3 inner scales. those are results, not edits
+        try:
+            commit(fp, result)
+        finally:
+            Silk_debounce.resume()
+        # the outputs are final: fp itself must not run again, only what reads it
+        fp.purgeTouched()
+        for dependent in fp.InList:
+            dependent.touch()
+        to_recompute[key[0]] = doc
+        log.debug(fp.Label, " built in background in ", round(time.monotonic() - start, 3), " s")
+    for doc in to_recompute.values():
+        doc.recompute()
+    _showProgress()
+    if not jobs and _timer is not None:
+        _timer.stop()
+
+
+def _showProgress():
+    global _indicator
+    import FreeCADGui
+    from PySide import QtGui
+
+    status_bar = FreeCADGui.getMainWindow().statusBar()
+    if _indicator is None:
+        _indicator = QtGui.QProgressBar()
+        _indicator.setRange(0, 0)  # busy, the jobs cannot report a fraction done
+        _indicator.setMaximumWidth(160)
+        status_bar.addPermanentWidget(_indicator)
+    if jobs:
+        _indicator.setFormat("Silk: %d building" % len(jobs))
+        _indicator.setTextVisible(True)
+        _indicator.show()
+    else:
+        _indicator.hide()
@@ -0,0 +1,177 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+## Headless batch regeneration and export of Silk models. No GUI session is needed.
+##
+## usage (arguments after '--' belong to this script):
+##   FreeCADCmd Silk_batch.py -- model_a.FCStd model_b.FCStd --out exports --formats step,stl --workers 4
+## or from any python able to 'import FreeCAD':
+##   python Silk_batch.py model_a.FCStd model_b.FCStd --out exports
+##
+## Every file is opened, all Silk objects are touched and recomputed, and the faces of the Silk
+## surfaces are exported as one compound per file. Files are spread over a process pool.
+## A per-file timing / failure table is printed, and optionally written as json (--report).
+
+import argparse
+import concurrent.futures
+import json
+import os
+import sys
+import time
+
+# the Silk directory must be importable in the workers, so the document proxies can be restored
+path_Silk = os.path.dirname(os.path.abspath(__file__))
+if path_Silk not in sys.path:
+    sys.path.append(path_Silk)
+
+import FreeCAD
+import Part
+
+import Silk_scheduler
+
+export_formats = ["brep", "step", "iges", "stl", "obj"]
+
+
+def silkSurfaceShapes(doc):
+    # shapes with faces, built by Silk objects
+    shapes = []
+    for obj in doc.Objects:
+        if Silk_scheduler.isSilkObject(obj) and hasattr(obj, "Shape") and not obj.Shape.isNull() and obj.Shape.Faces:
+            shapes.append(obj.Shape)
+    return shapes
+
+
+def exportShape(shape, path, fmt, deviation):
+    if fmt == "brep":
+        shape.exportBrep(path)
+    elif fmt == "step":
+        shape.exportStep(path)
+    elif fmt == "iges":
+        shape.exportIges(path)
+    elif fmt in ("stl", "obj"):
+        import Mesh
+
+        mesh = Mesh.Mesh(shape.tessellate(deviation))
+        mesh.write(path)
+    else:
+        raise ValueError("unknown export format: " + fmt)
+
+
+def processFile(path, out_dir, formats, deviation):
+    """Open, regenerate and export one model. Runs in a worker process, returns a plain report dict."""
+    report = {"file": path, "ok": False, "open": 0.0, "recompute": 0.0, "export": 0.0, "objects": 0, "surfaces": 0, "outputs": [], "error": ""}
+    doc = None
+    try:
+        start = time.perf_counter()
+        doc = FreeCAD.openDocument(path, True)  # hidden, no view is needed
+        report["open"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        silk = [obj for obj in doc.Objects if Silk_scheduler.isSilkObject(obj)]
+        for obj in silk:
+            obj.touch()
+        doc.recompute()
+        report["recompute"] = time.perf_counter() - start
+        report["objects"] = len(silk)
+        invalid = [obj.Name for obj in silk if "Invalid" in obj.State]
+        if invalid:
+            raise RuntimeError("recompute failed for " + ", ".join(invalid))
+
+        start = time.perf_counter()
+        shapes = silkSurfaceShapes(doc)
+        report["surfaces"] = len(shapes)
+        if shapes:
+            compound = Part.makeCompound(shapes)
+            stem = os.path.splitext(os.path.basename(path))[0]
+            for fmt in formats:
+                out_path = os.path.join(out_dir, stem + "." + fmt)
+                exportShape(compound, out_path, fmt, deviation)
+                report["outputs"].append(out_path)
+        report["export"] = time.perf_counter() - start
+        report["ok"] = True
+    except Exception as err:
+        report["error"] = "%s: %s" % (type(err).__name__, err)
+    finally:
+        if doc is not None:
+            FreeCAD.closeDocument(doc.Name)
+    return report
+
+
+def run(files, out_dir, formats, workers, deviation):
+    os.makedirs(out_dir, exist_ok=True)
+    pool = Silk_scheduler.makePool("process", workers)
+    if not isinstance(pool, concurrent.futures.ProcessPoolExecutor):
+        # documents cannot be processed side by side in threads of one FreeCAD session
+        pool.shutdown()
+        return [processFile(os.path.abspath(f), out_dir, formats, deviation) for f in files]
+    # submit by module name: under FreeCADCmd this file runs as __main__, which the workers cannot import
+    import Silk_batch
+
+    with pool:
+        futures = [pool.submit(Silk_batch.processFile, os.path.abspath(f), out_dir, formats, deviation) for f in files]
+        reports = []
+        for f, future in zip(files, futures):
+            try:
+                reports.append(future.result())
+            except Exception as err:  # the worker itself died
+                reports.append({"file": f, "ok": False, "open": 0.0, "recompute": 0.0, "export": 0.0, "objects": 0, "surfaces": 0, "outputs": [], "error": "worker: %s" % err})
+    return reports
+
+
+def printReport(reports, total):
+    print("%-40s %6s %8s %10s %8s %8s  %s" % ("file", "status", "open", "recompute", "export", "objects", "error"))
+    for r in reports:
+        status = "ok" if r["ok"] else "FAILED"
+        print("%-40s %6s %8.2f %10.2f %8.2f %8d  %s" % (os.path.basename(r["file"])[:40], status, r["open"], r["recompute"], r["export"], r["objects"], r["error"]))
+    failed = len([r for r in reports if not r["ok"]])
+    print("%d files, %d failed, %.2f s wall time" % (len(reports), failed, total))
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+        # FreeCADCmd passes its own arguments too. ours come after '--'
+        if "--" in argv:
+            argv = argv[argv.index("--") + 1 :]
+    parser = argparse.ArgumentParser(prog="Silk_batch", description="regenerate Silk models and export their surfaces, without a GUI")
+    parser.add_argument("files", nargs="+", help=".FCStd files to regenerate")
+    parser.add_argument("--out", default="silk_export", help="output directory")
+    parser.add_argument("--formats", default="step", help="comma separated list of: " + ", ".join(export_formats))
+    parser.add_argument("--workers", type=int, default=0, help="number of worker processes (0 = one per core)")
+    parser.add_argument("--deviation", type=float, default=0.1, help="mesh export deviation")
+    parser.add_argument("--report", default="", help="also write the per-file report to this json file")
+    args = parser.parse_args(argv)
+
+    formats = [f.strip().lower() for f in args.formats.split(",") if f.strip()]
+    for fmt in formats:
+        if fmt not in export_formats:
+            parser.error("unknown format %s" % fmt)
+    workers = args.workers if args.workers > 0 else min(len(args.files), os.cpu_count() or 1)
+
+    start = time.perf_counter()
+    reports = run(args.files, os.path.abspath(args.out), formats, workers, args.deviation)
+    printReport(reports, time.perf_counter() - start)
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(reports, f, indent=2)
+    return 0 if all(r["ok"] for r in reports) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+## Seam continuity report for all the Silk surfaces of a document.
+##
+## Seams are the borders shared by two surfaces: same pole row, in either direction. They are found with an
+## AN.TopologyResolver over the grids of all surfaces, so every pair of patches is never compared.
+## Both sides of each seam are sampled with the numpy evaluation of ArachNURBS, all samples of a side in one pass,
+## and compared sample by sample:
+##   G0  gap between the two sides
+##   G1  angle between the surface normals
+##   G2  ratio of the normal curvatures of the isoparametric curves crossing the seam, signed against a common normal:
+##       k_a k_b / max(k_a^2, k_b^2). 1.0 is a match, sides bending opposite ways give a negative ratio
+##   G3  mismatch of dC/ds of those curves, along the direction going from one surface into the other
+## Crossing isocurves are the rows Silk blends run along (see AN.blend_poly_2x4_1x6()), and what the G3 tools tune.
+## Samples where a measure is undefined (no normal at a collapsed grid corner) do not limit the continuity.
+##
+## report() gives a table, one seam per line, with the worst value of each measure and its location.
+## showOverlay() draws every seam, colored per sample by the continuity reached:
+##   red: gap   orange: G0   yellow: G1   cyan: G2   green: G3
+##
+## Settings, in Tools -> Edit parameters -> Preferences/Mod/Silk:
+##   ContinuitySamples     samples per seam                                    default: 25
+##   ContinuityGap         G0 tolerance, model units                           default: 0.000001
+##   ContinuityAngle       G1 tolerance, degrees                               default: 0.1
+##   ContinuityCurvature   G2 tolerance, 1.0 - curvature ratio                 default: 0.01
+##   ContinuityDCds        G3 tolerance, dC/ds mismatch relative to the larger  default: 0.05
+
+import numpy as np
+
+import FreeCAD
+
+import ArachNURBS as AN
+import Silk_log
+import Silk_lod
+
+log = Silk_log.getLogger("continuity")
+
+param_path = "User parameter:BaseApp/Preferences/Mod/Silk"
+
+level_colors = [(1.0, 0.0, 0.0), (1.0, 0.5, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 1.0), (0.0, 1.0, 0.0)]  # gap, G0, G1, G2, G3
+overlays = {}  # document name -> coin node
+
+
+def settings():
+    params = FreeCAD.ParamGet(param_path)
+    return (
+        max(3, params.GetInt("ContinuitySamples", 25)),
+        params.GetFloat("ContinuityGap", 0.000001),
+        params.GetFloat("ContinuityAngle", 0.1),
+        params.GetFloat("ContinuityCurvature", 0.01),
+        params.GetFloat("ContinuityDCds", 0.05),
+    )
+
+
+def patches(doc):
+    # (label, data) of every Silk surface patch of the document. N-Star surfaces give one patch per sub surface
+    found = []
+    for obj in doc.Objects:
+        datas = Silk_lod.surfaceDatas(obj)
+        for i, data in enumerate(datas):
+            found.append((obj.Label if len(datas) == 1 else obj.Label + "[" + str(i) + "]", data))
+    return found
+
+
+def patchArrays(data):
+    nu, nv = AN.shape_layouts[data["builder"]]
+    poles = [p[0] for p in data["WeightedPoles"]]
+    weights = [p[1] for p in data["WeightedPoles"]]
+    P, W = AN.surfaceArrays(poles, weights, nu, nv)
+    # the flat list runs along u first: GridArray rows are v, columns are u
+    return P, W, AN.GridArray.fromLists(poles, weights, nu)
+
+
+def borderSamples(P, W, border, samples):
+    # along a GridArray border (0: v = 0, 1: u = 1, 2: v = 1, 3: u = 0, each in the GridArray.borders() direction):
+    # positions, normals, and derivatives of the isocurve crossing the border, going into the patch
+    nu, nv = W.shape
+    along_u = border in [0, 2]
+    end = 1 if border in [1, 2] else 0
+    if along_u:
+        Bu = AN.cachedBasis(nu, samples, 3)
+        Bv = AN.cachedBasis(nv, 2, 3)[:, end : end + 1]
+    else:
+        Bu = AN.cachedBasis(nu, 2, 3)[:, end : end + 1]
+        Bv = AN.cachedBasis(nv, samples, 3)
+    S = AN.evaluateSurface(P, W, Bu, Bv)
+    S = {key: value.reshape(-1, 3) for key, value in S.items()}
+    into = -1.0 if end == 1 else 1.0
+    if along_u:
+        c1, c2, c3 = into * S[(0, 1)], S[(0, 2)], into * S[(0, 3)]
+    else:
+        c1, c2, c3 = into * S[(1, 0)], S[(2, 0)], into * S[(3, 0)]
+    normal = np.cross(S[(1, 0)], S[(0, 1)])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normal = normal / np.linalg.norm(normal, axis=-1)[:, None]
+    values = [S[(0, 0)], normal, c1, c2, c3]
+    if border in [2, 3]:
+        values = [value[::-1] for value in values]
+    return values
+
+
+def isoCurvature(c1, c2, c3, normal):
+    # normal curvature (c2 . n) / |c1|^2 of a curve from its first three derivatives, and its derivative along the curve.
+    # signed against 'normal', held fixed across the seam: both sides are measured against the same one
+    speed2 = np.einsum("ik,ik->i", c1, c1)
+    c2n = np.einsum("ik,ik->i", c2, normal)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = c2n / speed2
+        dk_dw = np.einsum("ik,ik->i", c3, normal) / speed2 - 2.0 * c2n * np.einsum("ik,ik->i", c1, c2) / speed2**2
+        return k, dk_dw / np.sqrt(speed2)
+
+
+def findSeams(datas, tol):
+    # [(patch a, border a, patch b, border b, reversed), ...] for every border shared by two patches
+    # collapsed borders (all poles on one point) match each other, but are no seams
+    resolver = AN.TopologyResolver(tol)
+    collapsed = []
+    for i, data in enumerate(datas):
+        grid = patchArrays(data)[2]
+        borders = grid.borders()
+        resolver.update(i, grid.corners(), borders)
+        collapsed.append([all((p - row[0]).Length <= tol for p in row) for row in borders])
+    seams = []
+    for a in range(len(datas)):
+        for b in resolver.neighbours(a):
+            if b > a:
+                seams += [(a, i, b, j, flipped) for i, j, flipped in resolver.sharedEdges(a, b) if not collapsed[a][i]]
+    return seams
+
+
+def measureSeam(side_a, side_b, flipped):
+    # per sample measures of a seam, and the continuity level reached (0: gap, 1: G0 ... 4: G3)
+    samples, gap_tol, angle_tol, curvature_tol, dcds_tol = settings()
+    if flipped:
+        side_b = [value[::-1] for value in side_b]
+    point_a, normal_a, c1_a, c2_a, c3_a = side_a
+    point_b, normal_b, c1_b, c2_b, c3_b = side_b
+    gap = np.linalg.norm(point_a - point_b, axis=-1)
+    # normals of two surfaces may point to opposite sides, that is not a crease: b's are turned to agree with a's
+    dot = np.einsum("ik,ik->i", normal_a, normal_b)
+    normal_b = np.where((dot < 0.0)[:, None], -normal_b, normal_b)
+    angle = np.degrees(np.arccos(np.clip(np.abs(dot), 0.0, 1.0)))
+    normal = np.where(np.isfinite(normal_a), normal_a, normal_b)
+    k_a, dcds_a = isoCurvature(c1_a, c2_a, c3_a, normal)
+    k_b, dcds_b = isoCurvature(c1_b, c2_b, c3_b, normal)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # going from a into b, a's isocurve is run backwards: the sign of k stays, that of dC/ds flips
+        largest = np.maximum(k_a * k_a, k_b * k_b)
+        ratio = np.where(largest > 1.0e-24, k_a * k_b / largest, 1.0)
+        ratio[~(np.isfinite(k_a) & np.isfinite(k_b))] = np.nan
+        mismatch = np.abs(-dcds_a - dcds_b)
+        largest = np.maximum(np.abs(dcds_a), np.abs(dcds_b))
+        relative = np.where(largest > 1.0e-12, mismatch / largest, 0.0)
+        relative[~np.isfinite(mismatch)] = np.nan
+    # NaN measures (no normal at a collapsed corner) are left out, they neither pass nor fail
+    level = np.full(len(gap), 4)
+    level[relative > dcds_tol] = 3
+    level[ratio < 1.0 - curvature_tol] = 2
+    level[angle > angle_tol] = 1
+    level[~(gap <= gap_tol)] = 0
+    return {"point": point_a, "gap": gap, "angle": angle, "ratio": ratio, "dcds": mismatch, "level": level}
+
+
+def analyze(doc=None):
+    # one dict per seam: labels, borders, per sample measures, worst values and their locations
+    if doc is None:
+        doc = FreeCAD.ActiveDocument
+    samples, gap_tol = settings()[:2]
+    found = patches(doc)
+    datas = [data for label, data in found]
+    arrays = [patchArrays(data)[:2] for data in datas]
+    results = []
+    for a, border_a, b, border_b, flipped in findSeams(datas, max(gap_tol, AN.default_tol)):
+        side_a = borderSamples(arrays[a][0], arrays[a][1], border_a, samples)
+        side_b = borderSamples(arrays[b][0], arrays[b][1], border_b, samples)
+        seam = measureSeam(side_a, side_b, flipped)
+        seam.update({"a": found[a][0], "border_a": border_a, "b": found[b][0], "border_b": border_b})
+        for name, worst in [["gap", np.nanargmax], ["angle", np.nanargmax], ["ratio", np.nanargmin], ["dcds", np.nanargmax]]:
+            values = seam[name]
+            i = int(worst(values)) if np.any(np.isfinite(values)) else 0
+            seam["worst_" + name] = (float(values[i]), tuple(seam["point"][i].tolist()))
+        seam["continuity"] = int(seam["level"].min())
+        results.append(seam)
+    log.info(len(found), " surfaces, ", len(results), " seams")
+    return results
+
+
+def report(results):
+    names = ["gap", "G0", "G1", "G2", "G3"]
+    lines = ["%-36s %4s %12s %10s %10s %12s  %s" % ("seam", "", "max gap", "max angle", "min ratio", "max dC/ds", "worst at")]
+    for seam in sorted(results, key=lambda seam: seam["continuity"]):
+        label = seam["a"] + ":" + str(seam["border_a"]) + " / " + seam["b"] + ":" + str(seam["border_b"])
+        # the location shown is that of the measure which limits the continuity
+        limit = ["gap", "angle", "ratio", "dcds", "dcds"][seam["continuity"]]
+        location = "(%.4g, %.4g, %.4g)" % seam["worst_" + limit][1]
+        lines.append(
+            "%-36s %4s %12.3g %10.4f %10.4f %12.4g  %s"
+            % (label[:36], names[seam["continuity"]], seam["worst_gap"][0], seam["worst_angle"][0], seam["worst_ratio"][0], seam["worst_dcds"][0], location)
+        )
+    return "\n".join(lines)
+
+
+def showOverlay(doc, results):
+    # one line set per seam, colored per sample. replaces the previous overlay of the document
+    import FreeCADGui
+    from pivy import coin
+
+    clearOverlay(doc)
+    root = coin.SoSeparator()
+    style = coin.SoDrawStyle()
+    style.lineWidth = 4
+    root.addChild(style)
+    binding = coin.SoMaterialBinding()
+    binding.value = coin.SoMaterialBinding.PER_VERTEX
+    root.addChild(binding)
+    for seam in results:
+        material = coin.SoMaterial()
+        material.diffuseColor.setValues(0, len(seam["level"]), [level_colors[level] for level in seam["level"].tolist()])
+        coords = coin.SoCoordinate3()
+        coords.point.setValues(0, len(seam["point"]), seam["point"].tolist())
+        lines = coin.SoLineSet()
+        lines.numVertices.setValue(len(seam["point"]))
+        root.addChild(material)
+        root.addChild(coords)
+        root.addChild(lines)
+    FreeCADGui.getDocument(doc.Name).ActiveView.getSceneGraph().addChild(root)
+    overlays[doc.Name] = root
+
+
+def clearOverlay(doc):
+    node = overlays.pop(doc.Name, None)
+    if node is None:
+        return
+    import FreeCADGui
+
+    try:
+        FreeCADGui.getDocument(doc.Name).ActiveView.getSceneGraph().removeChild(node)
+    except Exception as err:  # the view was closed meanwhile
+        log.debug("clearOverlay ", doc.Name, err)
@@ -0,0 +1,219 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+## Curvature maps of the Silk surfaces of a document: Gaussian, mean and principal curvatures on a sample grid.
+##
+## Patches are grouped by layout (44, 64, 66, the N-Star sub surfaces are 66), and each group is evaluated in one
+## batched pass: its grids are stacked, and AN.evaluateSurface() runs once on the stack with the cached basis
+## matrices (first and second derivatives). AN.surfaceCurvatures() then works on the whole stack at once.
+##
+## report() gives a table, one patch per line, highest curvature first: the curvature spikes around the star
+## centers come up on top. 'flat' is the share of samples where both principal radii exceed
+## CurvatureMapFlatFactor times the size of the model.
+## showOverlay() draws the patches colored per vertex by one measure: blue negative, white zero, red positive.
+## The color range is the 95th percentile of the absolute values, so that a few spikes do not wash out the map.
+## export() writes every sample to a .csv file (one row per sample) or a .npz file (one array per measure, stacked
+## patches, see exportNPZ()).
+##
+## Settings, in Tools -> Edit parameters -> Preferences/Mod/Silk:
+##   CurvatureMapSamples      samples per patch direction                             default: 17
+##   CurvatureMapMeasure      gaussian, mean, k1 or k2                                default: gaussian
+##   CurvatureMapFlatFactor   flat above this radius, in model sizes                  default: 100.0
+##   CurvatureMapExport       .csv or .npz file written on each analysis, empty: none  default: empty
+
+import io
+
+import numpy as np
+
+import FreeCAD
+
+import ArachNURBS as AN
+import Silk_continuity
+import Silk_log
+
+log = Silk_log.getLogger("curvature")
+
+param_path = "User parameter:BaseApp/Preferences/Mod/Silk"
+
+measures = ["gaussian", "mean", "k1", "k2"]
+overlays = {}  # document name -> coin node
+
+
+def settings():
+    params = FreeCAD.ParamGet(param_path)
+    measure = params.GetString("CurvatureMapMeasure", "gaussian")
+    return (
+        max(3, params.GetInt("CurvatureMapSamples", 17)),
+        measure if measure in measures else "gaussian",
+        params.GetFloat("CurvatureMapFlatFactor", 100.0),
+        params.GetString("CurvatureMapExport", ""),
+    )
+
+
+def curvatureMaps(datas, samples):
+    # one dict per data, in the same order: points (samples, samples, 3), normal, gaussian, mean, k1, k2
+    maps = [None] * len(datas)
+    groups = {}
+    for i, data in enumerate(datas):
+        groups.setdefault(data["builder"], []).append(i)
+    for builder, members in groups.items():
+        nu, nv = AN.shape_layouts[builder]
+        arrays = [Silk_continuity.patchArrays(datas[i])[:2] for i in members]
+        P = np.stack([P for P, W in arrays])
+        W = np.stack([W for P, W in arrays])
+        S = AN.evaluateSurface(P, W, AN.cachedBasis(nu, samples, 2), AN.cachedBasis(nv, samples, 2))
+        k = AN.surfaceCurvatures(S)
+        for n, i in enumerate(members):
+            maps[i] = {"points": S[(0, 0)][n], "normal": k["normal"][n]}
+            maps[i].update({name: k[name][n] for name in measures})
+    return maps
+
+
+def analyze(doc=None):
+    # one dict per patch: label, the maps of curvatureMaps(), and their summary
+    if doc is None:
+        doc = FreeCAD.ActiveDocument
+    samples, measure, flat_factor = settings()[:3]
+    found = Silk_continuity.patches(doc)
+    results = curvatureMaps([data for label, data in found], samples)
+    if not results:
+        return results
+    points = np.concatenate([result["points"].reshape(-1, 3) for result in results])
+    size = float(np.linalg.norm(points.max(axis=0) - points.min(axis=0)))
+    flat = 1.0 / max(flat_factor * size, 1e-12)
+    for (label, data), result in zip(found, results):
+        result["label"] = label
+        peak = np.fmax(np.abs(result["k1"]), np.abs(result["k2"]))
+        i = np.unravel_index(np.nanargmax(peak), peak.shape) if np.any(np.isfinite(peak)) else (0, 0)
+        result["max_k"] = (float(peak[i]), tuple(result["points"][i].tolist()))
+        result["flat"] = float(np.mean(peak < flat))
+        for name in ["gaussian", "mean"]:
+            result["range_" + name] = (float(np.nanmin(result[name])), float(np.nanmax(result[name])))
+    log.info(len(results), " patches, ", samples, " x ", samples, " samples each")
+    return results
+
+
+def report(results):
+    lines = ["%-28s %11s %11s %11s %11s %11s %6s  %s" % ("patch", "min K", "max K", "min H", "max H", "max |k|", "flat", "max |k| at")]
+    for result in sorted(results, key=lambda result: -np.nan_to_num(result["max_k"][0])):
+        lines.append(
+            "%-28s %11.4g %11.4g %11.4g %11.4g %11.4g %5.0f%%  (%.4g, %.4g, %.4g)"
+            % ((result["label"][:28],) + result["range_gaussian"] + result["range_mean"] + (result["max_k"][0], 100.0 * result["flat"]) + result["max_k"][1])
+        )
+    return "\n".join(lines)
+
+
+def colors(values, scale):
+    # blue -> white -> red over [-scale, scale], grey where the curvature is undefined
+    t = np.clip(np.nan_to_num(values / max(scale, 1e-300)), -1.0, 1.0)[..., None]
+    white = np.ones(3)
+    rgb = np.where(t < 0.0, white + t * (white - [0.0, 0.0, 1.0]), white - t * (white - [1.0, 0.0, 0.0]))
+    rgb[~np.isfinite(values)] = 0.5
+    return rgb
+
+
+def colorScale(results, measure):
+    values = np.abs(np.concatenate([result[measure].ravel() for result in results]))
+    values = values[np.isfinite(values)]
+    return float(np.percentile(values, 95.0)) if len(values) else 1.0
+
+
+def gridTriangles(nu, nv):
+    # coordIndex of an indexed face set over a (nu, nv) sample grid flattened u major, two triangles per cell
+    i, j = np.meshgrid(np.arange(nu - 1), np.arange(nv - 1), indexing="ij")
+    a = (i * nv + j).ravel()
+    b, c, d = a + nv, a + nv + 1, a + 1
+    end = np.full_like(a, -1)
+    return np.stack([a, b, c, end, a, c, d, end], axis=-1).ravel().tolist()
+
+
+def showOverlay(doc, results, measure="gaussian"):
+    # the patches drawn over the surfaces, colored per vertex. replaces the previous overlay of the document
+    import FreeCADGui
+    from pivy import coin
+
+    clearOverlay(doc)
+    root = coin.SoSeparator()
+    light = coin.SoLightModel()
+    light.model = coin.SoLightModel.BASE_COLOR
+    root.addChild(light)
+    offset = coin.SoPolygonOffset()  # in front of the shaded surfaces it is drawn on
+    offset.factor = -1.0
+    offset.units = -1.0
+    root.addChild(offset)
+    binding = coin.SoMaterialBinding()
+    binding.value = coin.SoMaterialBinding.PER_VERTEX_INDEXED
+    root.addChild(binding)
+    scale = colorScale(results, measure)
+    for result in results:
+        nu, nv = result[measure].shape
+        material = coin.SoMaterial()
+        material.diffuseColor.setValues(0, nu * nv, colors(result[measure], scale).reshape(-1, 3).tolist())
+        coords = coin.SoCoordinate3()
+        coords.point.setValues(0, nu * nv, result["points"].reshape(-1, 3).tolist())
+        faces = coin.SoIndexedFaceSet()
+        index = gridTriangles(nu, nv)
+        faces.coordIndex.setValues(0, len(index), index)  # materialIndex left empty: coordIndex is used
+        root.addChild(material)
+        root.addChild(coords)
+        root.addChild(faces)
+    FreeCADGui.getDocument(doc.Name).ActiveView.getSceneGraph().addChild(root)
+    overlays[doc.Name] = root
+    log.info(measure, " colored over +/- ", scale)
+
+
+def clearOverlay(doc):
+    node = overlays.pop(doc.Name, None)
+    if node is None:
+        return
+    import FreeCADGui
+
+    try:
+        FreeCADGui.getDocument(doc.Name).ActiveView.getSceneGraph().removeChild(node)
+    except Exception as err:  # the view was closed meanwhile
+        log.debug("clearOverlay ", doc.Name, err)
+
+
+def exportCSV(path, results):
+    # one row per sample: patch, u index, v index, position, normal, measures
+    header = "patch,i,j,x,y,z,nx,ny,nz," + ",".join(measures)
+    with open(path, "w") as f:
+        f.write(header + "\n")
+        for result in results:
+            nu, nv = result["gaussian"].shape
+            i, j = np.meshgrid(np.arange(nu), np.arange(nv), indexing="ij")
+            rows = np.column_stack([i.ravel(), j.ravel(), result["points"].reshape(-1, 3), result["normal"].reshape(-1, 3)] + [result[name].ravel() for name in measures])
+            body = io.StringIO()
+            np.savetxt(body, rows, fmt=["%d", "%d"] + ["%.9g"] * (rows.shape[1] - 2), delimiter=",")
+            label = '"' + result["label"].replace('"', '""') + '",'
+            f.writelines(label + line + "\n" for line in body.getvalue().splitlines())
+
+
+def exportNPZ(path, results):
+    # labels (patches,), points and normal (patches, samples, samples, 3), each measure (patches, samples, samples)
+    arrays = {name: np.stack([result[name] for result in results]) for name in ["points", "normal"] + measures}
+    np.savez_compressed(path, labels=np.array([result["label"] for result in results]), **arrays)
+
+
+def export(path, results):
+    if path.lower().endswith(".npz"):
+        exportNPZ(path, results)
+    else:
+        exportCSV(path, results)
+    log.info("curvature maps written to ", path)
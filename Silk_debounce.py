@@ -0,0 +1,110 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+## Debounced recompute for tuning properties.
+##
+## Scale and flow factors are tuned by typing or by clicking spinbox arrows, and every keystroke or tick
+## would recompute the object and everything downstream of it. Properties registered with attach() no longer
+## touch their object when they change. Instead, the object calls request() from onChanged(), and all the
+## requests of a burst are merged into one recompute, run when no tuning property changed for RecomputeDebounce ms.
+##
+## Without a GUI there is no burst to merge: request() touches the object right away.
+##
+## Settings, in Tools -> Edit parameters -> Preferences/Mod/Silk:
+##   RecomputeDebounce   quiet period before the recompute, in ms. 0 disables the debounce   default: 300
+
+import FreeCAD
+
+import Silk_log
+
+log = Silk_log.getLogger("debounce")
+
+param_path = "User parameter:BaseApp/Preferences/Mod/Silk"
+
+queued = {}  # document name -> set of object names
+_timer = None
+_suspended = 0
+
+
+def interval():
+    return max(0, FreeCAD.ParamGet(param_path).GetInt("RecomputeDebounce", 300))
+
+
+def attach(obj, properties):
+    # changing these properties no longer touches obj, the owner calls request() from onChanged() instead
+    for name in properties:
+        if hasattr(obj, name):
+            try:
+                obj.setPropertyStatus(name, "NoRecompute")
+            except Exception as err:  # older FreeCAD: the change still touches the object, the debounce just adds nothing
+                log.debug("attach ", obj.Name, name, err)
+
+
+def request(fp):
+    # changes made during a recompute are results written by execute() (autoG3 writes back the inner scales),
+    # only edits from outside a recompute are queued
+    if _suspended or "Restore" in fp.State or getattr(fp.Document, "Recomputing", False):
+        return
+    if not FreeCAD.GuiUp:
+        fp.touch()  # the script changing the property recomputes when it is done
+        return
+    if interval() == 0:
+        fp.touch()
+        fp.Document.recompute()
+        return
+    queued.setdefault(fp.Document.Name, set()).add(fp.Name)
+    _restartTimer()
+
+
+def suspend():
+    # changes made until resume() are not queued. used when results are written outside a recompute
+    global _suspended
+    _suspended += 1
+
+
+def resume():
+    global _suspended
+    _suspended -= 1
+
+
+def _restartTimer():
+    global _timer
+    if _timer is None:
+        from PySide import QtCore
+
+        _timer = QtCore.QTimer()
+        _timer.setSingleShot(True)
+        _timer.timeout.connect(flush)
+    _timer.start(interval())  # restarting pushes the recompute back to the end of the burst
+
+
+def flush():
+    # one recompute per document for everything requested since the last flush
+    documents = FreeCAD.listDocuments()
+    while queued:
+        doc_name, names = queued.popitem()
+        doc = documents.get(doc_name)
+        if doc is None:
+            continue
+        for name in names:
+            obj = doc.getObject(name)
+            if obj is not None:
+                obj.touch()
+        log.debug("recompute after changes to ", ", ".join(sorted(names)))
+        doc.recompute()
@@ -0,0 +1,188 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+## Tessellation level of detail for Silk surfaces.
+##
+## FreeCAD's Deviation is relative to the size of each object, so with one value for every surface a small
+## fillet patch gets far more triangles than it can show, and a large hull panel too few.
+## Here every surface gets the same absolute chord error, a fraction of the size of the largest Silk surface
+## of the document, converted to its own Deviation. AngularDeflection follows from that chord error and the
+## highest principal curvature of the surface, sampled with the numpy evaluation of ArachNURBS.
+##
+## While a sketch is in edit mode the chord error is multiplied by LodInteractiveFactor. The surfaces built
+## meanwhile get a coarse tessellation, and are refined once the edit is over.
+## View properties are only written when they change by more than 10%: every write re-tessellates.
+##
+## Settings, in Tools -> Edit parameters -> Preferences/Mod/Silk:
+##   LodEnabled            enable automatic tessellation settings                  default: True
+##   LodModelFraction      chord error, as a fraction of the largest surface size  default: 0.0005
+##   LodInteractiveFactor  chord error multiplier during sketch edit               default: 4.0
+
+import math
+
+import numpy as np
+
+import FreeCAD
+
+import ArachNURBS as AN
+import Silk_log
+import Silk_preview
+
+log = Silk_log.getLogger("lod")
+
+param_path = "User parameter:BaseApp/Preferences/Mod/Silk"
+
+curvature_samples = 9
+surface_sizes = {}  # (document name, object name) -> size of a Silk surface, when it was last tessellated
+coarse = set()  # (document name, object name) tessellated with the interactive factor
+_timer = None
+
+
+def settings():
+    params = FreeCAD.ParamGet(param_path)
+    return params.GetBool("LodEnabled", True), params.GetFloat("LodModelFraction", 0.0005), max(1.0, params.GetFloat("LodInteractiveFactor", 4.0))
+
+
+def surfaceMetrics(datas):
+    # (sum of the bounding box sides, as used by FreeCAD for Deviation; highest principal curvature)
+    points = []
+    curvature = 0.0
+    for data in datas:
+        S = AN.evaluateData(data, curvature_samples, 2)
+        points.append(S[(0, 0)].reshape(-1, 3))
+        k = AN.surfaceCurvatures(S)
+        peak = np.nanmax(np.abs(np.concatenate([k["k1"].ravel(), k["k2"].ravel()])))
+        if np.isfinite(peak):
+            curvature = max(curvature, float(peak))
+    points = np.concatenate(points)
+    size = float(np.sum(points.max(axis=0) - points.min(axis=0)))
+    return size, curvature
+
+
+def lodSettings(size, curvature, chord):
+    # FreeCAD tessellates with an absolute deflection of (dx + dy + dz) / 300 * Deviation
+    deviation = min(100.0, max(0.01, chord * 300.0 / max(size, 1e-12)))
+    # angle between facets holding the chord error on the tightest radius
+    if curvature * chord >= 1.0:
+        angular = 45.0
+    elif curvature > 0.0:
+        angular = math.degrees(2.0 * math.acos(1.0 - chord * curvature))
+    else:
+        angular = 45.0
+    return deviation, min(45.0, max(1.0, angular))
+
+
+def apply(vobj, deviation, angular):
+    changed = False
+    if abs(vobj.Deviation - deviation) > 0.1 * vobj.Deviation:
+        vobj.Deviation = deviation
+        changed = True
+    if abs(vobj.AngularDeflection - angular) > 0.1 * vobj.AngularDeflection:
+        vobj.AngularDeflection = angular
+        changed = True
+    return changed
+
+
+def modelSize(doc):
+    # size of the largest Silk surface of the document. deleted surfaces and closed documents are dropped first,
+    # so the size also goes down when the largest surface is deleted or shrinks
+    documents = FreeCAD.listDocuments()
+    for key in [key for key in surface_sizes if key[0] not in documents or documents[key[0]].getObject(key[1]) is None]:
+        del surface_sizes[key]
+    return max([size for key, size in surface_sizes.items() if key[0] == doc.Name] or [0.0])
+
+
+def update(fp, datas):
+    # called by the surface classes once their shape is committed. datas: see AN.buildShapeFromData()
+    enabled, fraction, factor = settings()
+    if not enabled or not FreeCAD.GuiUp or fp.ViewObject is None or not datas:
+        return
+    size, curvature = surfaceMetrics(datas)
+    key = (fp.Document.Name, fp.Name)
+    surface_sizes[key] = size
+    chord = fraction * modelSize(fp.Document)
+    if Silk_preview.sketchInEdit(fp.Document):
+        chord *= factor
+        coarse.add(key)
+        _startTimer()
+    else:
+        coarse.discard(key)
+    deviation, angular = lodSettings(size, curvature, chord)
+    if apply(fp.ViewObject, deviation, angular):
+        log.debug(fp.Label, ": Deviation ", round(deviation, 4), ", AngularDeflection ", round(angular, 2))
+
+
+def surfaceDatas(obj):
+    # curve / surface data of a Silk surface object, without recomputing it
+    proxy = getattr(obj, "Proxy", None)
+    if proxy is None or type(proxy).__module__ != AN.__name__ or "Invalid" in obj.State:
+        return []
+    if hasattr(proxy, "gatherInputs") and hasattr(proxy, "commitOutputs"):
+        data = proxy.gatherInputs(obj)
+        if len(AN.shape_layouts[data["builder"]]) == 2:  # curves have no tessellation to tune
+            return [data]
+    if hasattr(obj, "NStarGrid"):
+        return [{"builder": "NURBS_Cubic_66_surf", "WeightedPoles": StarGrid_i} for StarGrid_i in obj.NStarGrid.StarGrid]
+    return []
+
+
+def refresh(doc=None):
+    # recomputes the level of detail of every Silk surface of the document, from scratch
+    if doc is None:
+        doc = FreeCAD.ActiveDocument
+    surfaces = [(obj, surfaceDatas(obj)) for obj in doc.Objects]
+    surfaces = [(obj, datas) for obj, datas in surfaces if datas]
+    for key in [key for key in surface_sizes if key[0] == doc.Name]:
+        del surface_sizes[key]
+    for obj, datas in surfaces:
+        surface_sizes[(doc.Name, obj.Name)] = surfaceMetrics(datas)[0]
+    for obj, datas in surfaces:
+        update(obj, datas)
+
+
+def _startTimer():
+    global _timer
+    if _timer is None:
+        from PySide import QtCore
+
+        _timer = QtCore.QTimer()
+        _timer.timeout.connect(poll)
+    if not _timer.isActive():
+        _timer.start(500)
+
+
+def poll():
+    # refines the coarse surfaces of documents whose sketch left edit mode
+    documents = FreeCAD.listDocuments()
+    for key in list(coarse):
+        doc = documents.get(key[0])
+        obj = doc.getObject(key[1]) if doc is not None else None
+        if obj is None:
+            coarse.discard(key)
+        elif "Touched" in obj.State:
+            continue  # its recompute after the edit refines it, see update()
+        elif not Silk_preview.sketchInEdit(doc):
+            coarse.discard(key)
+            # a timer slot: an object that cannot gather its inputs (sketch endpoints apart ...) must not raise into Qt
+            try:
+                update(obj, surfaceDatas(obj))
+            except Exception as err:
+                log.warning(obj.Label, ": tessellation not refined, ", err)
+    if not coarse:
+        _timer.stop()
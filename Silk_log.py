@@ -0,0 +1,144 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+## Leveled logging for Silk, routed to the FreeCAD report view.
+##
+## Every subsystem of the kernel has its own logger:
+##   log_grid = Silk_log.getLogger("grid")
+##   log_grid.debug("seam_0 ", seam_0)      # same arguments as print()
+##
+## A message below the active level of its subsystem costs one integer comparison: the arguments are
+## not even turned into a string. Messages that pass are rate limited per (subsystem, message text),
+## so an error repeated on every recompute cannot flood the console, while messages sharing a first
+## argument (an object label ...) are still told apart.
+##
+## Settings, in Tools -> Edit parameters -> Preferences/Mod/Silk (read again by configure()):
+##   LogLevel       debug / info / warning / error / off          default: warning
+##   LogSubsystems  per subsystem overrides, eg. "grid=debug, surface=off"
+##   LogRateLimit   messages per second for one repeated message  default: 5
+
+import time
+
+import FreeCAD
+
+param_path = "User parameter:BaseApp/Preferences/Mod/Silk"
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+level_names = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR, "off": OFF}
+
+default_level = WARNING
+subsystem_levels = {}
+rate_limit = 5
+
+_loggers = {}
+
+
+class SilkLogger:
+    def __init__(self, subsystem):
+        self.subsystem = subsystem
+        self.level = subsystem_levels.get(subsystem, default_level)
+        self._window = {}  # message -> [window start, messages in window, suppressed]
+
+    def isEnabledFor(self, level):
+        return level >= self.level
+
+    def debug(self, *args):
+        if self.level <= DEBUG:
+            self._emit(DEBUG, args)
+
+    def info(self, *args):
+        if self.level <= INFO:
+            self._emit(INFO, args)
+
+    def warning(self, *args):
+        if self.level <= WARNING:
+            self._emit(WARNING, args)
+
+    def error(self, *args):
+        if self.level <= ERROR:
+            self._emit(ERROR, args)
+
+    def _emit(self, level, args):
+        message = " ".join(str(a) for a in args)
+        now = time.monotonic()
+        window = self._window.get(message)
+        if window is None:
+            # forget the quiet messages whose window is over, so distinct messages do not pile up
+            for key in [key for key, w in self._window.items() if now - w[0] >= 1.0 and not w[2]]:
+                del self._window[key]
+        if window is None or now - window[0] >= 1.0:
+            suppressed = window[2] if window else 0
+            window = self._window[message] = [now, 0, 0]
+            if suppressed:
+                _write(level, "Silk [%s] (%d similar messages suppressed)" % (self.subsystem, suppressed))
+        if window[1] >= rate_limit:
+            window[2] += 1
+            return
+        window[1] += 1
+        _write(level, "Silk [%s] %s" % (self.subsystem, message))
+
+
+def _write(level, message):
+    if level >= ERROR:
+        FreeCAD.Console.PrintError(message + "\n")
+    elif level >= WARNING:
+        FreeCAD.Console.PrintWarning(message + "\n")
+    elif level >= INFO:
+        FreeCAD.Console.PrintMessage(message + "\n")
+    else:
+        FreeCAD.Console.PrintLog(message + "\n")
+
+
+def getLogger(subsystem):
+    if subsystem not in _loggers:
+        _loggers[subsystem] = SilkLogger(subsystem)
+    return _loggers[subsystem]
+
+
+def setLevel(level, subsystem=None):
+    # level is a name from level_names or one of the constants. without subsystem, sets the default level
+    global default_level
+    if isinstance(level, str):
+        level = level_names[level.strip().lower()]
+    if subsystem is None:
+        default_level = level
+    else:
+        subsystem_levels[subsystem] = level
+    for logger in _loggers.values():
+        logger.level = subsystem_levels.get(logger.subsystem, default_level)
+
+
+def configure():
+    global rate_limit
+    params = FreeCAD.ParamGet(param_path)
+    subsystem_levels.clear()
+    for item in params.GetString("LogSubsystems", "").split(","):
+        if "=" in item:
+            name, value = item.split("=", 1)
+            if value.strip().lower() in level_names:
+                subsystem_levels[name.strip()] = level_names[value.strip().lower()]
+    rate_limit = max(1, params.GetInt("LogRateLimit", 5))
+    setLevel(level_names.get(params.GetString("LogLevel", "warning").strip().lower(), WARNING))
+
+
+configure()
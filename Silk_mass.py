@@ -0,0 +1,224 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+## Mass properties of Silk shells: area, enclosed volume, centroids and inertia, without OCC GProp.
+##
+## Every Silk patch uses one of the fixed knot templates of ArachNURBS (4 or 6 poles per direction). The
+## Gauss-Legendre nodes of each knot span and the basis values at those nodes are computed once per template and
+## cached (see quadrature()). Patches are grouped by layout, their grids stacked, and each group is integrated in one
+## batched AN.evaluateSurface() pass.
+##
+## Area integrals use |Su x Sv|. Volume integrals use the divergence theorem over the shell, with Su x Sv as normal:
+##   V = 1/3 sum S . n dA      int x_k dV = sum x_k^2 / 2 n_k dA      int x_j x_k dV = sum x_j^2 x_k / 2 n_j dA
+## so they are only meaningful for closed shells with consistent normals. Patches are oriented with the topology
+## resolver (see orientations()): two patches agree when their shared border runs opposite ways around them.
+## Each connected shell is then turned so that its volume is positive. A shell with a free border has no volume.
+## Collapsed borders (N-sided patches made from grids) are not free borders.
+##
+## Inertia tensors are for a unit density, about the centroid: unit area density for the shell, unit volume
+## density for the solid.
+##
+## Settings, in Tools -> Edit parameters -> Preferences/Mod/Silk:
+##   MassGaussPoints   Gauss-Legendre nodes per knot span and direction   default: 6
+
+import numpy as np
+
+import FreeCAD
+
+import ArachNURBS as AN
+import Silk_continuity
+import Silk_lod
+import Silk_log
+
+log = Silk_log.getLogger("mass")
+
+param_path = "User parameter:BaseApp/Preferences/Mod/Silk"
+
+_quadrature_cache = {}  # (nPoles, nodes per span) -> (basis [derivative order, node, pole], weights)
+
+
+def settings():
+    return max(2, FreeCAD.ParamGet(param_path).GetInt("MassGaussPoints", 6))
+
+
+def quadrature(nPoles, points):
+    # Gauss-Legendre rule over [0, 1], 'points' nodes per knot span of the template, with the basis at the nodes
+    key = (nPoles, points)
+    if key not in _quadrature_cache:
+        x, w = np.polynomial.legendre.leggauss(points)
+        spans = sorted(set(AN.knot_templates[nPoles]))
+        params = np.concatenate([a + (b - a) * (x + 1.0) / 2.0 for a, b in zip(spans[:-1], spans[1:])])
+        weights = np.concatenate([(b - a) / 2.0 * w for a, b in zip(spans[:-1], spans[1:])])
+        _quadrature_cache[key] = (AN.basisMatrix(nPoles, params, 1), weights)
+    return _quadrature_cache[key]
+
+
+def patchIntegrals(datas, points):
+    # one dict per data, in the same order. area terms: area, first and second moments of area.
+    # volume terms, for the normals of the patch as they are: volume, first and second moments of volume
+    results = [None] * len(datas)
+    groups = {}
+    for i, data in enumerate(datas):
+        groups.setdefault(data["builder"], []).append(i)
+    for builder, members in groups.items():
+        nu, nv = AN.shape_layouts[builder]
+        Bu, wu = quadrature(nu, points)
+        Bv, wv = quadrature(nv, points)
+        arrays = [Silk_continuity.patchArrays(datas[i])[:2] for i in members]
+        S = AN.evaluateSurface(np.stack([P for P, W in arrays]), np.stack([W for P, W in arrays]), Bu, Bv)
+        x = S[(0, 0)]
+        n = np.cross(S[(1, 0)], S[(0, 1)])
+        dA = np.linalg.norm(n, axis=-1) * np.outer(wu, wv)
+        n = n * np.outer(wu, wv)[..., None]
+        area = dA.sum(axis=(1, 2))
+        area_m1 = np.einsum("pab,pabk->pk", dA, x)
+        area_m2 = np.einsum("pab,pabj,pabk->pjk", dA, x, x)
+        volume = np.einsum("pabk,pabk->p", x, n) / 3.0
+        volume_m1 = np.einsum("pabk,pabk->pk", x * x, n) / 2.0
+        volume_m2 = np.einsum("pabj,pabk,pabj->pjk", x * x, x, n) / 2.0
+        # on the diagonal the field x_j^2 x_k / 2 e_j has the divergence 3/2 x_k^2. x_k^3 / 3 e_k is used there
+        diagonal = np.einsum("pabk,pabk->pk", x**3, n) / 3.0
+        index = np.arange(3)
+        volume_m2[:, index, index] = diagonal
+        volume_m2 = (volume_m2 + volume_m2.transpose(0, 2, 1)) / 2.0
+        for n_i, i in enumerate(members):
+            results[i] = {
+                "area": float(area[n_i]),
+                "area_m1": area_m1[n_i],
+                "area_m2": area_m2[n_i],
+                "volume": float(volume[n_i]),
+                "volume_m1": volume_m1[n_i],
+                "volume_m2": volume_m2[n_i],
+            }
+    return results
+
+
+def orientations(datas, tol):
+    # (signs, shells, free borders): +1 / -1 per patch so that neighbours agree, the connected patches as lists, and
+    # the number of free borders of each shell. signs are None for a shell whose patches cannot agree (Moebius band)
+    resolver = AN.TopologyResolver(tol)
+    degenerate = []
+    for i, data in enumerate(datas):
+        grid = Silk_continuity.patchArrays(data)[2]
+        borders = grid.borders()
+        resolver.update(i, grid.corners(), borders)
+        degenerate.append([all((p - row[0]).Length <= tol for p in row) for row in borders])
+    signs = [0] * len(datas)
+    shells = []
+    free = []
+    for seed in range(len(datas)):
+        if signs[seed] != 0:
+            continue
+        signs[seed] = 1
+        shell, queue, free_borders, conflict = [], [seed], 0, False
+        while queue:
+            a = queue.pop()
+            shell.append(a)
+            shared = set()
+            for b in resolver.neighbours(a):
+                for i, j, flipped in resolver.sharedEdges(a, b):
+                    if degenerate[a][i] or degenerate[b][j]:
+                        continue
+                    shared.add(i)
+                    # borders run around each patch: agreeing neighbours go opposite ways along the shared border
+                    sign = signs[a] if flipped else -signs[a]
+                    if signs[b] == 0:
+                        signs[b] = sign
+                        queue.append(b)
+                    elif signs[b] != sign:
+                        conflict = True
+            free_borders += sum(1 for i in range(4) if i not in shared and not degenerate[a][i])
+        if conflict:
+            log.warning("the patches of the shell of ", seed, " cannot be oriented alike")
+            for i in shell:
+                signs[i] = None
+        shells.append(sorted(shell))
+        free.append(free_borders)
+    return signs, shells, free
+
+
+def inertia(mass, m1, m2):
+    # inertia tensor about the centroid, from the mass and the first and second moments about the origin
+    centroid = m1 / mass
+    m2 = m2 - mass * np.outer(centroid, centroid)
+    return centroid, np.trace(m2) * np.eye(3) - m2
+
+
+def massProperties(datas, points=None, tol=AN.default_tol):
+    # totals over all the patches: area, centroid and inertia of the shell, and of the solid when every shell is closed
+    if points is None:
+        points = settings()
+    integrals = patchIntegrals(datas, points)
+    result = {"patches": integrals, "area": sum(item["area"] for item in integrals)}
+    if not integrals or result["area"] == 0.0:
+        return result
+    area_m1 = sum(item["area_m1"] for item in integrals)
+    area_m2 = sum(item["area_m2"] for item in integrals)
+    result["centroid"], result["inertia"] = inertia(result["area"], area_m1, area_m2)
+
+    signs, shells, free = orientations(datas, tol)
+    result["shells"] = len(shells)
+    result["free_borders"] = sum(free)
+    if result["free_borders"] or any(sign is None for sign in signs):
+        return result
+    volume, volume_m1, volume_m2 = 0.0, np.zeros(3), np.zeros((3, 3))
+    for shell in shells:
+        shell_volume = sum(signs[i] * integrals[i]["volume"] for i in shell)
+        turn = 1.0 if shell_volume >= 0.0 else -1.0  # normals pointing in
+        volume += turn * shell_volume
+        volume_m1 = volume_m1 + turn * sum(signs[i] * integrals[i]["volume_m1"] for i in shell)
+        volume_m2 = volume_m2 + turn * sum(signs[i] * integrals[i]["volume_m2"] for i in shell)
+    result["volume"] = volume
+    if volume > 0.0:
+        result["volume_centroid"], result["volume_inertia"] = inertia(volume, volume_m1, volume_m2)
+    return result
+
+
+def analyze(objects=None):
+    # mass properties of the Silk surfaces among objects, all those of the active document by default
+    if objects is None:
+        found = Silk_continuity.patches(FreeCAD.ActiveDocument)
+    else:
+        found = []
+        for obj in objects:
+            datas = Silk_lod.surfaceDatas(obj)
+            found += [(obj.Label if len(datas) == 1 else obj.Label + "[" + str(i) + "]", data) for i, data in enumerate(datas)]
+    result = massProperties([data for label, data in found])
+    result["labels"] = [label for label, data in found]
+    log.info(len(found), " patches, ", settings(), " Gauss points per span")
+    return result
+
+
+def report(result):
+    def vector(v):
+        return "(%.6g, %.6g, %.6g)" % tuple(v)
+
+    lines = ["patches:      %d" % len(result["patches"]), "area:         %.8g" % result["area"]]
+    if "centroid" in result:
+        lines += ["centroid:     " + vector(result["centroid"]), "inertia, unit area density, about the centroid:"]
+        lines += ["    " + vector(row) for row in result["inertia"]]
+        lines.append("shells:       %d, %d free borders" % (result["shells"], result["free_borders"]))
+    if "volume" in result:
+        lines.append("volume:       %.8g" % result["volume"])
+    elif "shells" in result:
+        lines.append("volume:       none, the shells are not closed or cannot be oriented")
+    if "volume_centroid" in result:
+        lines += ["center of volume: " + vector(result["volume_centroid"]), "inertia, unit volume density, about the center of volume:"]
+        lines += ["    " + vector(row) for row in result["volume_inertia"]]
+    return "\n".join(lines)
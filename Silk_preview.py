@@ -0,0 +1,188 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+## Drag preview while a sketch is being edited.
+##
+## Dragging a sketch vertex recomputes the whole chain of Silk objects on every mouse move.
+## Poles and weights are cheap, the OCC surfaces and their shapes are not. While a sketch is in edit mode,
+## the curves and surfaces at the end of the chain (nothing else in the document links to them) skip the
+## OCC build: their poles are evaluated in numpy with cached basis matrices, on a fixed resolution,
+## and drawn as a light coin mesh in place of the normal display.
+##
+## The real shapes are built when the sketch leaves edit mode, or when the sketch has not changed
+## for PreviewIdle seconds.
+##
+## Settings, in Tools -> Edit parameters -> Preferences/Mod/Silk:
+##   DragPreview     enable the preview                           default: True
+##   PreviewSamples  preview mesh resolution, per direction       default: 12
+##   PreviewIdle     seconds without change before the full build default: 0.5
+
+import time
+
+import FreeCAD
+
+import ArachNURBS as AN
+import Silk_log
+
+log = Silk_log.getLogger("preview")
+
+param_path = "User parameter:BaseApp/Preferences/Mod/Silk"
+
+pending = {}  # (document name, object name) -> time of the last preview
+overlays = {}  # (document name, object name) -> [view provider, coin node, saved whichChild]
+_finishing = False
+_timer = None
+
+
+def settings():
+    params = FreeCAD.ParamGet(param_path)
+    return params.GetBool("DragPreview", True), max(2, params.GetInt("PreviewSamples", 12)), max(0.05, params.GetFloat("PreviewIdle", 0.5))
+
+
+def sketchInEdit(doc):
+    if not FreeCAD.GuiUp:
+        return False
+    import FreeCADGui
+
+    gui_doc = FreeCADGui.getDocument(doc.Name)
+    if gui_doc is None:
+        return False
+    edited = gui_doc.getInEdit()
+    return edited is not None and edited.Object.TypeId == "Sketcher::SketchObject"
+
+
+def isActive(fp):
+    # preview instead of a full build? only for objects nothing else depends on: a downstream object
+    # reading Shape, NSurf... of a preview would get stale geometry
+    if _finishing or not settings()[0]:
+        return False
+    if fp.InList:
+        return False
+    return sketchInEdit(fp.Document)
+
+
+def previewNode(datas, samples):
+    # coin node drawing every curve / surface data (see AN.buildShapeFromData) as a sampled mesh
+    from pivy import coin
+
+    root = coin.SoSeparator()
+    style = coin.SoDrawStyle()
+    style.lineWidth = 1
+    root.addChild(style)
+    for data in datas:
+        values = AN.evaluateData(data, samples)
+        points = values[0] if isinstance(values, list) else values[(0, 0)]
+        flat = points.reshape(-1, 3)
+        coords = coin.SoCoordinate3()
+        coords.point.setValues(0, len(flat), flat.tolist())
+        root.addChild(coords)
+        if points.ndim == 2:
+            lines = coin.SoLineSet()
+            lines.numVertices.setValue(len(points))
+            root.addChild(lines)
+        else:
+            # SoQuadMesh rows run along the second index
+            mesh = coin.SoQuadMesh()
+            mesh.verticesPerRow.setValue(points.shape[1])
+            mesh.verticesPerColumn.setValue(points.shape[0])
+            root.addChild(mesh)
+    return root
+
+
+def removeOverlay(key):
+    overlay = overlays.pop(key, None)
+    if overlay is None:
+        return
+    vobj, node, which = overlay
+    try:
+        vobj.RootNode.removeChild(node)
+        vobj.SwitchNode.whichChild = which
+    except Exception as err:  # the object was deleted meanwhile
+        log.debug("removeOverlay ", key, err)
+
+
+def preview(fp, datas):
+    # replaces the normal display of fp by a sampled mesh of datas. the full build is only postponed
+    samples = settings()[1]
+    key = (fp.Document.Name, fp.Name)
+    pending[key] = time.monotonic()
+    if not FreeCAD.GuiUp or fp.ViewObject is None:
+        return
+    vobj = fp.ViewObject
+    which = overlays[key][2] if key in overlays else vobj.SwitchNode.whichChild.getValue()
+    removeOverlay(key)
+    node = previewNode(datas, samples)
+    vobj.RootNode.addChild(node)
+    vobj.SwitchNode.whichChild = -1  # hide the stale shape, the preview stands in for it
+    overlays[key] = [vobj, node, which]
+    _startTimer()
+
+
+def _startTimer():
+    global _timer
+    if _timer is not None:
+        return
+    from PySide import QtCore
+
+    _timer = QtCore.QTimer()
+    _timer.timeout.connect(poll)
+    _timer.start(100)
+
+
+def _stopTimer():
+    global _timer
+    if _timer is not None:
+        _timer.stop()
+        _timer = None
+
+
+def poll():
+    # builds the pending objects of each document when its sketch edit ended, or went idle
+    idle = settings()[2]
+    now = time.monotonic()
+    for doc_name in set(key[0] for key in pending):
+        keys = [key for key in pending if key[0] == doc_name]
+        doc = FreeCAD.listDocuments().get(doc_name)
+        if doc is None:
+            for key in keys:
+                pending.pop(key, None)
+                removeOverlay(key)
+            continue
+        if not sketchInEdit(doc) or all(now - pending[key] >= idle for key in keys):
+            finish(doc, keys)
+    if not pending:
+        _stopTimer()
+
+
+def finish(doc, keys):
+    global _finishing
+    objects = []
+    for key in keys:
+        pending.pop(key, None)
+        removeOverlay(key)
+        obj = doc.getObject(key[1])
+        if obj is not None:
+            obj.touch()
+            objects.append(obj)
+    _finishing = True
+    try:
+        doc.recompute(objects)
+    finally:
+        _finishing = False
+    log.debug("full build of ", len(objects), " previewed objects in ", doc.Label)
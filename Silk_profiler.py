@@ -0,0 +1,227 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+## Recompute profiler for Silk objects.
+##
+## enable() installs wrappers around:
+##  - execute() of every ArachNURBS feature class: wall time per document object
+##  - the Section 1 functions of ArachNURBS: wall time per call
+##  - the Part constructors used by ArachNURBS: number of OCC curve / surface / line constructions
+##  - onChanged() of every feature class: number of property writes
+## and a profile hook counting calls of the OCC methods segment(), parameter(), insertKnot()...
+## disable() puts the original functions back. Nothing is wrapped while the profiler is off,
+## so it costs nothing when disabled.
+##
+## Collected events can be summarized (slowest objects first) or exported as Chrome trace json,
+## to be opened in chrome://tracing or https://ui.perfetto.dev
+
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+
+import ArachNURBS as AN
+
+# Part constructors counted inside ArachNURBS
+counted_constructors = ["BSplineSurface", "BSplineCurve", "LineSegment", "Line", "Circle", "Plane", "Point", "Shape"]
+# OCC methods counted through the profile hook
+counted_methods = ["segment", "parameter", "insertKnot", "insertKnots", "insertUKnot", "insertUKnots", "insertVKnot", "insertVKnots"]
+# Section 1 functions called far too often to be worth a trace event each. they are only counted
+count_only = ["equalVectors", "VectorIndex", "lineOrPoint", "ClosestPointOnLine"]
+
+enabled = False
+events = []  # [name, category, thread id, start (s), duration (s), counters dict]
+_lock = threading.Lock()
+_local = threading.local()
+_patches = []  # (owner, attribute name, original)
+_t0 = 0.0
+
+
+def _frames():
+    if not hasattr(_local, "frames"):
+        _local.frames = []
+    return _local.frames
+
+
+def _count(key, n=1):
+    # attribute the count to every open frame, so a surface build shows up in its execute() too
+    for frame in _frames():
+        frame[key] = frame.get(key, 0) + n
+
+
+def _open(name, category):
+    frame = {}
+    _frames().append(frame)
+    return [name, category, threading.get_ident(), time.perf_counter(), 0.0, frame]
+
+
+def _close(event):
+    event[4] = time.perf_counter() - event[3]
+    _frames().pop()
+    with _lock:
+        events.append(event)
+
+
+def _wrapExecute(cls, original):
+    def execute(self, fp):
+        event = _open(fp.Name, "execute")
+        event[5]["class"] = cls.__name__
+        event[5]["label"] = fp.Label
+        try:
+            return original(self, fp)
+        finally:
+            _close(event)
+
+    return execute
+
+
+def _wrapOnChanged(original):
+    def onChanged(self, fp, prop):
+        _count("property writes")
+        return original(self, fp, prop)
+
+    return onChanged
+
+
+def _wrapFunction(name, original):
+    if name in count_only:
+
+        def counted(*args, **kwargs):
+            _count(name)
+            return original(*args, **kwargs)
+
+        return counted
+
+    def traced(*args, **kwargs):
+        event = _open(name, "section1")
+        try:
+            return original(*args, **kwargs)
+        finally:
+            _close(event)
+
+    return traced
+
+
+class _CountingPart:
+    # stands in for the Part module inside ArachNURBS while profiling
+    def __init__(self, part):
+        self._part = part
+
+    def __getattr__(self, name):
+        value = getattr(self._part, name)
+        if name in counted_constructors:
+
+            def construct(*args, **kwargs):
+                _count("Part." + name)
+                return value(*args, **kwargs)
+
+            return construct
+        return value
+
+
+def _profileHook(frame, event, arg):
+    if event == "c_call" and getattr(arg, "__name__", None) in counted_methods:
+        _count(arg.__name__ + "()")
+
+
+def _patch(owner, name, replacement):
+    _patches.append((owner, name, getattr(owner, name)))
+    setattr(owner, name, replacement)
+
+
+def _patchItem(table, key, replacement):
+    _patches.append((table, key, table[key]))
+    table[key] = replacement
+
+
+def enable():
+    global enabled, _t0
+    if enabled:
+        return
+    for name, value in list(vars(AN).items()):
+        if inspect.isclass(value) and value.__module__ == AN.__name__:
+            if "execute" in vars(value):
+                _patch(value, "execute", _wrapExecute(value, vars(value)["execute"]))
+            if "onChanged" in vars(value):
+                _patch(value, "onChanged", _wrapOnChanged(vars(value)["onChanged"]))
+        elif inspect.isfunction(value) and value.__module__ == AN.__name__:
+            _patch(AN, name, _wrapFunction(name, value))
+    # the builder table holds its own references to the Section 1 builders
+    for name in list(AN.shape_builders):
+        _patchItem(AN.shape_builders, name, getattr(AN, name))
+    _patch(AN, "Part", _CountingPart(AN.Part))
+    sys.setprofile(_profileHook)
+    threading.setprofile(_profileHook)
+    _t0 = time.perf_counter()
+    enabled = True
+
+
+def disable():
+    global enabled
+    if not enabled:
+        return
+    sys.setprofile(None)
+    threading.setprofile(None)
+    while _patches:
+        owner, name, original = _patches.pop()
+        if isinstance(owner, dict):
+            owner[name] = original
+        else:
+            setattr(owner, name, original)
+    enabled = False
+
+
+def reset():
+    with _lock:
+        del events[:]
+
+
+def objectStats():
+    # per document object: number of executes, total and max time, summed counters
+    stats = {}
+    for name, category, tid, start, duration, counters in events:
+        if category != "execute":
+            continue
+        s = stats.setdefault(name, {"name": name, "label": counters.get("label", ""), "class": counters.get("class", ""), "calls": 0, "total": 0.0, "max": 0.0, "counters": {}})
+        s["calls"] += 1
+        s["total"] += duration
+        s["max"] = max(s["max"], duration)
+        for key, value in counters.items():
+            if isinstance(value, int):
+                s["counters"][key] = s["counters"].get(key, 0) + value
+    return sorted(stats.values(), key=lambda s: s["total"], reverse=True)
+
+
+def summary(count=20):
+    lines = ["%-28s %-28s %6s %10s %10s  %s" % ("object", "class", "calls", "total ms", "max ms", "counters")]
+    for s in objectStats()[:count]:
+        counters = ", ".join("%s %d" % item for item in sorted(s["counters"].items()))
+        lines.append("%-28s %-28s %6d %10.2f %10.2f  %s" % (s["label"][:28], s["class"][:28], s["calls"], s["total"] * 1000, s["max"] * 1000, counters))
+    return "\n".join(lines)
+
+
+def exportChromeTrace(path):
+    trace = []
+    for name, category, tid, start, duration, counters in events:
+        trace.append({"name": name, "cat": category, "ph": "X", "pid": os.getpid(), "tid": tid, "ts": (start - _t0) * 1e6, "dur": duration * 1e6, "args": counters})
+    with open(path, "w") as f:
+        json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+    return len(trace)
@@ -0,0 +1,225 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+## Parallel recompute scheduler for Silk objects.
+##
+## A typical model is made of many independent sketch -> poly -> grid -> surface chains, which only meet
+## at blend grids. FreeCAD recomputes all of them one after the other on the GUI thread.
+## This scheduler sorts the objects that need a recompute into dependency levels: all objects in one level
+## are independent of each other. Each level is then processed in three stages:
+##   1. gather (main thread): every Silk proxy that provides gatherInputs() returns its inputs as plain data.
+##      all other objects (sketches, polys, grids...) are simply recomputed in place, in order.
+##   2. build (worker pool): the pure data is turned into OCC shapes with ArachNURBS.buildShapeFromData().
+##   3. commit (main thread): the shapes are written back with the proxy's commitOutputs(), along with the
+##      gathered data, so nothing is read from the document twice.
+## Document objects are only ever touched from the main thread.
+##
+## 'serial' mode, the default, runs the builds one after the other on the main thread, with no pool.
+## 'thread' mode shares the OCC builds between threads of the FreeCAD process. The Part bindings hold the GIL,
+## so threads do not build faster than serial; the mode is kept as an opt-in.
+## 'process' mode sends the pure data to worker python processes, and brings the shapes back as BREP strings.
+## It is the mode that scales with the cores, and needs a python interpreter able to 'import Part'
+## (the one shipped next to the FreeCAD binary is used).
+
+import os
+import sys
+import concurrent.futures
+import multiprocessing
+
+import FreeCAD
+import Part
+
+import ArachNURBS as AN
+import Silk_log
+
+log = Silk_log.getLogger("scheduler")
+
+# user settings, in Tools -> Edit parameters -> Preferences/Mod/Silk
+param_path = "User parameter:BaseApp/Preferences/Mod/Silk"
+
+
+def settings():
+    params = FreeCAD.ParamGet(param_path)
+    mode = params.GetString("RecomputeMode", "serial")
+    workers = params.GetInt("RecomputeWorkers", 0)
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return mode, workers
+
+
+def isSilkObject(obj):
+    proxy = getattr(obj, "Proxy", None)
+    return proxy is not None and type(proxy).__module__ == AN.__name__
+
+
+def isParallel(obj):  # the proxy can hand its inputs over as plain data
+    return isSilkObject(obj) and hasattr(obj.Proxy, "gatherInputs") and hasattr(obj.Proxy, "commitOutputs")
+
+
+def dirtyObjects(doc):
+    # everything touched, and everything downstream of something touched
+    dirty = set()
+    for obj in doc.Objects:
+        if obj.isTouched() or "Touched" in obj.State:
+            dirty.add(obj)
+            dirty.update(obj.InListRecursive)
+    return list(dirty)
+
+
+def dependencyLevels(objs):
+    # Kahn sort of objs by their links. objects within one level do not depend on each other
+    pending = set(objs)
+    order = {obj: i for i, obj in enumerate(objs[0].Document.Objects)} if objs else {}
+    deps = {obj: set(o for o in obj.OutList if o in pending and o is not obj) for obj in objs}
+    levels = []
+    while pending:
+        level = [obj for obj in pending if not deps[obj] & pending]
+        if not level:
+            # cyclic links. FreeCAD would refuse them anyway, hand the rest over in one serial level
+            log.warning("cyclic dependency found, remaining objects recomputed serially")
+            levels.append([(obj, False) for obj in pending])
+            break
+        # keep the document order inside a level, so serial fallbacks behave like a normal recompute
+        level.sort(key=lambda obj: order.get(obj, 0))
+        levels.append([(obj, True) for obj in level])
+        pending.difference_update(level)
+    return levels
+
+
+def branches(objs):
+    # connected components of the Silk link graph: the independent chains of the model.
+    # only used for reporting, the levels above already run independent branches side by side
+    pending = set(objs)
+    result = []
+    while pending:
+        stack = [pending.pop()]
+        branch = []
+        while stack:
+            obj = stack.pop()
+            branch.append(obj)
+            for o in obj.OutList + obj.InList:
+                if o in pending:
+                    pending.discard(o)
+                    stack.append(o)
+        result.append(branch)
+    return result
+
+
+def _pythonExecutable():
+    # FreeCAD's sys.executable is FreeCAD itself. multiprocessing needs a plain interpreter
+    if os.path.basename(sys.executable).lower().startswith("python"):
+        return sys.executable
+    bin_dir = os.path.dirname(sys.executable)
+    for name in ("python3", "python", "python.exe"):
+        candidate = os.path.join(bin_dir, name)
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def _initWorker(paths):
+    sys.path[:0] = [p for p in paths if p not in sys.path]
+
+
+def _buildBrep(data):  # runs in a worker process
+    return AN.buildShapeFromData(data).exportBrepToString()
+
+
+def _shapeFromBrep(brep):
+    shape = Part.Shape()
+    shape.importBrepFromString(brep)
+    return shape
+
+
+class SerialPool:
+    # 'serial' mode: each build runs on the calling thread, when it is submitted
+    def submit(self, fn, *args):
+        future = concurrent.futures.Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as err:
+            future.set_exception(err)
+        return future
+
+    def shutdown(self, wait=True):
+        pass
+
+
+def makePool(mode, workers):
+    if mode == "thread":
+        return concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    if mode == "process":
+        python = _pythonExecutable()
+        if python is not None:
+            context = multiprocessing.get_context("spawn")
+            context.set_executable(python)
+            return concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_initWorker, initargs=(list(sys.path),))
+        log.warning("no python interpreter found next to FreeCAD, building serially")
+    return SerialPool()
+
+
+def recompute(doc=None, mode=None, workers=None):
+    """Recompute the touched objects of doc, building Silk curves and surfaces on a worker pool.
+    Returns the number of objects recomputed."""
+    if doc is None:
+        doc = FreeCAD.ActiveDocument
+    if doc is None:
+        return 0
+    default_mode, default_workers = settings()
+    mode = mode or default_mode
+    workers = workers or default_workers
+
+    objs = dirtyObjects(doc)
+    if not objs:
+        return 0
+    log.info("%d objects in %d independent branches, %s mode, %d workers" % (len(objs), len(branches(objs)), mode, workers))
+
+    count = 0
+    pool = makePool(mode, workers)
+    build = _buildBrep if isinstance(pool, concurrent.futures.ProcessPoolExecutor) else AN.buildShapeFromData
+    try:
+        for level in dependencyLevels(objs):
+            # stage 1: gather, or recompute serially if the object has no pure data form
+            jobs = []
+            for obj, parallel in level:
+                if parallel and isParallel(obj) and "Restore" not in obj.State:
+                    try:
+                        data = obj.Proxy.gatherInputs(obj)
+                        jobs.append((obj, data, pool.submit(build, data)))
+                        continue
+                    except Exception as err:
+                        log.warning("%s could not gather its inputs (%s), recomputed serially" % (obj.Name, err))
+                obj.recompute()
+                count += 1
+            # stage 3: commit, in submission order
+            for obj, data, future in jobs:
+                try:
+                    shape = future.result()
+                    if build is _buildBrep:
+                        shape = _shapeFromBrep(shape)
+                    obj.Proxy.commitOutputs(obj, shape, data)
+                    obj.purgeTouched()
+                except Exception as err:
+                    # let the regular execute() run, so the object reports its error the usual way
+                    log.warning("parallel build of %s failed (%s), recomputed serially" % (obj.Name, err))
+                    obj.recompute()
+                count += 1
+    finally:
+        pool.shutdown(wait=True)
+    return count
@@ -210,6 +210,9 @@ Point_onCurve_moreInfo = (
     "Often, two curves we wish to split 'in the same manner' have their orientation reversed to each other. In those cases, set u of \n"
     "the 'next' curve to 1-u (eg. .90 and .10) of the 'previous' curve in order to cut them in the 'same' place.\n"
     "\n"
+    "With 'arc_length' set, u is a fraction of the curve length instead: u = 0.5 is the point halfway along the curve, whatever \n"
+    "the spacing of the control points. The 'Parameter' output shows the curve parameter this gives. \n"
+    "\n"
     "FreeCAD's expression engine allows us to easily connect one cut value to another existing cut value. Then you only need to \n"
     "edit one, and all others follow it automatically.\n"
     "\n"
@@ -225,6 +228,37 @@ Point_onCurve_moreInfo = (
     "control-V (paste), then type '.u', confirm by clicking 'u' in the drop down, hit 'enter'. This works all over FreeCAD. \n"
 	)
 			
+PointArray_onCurve_baseTip = (
+    "Create many points on a Cubic_Curve4 or Cubic_Curve6 in a single object (also works on some curves outside of Silk).\n"
+    "______________________________________________________________________________________________________________________________________ \n"
+	"Usage \n"
+    "\n"
+	"Preselect the following: \n"
+	" • a curve. Points picked on it in the 3D view give the initial parameters, otherwise 5 evenly spaced points are made. \n"
+	"Apply the function \n"
+	"\n"
+    "A PointArray_onCurve object is placed on the curve. \n"
+    "\n"
+	"Used as input for: \n"
+	"• Start point and end point of ControlPoly4_Segment: select the points in the 3D view, or set index_0 / index_1 \n"
+	"• SilkPose position and axis references: each point is a vertex of the object (Vertex1 is the first point) \n"
+	)
+            
+PointArray_onCurve_moreInfo = (
+    "______________________________________________________________________________________________________________________________________ \n"
+    "More Info \n"
+    "\n"
+    "'spacing' chooses how the parameters are given: \n"
+    " • list: the parameters of 'u_list', in the given order, each from 0.0 to 1.0 \n"
+    " • uniform: 'count' parameters evenly spaced from 'u_start' to 'u_end' \n"
+    "'reverse' measures all parameters from the other end of the curve, as in Point_onCurve. \n"
+    "'arc_length' makes all parameters fractions of the curve length, as in Point_onCurve: uniform spacing then gives points \n"
+    "at equal distances along the curve. \n"
+    "\n"
+    "All points are computed in one pass, so one PointArray_onCurve is much lighter than as many Point_onCurve objects. The \n"
+    "computed parameters and positions are listed under the outputs, in the order of the vertices. \n"
+	)
+
 ControlPoly4_segment_baseTip = (
 	"Create a ControlPoly4 for a segment of a Cubic_Curve_4, between two points on the curve. \n"
     "______________________________________________________________________________________________________________________________________ \n"
@@ -264,6 +298,106 @@ ControlPoly4_segment_moreInfo = (
     "blends that come out decent even before tuning. \n"
 	)
 
+CurvatureComb_baseTip = (
+	"Draw the curvature comb of a Cubic_Curve_4, a Cubic_Curve_6, or a 4 or 6 pole poly such as a blend poly. \n"
+    "______________________________________________________________________________________________________________________________________ \n"
+	"Usage \n"
+    "\n"
+    "Preselect one or more curves or polys, apply the function. One comb is made for each. \n"
+    "\n"
+	"Used for: \n"
+	"• tuning the scales of ControlPoly6_FilletBezier and of the blend grids: watch the comb instead of the shading \n"
+	)
+
+CurvatureComb_moreInfo = (
+	"______________________________________________________________________________________________________________________________________ \n"
+    "More Info \n"
+    "\n"
+    "Each tooth is drawn at a sample of the curve, away from the center of curvature, and its length is the curvature times \n"
+    "'scale'. The line through the tooth tips shows how the curvature flows: a G2 join has no step in it, a G3 join no kink. \n"
+    "'plot' switches to the derivative of the curvature along the curve (dC/ds), which is what the G3 tools tune. \n"
+    "'samples' sets the number of teeth. While a sketch is dragged, a coarser comb is drawn. \n"
+    "\n"
+    "Curvature is signed in the plane that best fits the poles, so teeth flip side where the curve has an inflection. The values \n"
+    "of every tooth are listed under the outputs, with the largest absolute curvature. \n"
+	)
+
+ControlGrid_Offset_baseTip = (
+	"Create an approximate offset of a CubicSurface_44, CubicSurface_64 or CubicSurface_66, as a grid of the same type and its surface. \n"
+    "______________________________________________________________________________________________________________________________________ \n"
+	"Usage \n"
+    "\n"
+    "Preselect one or more CubicSurfaces, apply the function. A ControlGrid_Offset and a CubicSurface are made for each. \n"
+    "Set 'distance' on the grid, negative to offset to the other side. \n"
+    "\n"
+	"Used for: \n"
+	"• shell thickness (composite layups, plating) without OCC offsets \n"
+	)
+
+ControlGrid_Offset_moreInfo = (
+	"______________________________________________________________________________________________________________________________________ \n"
+    "More Info \n"
+    "\n"
+    "The offset of a cubic surface is not a cubic surface, so the grid is fitted: 'samples' x 'samples' offset points, taken along \n"
+    "the displayed normal of the source surface, are matched by least squares. The weights of the source grid are kept. \n"
+    "'MaxError' is the largest distance between the fitted surface and the true offset, checked between the samples too. \n"
+    "\n"
+    "Corners are exact, and each border row is fitted from its own border only. Neighbouring surfaces that are G1 along a shared \n"
+    "border, with normals on the same side, therefore keep a shared border after the offset. \n"
+	)
+
+Isophotes_baseTip = (
+	"Draw isophotes, the borders of zebra stripes, on Silk surfaces. \n"
+    "______________________________________________________________________________________________________________________________________ \n"
+	"Usage \n"
+    "\n"
+    "Preselect one or more Silk surfaces (CubicSurface_44 / 64 / 66, N-Star surfaces), apply the function. \n"
+    "The light starts along the current view direction. \n"
+    "\n"
+	"Used for: \n"
+	"• checking G1 and G2 across seams: stripes are kinked at a G1 seam, and continuous but kinked in their own curvature at a G2 seam \n"
+	)
+
+Isophotes_moreInfo = (
+	"______________________________________________________________________________________________________________________________________ \n"
+    "More Info \n"
+    "\n"
+    "Each stripe border joins the points where the surface normal is at one angle from 'light'. 'bands' stripes span 0 to 90 \n"
+    "degrees, so their borders are 90 / bands degrees apart. Which side the normals point to does not matter. \n"
+    "\n"
+    "The normals are sampled on a 'samples' x 'samples' grid per surface and kept until the surface changes, so changing \n"
+    "'light' or 'bands' is quick. While a sketch is dragged, a coarser grid is used. Hide the object to turn the stripes off. \n"
+	)
+
+ControlPoly4_segments_baseTip = (
+	"Cut a Cubic_Curve_4 into several ControlPoly4 pieces at once. \n"
+    "______________________________________________________________________________________________________________________________________ \n"
+	"Usage \n"
+    "\n"
+    "Preselect the following sequence: \n"
+    " • a Cubic_Curve_4 first \n"
+    " • any number of Point_onCurve / PointArray_onCurve objects on the curve to cut at \n"
+    "   (or no point object: points picked on the curve give the cuts, or the curve is cut in half) \n"
+	"Apply the function \n"
+	"\n"
+    "Then preselect the ControlPoly4_segments object alone, and apply the function again to get one ControlPoly4_piece per piece. \n"
+    "\n"
+	"Used as input for: \n"
+	"• through its ControlPoly4_piece objects, everything a ControlPoly4 is used for: curves, grids \n"
+	)
+
+ControlPoly4_segments_moreInfo = (
+	"______________________________________________________________________________________________________________________________________ \n"
+    "More Info \n"
+    "\n"
+    "This does the work of one ControlPoly4_segment per piece in a single object: the curve is cut once at all the cuts, and the \n"
+    "pieces are held end to end in Poles and Weights. Cuts can be given by point objects ('cut_points'), by parameters ('u_cuts', \n"
+    "fractions of the curve length with 'arc_length' set), or both. 'Cuts' and 'Pieces' show the result. \n"
+    "\n"
+    "Each ControlPoly4_piece only copies its four poles from the ControlPoly4_segments, so moving a cut updates all pieces at the \n"
+    "cost of a single cut. Cubic_Curve_6 can be cut too, as long as every piece stays within one knot span (cut at 1/3 and 2/3). \n"
+	)
+
 ControlGrid44_baseTip = (
 	"Create a ControlGrid44 from four connected ControlPoly4 edges. \n"
     "______________________________________________________________________________________________________________________________________ \n"
@@ -451,6 +585,32 @@ CubicSurface_44_moreInfo = (
     "'fed in' to functions.\n"
     )
 
+CubicSurface44_4Sketch_baseTip = (
+    "Create a CubicSurface_44 straight from 4 sketches, without the intermediate polys and grid objects. \n"
+    "______________________________________________________________________________________________________________________________________ \n"
+    "Usage \n"
+    "\n"
+    "Prepare the following selection: \n"
+    " • 4 sketches, going around the patch. Each sketch is read like ControlPoly4 reads a single sketch: \n"
+    "   3 lines connected end to end, or else its first element \n"
+    "Apply the function \n"
+    "\n"
+    "Gives the same surface as ControlPoly4 x4 -> ControlGrid44 -> CubicSurface_44, in a single object that recomputes in one \n"
+    "step. Use it for the many plain patches of a large model, and the separate objects where the polys or the grid are edited. \n"
+    "\n"
+    "Set expose_intermediates to also output the grid (Poles, Weights) and the polys (PolyPoles, PolyWeights), for example to \n"
+    "blend the patch with ControlGrid64_2Grid44. \n"
+    )
+
+CubicSurface44_4Sketch_moreInfo = (
+    "______________________________________________________________________________________________________________________________________ \n"
+    "More Info \n"
+    "\n"
+    "Every object in a FreeCAD document has its own properties, recompute call and change notifications. A basic patch made the \n"
+    "usual way is 6 objects: on large models most of the recompute time goes to that overhead, not to the geometry. \n"
+    "Here the polys and the grid only exist in memory while the object recomputes. \n"
+    )
+
 ControlGrid44_EdgeSegment_baseTip = (
     "Create a ControlGrid44 from a CubicSurface44 and one CubicCurve4 segment. \n"
 	"______________________________________________________________________________________________________________________________________ \n"
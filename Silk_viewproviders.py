@@ -0,0 +1,116 @@
+#    This file is part of Silk
+#    (c) Edward Mills 2016-2026
+#    edwardvmills@gmail.com
+#
+#    NURBS Surface modeling tools focused on low degree and seam continuity (FreeCAD Workbench)
+#
+#    Silk is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+## View providers for Silk objects.
+##
+## ViewProviderControlNet draws the control net of a poly or a grid straight from its Poles property:
+## one coordinate node, one indexed line set for the legs, one point set for the poles.
+## When the poles change, the coordinates are overwritten in place; the line index is only rebuilt
+## when the number of poles changes. No Part geometry or TopoDS edge is needed to draw the net,
+## so objects using this view provider only keep one vertex per pole in their Shape (see AN.controlNetShape()).
+## Picking a pole selects the matching "VertexN" of that Shape.
+##
+## The usual LineColor, LineWidth, PointColor and PointSize view properties apply.
+
+import ArachNURBS as AN
+
+
+class ViewProviderControlNet:
+    def __init__(self, vobj):
+        vobj.Proxy = self
+
+    def attach(self, vobj):
+        from pivy import coin
+
+        self.Object = vobj.Object
+        self.coords = coin.SoCoordinate3()
+        self.line_color = coin.SoBaseColor()
+        self.line_style = coin.SoDrawStyle()
+        self.lines = coin.SoIndexedLineSet()
+        self.point_color = coin.SoBaseColor()
+        self.point_style = coin.SoDrawStyle()
+        self.points = coin.SoPointSet()
+        self.layout = None  # (number of poles, columns) the line index was built for
+
+        net = coin.SoSeparator()
+        net.addChild(self.coords)
+        legs = coin.SoSeparator()
+        legs.addChild(self.line_color)
+        legs.addChild(self.line_style)
+        legs.addChild(self.lines)
+        net.addChild(legs)
+        poles = coin.SoSeparator()
+        poles.addChild(self.point_color)
+        poles.addChild(self.point_style)
+        poles.addChild(self.points)
+        net.addChild(poles)
+        vobj.addDisplayMode(net, "ControlNet")
+
+        for prop in ["LineColor", "LineWidth", "PointColor", "PointSize"]:
+            self.onChanged(vobj, prop)
+        self.updateData(vobj.Object, "Poles")
+
+    def getDisplayModes(self, vobj):
+        return ["ControlNet"]
+
+    def getDefaultDisplayMode(self):
+        return "ControlNet"
+
+    def setDisplayMode(self, mode):
+        return mode
+
+    def updateData(self, fp, prop):
+        if prop != "Poles" or not hasattr(self, "coords") or not hasattr(fp, "Poles"):
+            return
+        poles = fp.Poles
+        self.coords.point.setNum(len(poles))
+        self.coords.point.setValues(0, len(poles), [[p.x, p.y, p.z] for p in poles])
+        layout = (len(poles), AN.netColumns(fp))
+        if layout != self.layout:
+            index = AN.controlNetIndex(*layout)
+            self.lines.coordIndex.setNum(len(index))
+            self.lines.coordIndex.setValues(0, len(index), index)
+            self.layout = layout
+
+    def getElementPicked(self, pp):
+        # a picked pole is Poles[i], i.e. "Vertex<i+1>" of the Shape. a picked leg selects the whole object
+        from pivy import coin
+
+        detail = pp.getDetail()
+        if detail is not None and detail.isOfType(coin.SoPointDetail.getClassTypeId()):
+            return "Vertex%d" % (coin.cast(detail, "SoPointDetail").getCoordinateIndex() + 1)
+        return ""
+
+    def onChanged(self, vobj, prop):
+        if not hasattr(self, "coords") or not hasattr(vobj, prop):
+            return
+        if prop == "LineColor":
+            self.line_color.rgb.setValue(*vobj.LineColor[:3])
+        elif prop == "LineWidth":
+            self.line_style.lineWidth = vobj.LineWidth
+        elif prop == "PointColor":
+            self.point_color.rgb.setValue(*vobj.PointColor[:3])
+        elif prop == "PointSize":
+            self.point_style.pointSize = vobj.PointSize
+
+    def __getstate__(self):
+        return None
+
+    def __setstate__(self, state):
+        return None
@@ -23,6 +23,7 @@ import FreeCAD, Part, math
 from FreeCAD import Base
 from FreeCAD import Gui
 import ArachNURBS as AN
+import Silk_viewproviders
 
 # Locate Workbench Directory
 import os, Silk_dummy
@@ -38,7 +39,7 @@ class SubGrid33_2Grid64():
 
 		a=FreeCAD.ActiveDocument.addObject("Part::FeaturePython","SubGrid33_2Grid64")
 		AN.SubGrid33_2Grid64(a,Grid_a,Grid_b)
-		a.ViewObject.Proxy=0 # just set it to something different from None (this assignment is needed to run an internal notification)
+		Silk_viewproviders.ViewProviderControlNet(a.ViewObject)  # draws the control net straight from Poles
 		a.ViewObject.LineWidth = 1.00
 		a.ViewObject.LineColor = (0.67,1.00,1.00)
 		a.ViewObject.PointSize = 4.00